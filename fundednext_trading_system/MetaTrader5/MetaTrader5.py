@@ -1,69 +1,657 @@
 # Mock MetaTrader5 module
-import pandas as pd
+#
+# In-process broker simulator behind the MetaTrader5 API, for development
+# and load testing on machines without a terminal.
+#
+# Prices follow a seeded random walk per symbol (M1 bars, bid prices), so
+# candles, ticks and fills are reproducible for a given seed, start time
+# and call sequence. The simulator keeps positions, deal history, balance
+# and equity; it fills market orders with spread and slippage, triggers
+# SL/TP from the bar path, supports partial closes and can sleep a
+# configurable latency per API call.
+#
+# The module-level functions delegate to a default BrokerSimulator;
+# configure(...) replaces it (e.g. configure(seed=7, latency=0.02)).
+import threading
+import time
+import zlib
+from collections import namedtuple
+from datetime import datetime, timezone
+
 import numpy as np
 
-def initialize():
+# =========================
+# CONSTANTS
+# =========================
+TIMEFRAME_M1 = 1
+TIMEFRAME_M5 = 5
+TIMEFRAME_M15 = 15
+TIMEFRAME_M30 = 30
+TIMEFRAME_H1 = 16385
+TIMEFRAME_H4 = 16388
+TIMEFRAME_D1 = 16408
+
+_TIMEFRAME_SECONDS = {
+    TIMEFRAME_M1: 60,
+    TIMEFRAME_M5: 300,
+    TIMEFRAME_M15: 900,
+    TIMEFRAME_M30: 1800,
+    TIMEFRAME_H1: 3600,
+    TIMEFRAME_H4: 14400,
+    TIMEFRAME_D1: 86400,
+}
+
+SYMBOL_TRADE_MODE_FULL = 4
+
+ORDER_TYPE_BUY = 0
+ORDER_TYPE_SELL = 1
+POSITION_TYPE_BUY = 0
+POSITION_TYPE_SELL = 1
+DEAL_TYPE_BUY = 0
+DEAL_TYPE_SELL = 1
+DEAL_ENTRY_IN = 0
+DEAL_ENTRY_OUT = 1
+DEAL_REASON_EXPERT = 3
+DEAL_REASON_SL = 4
+DEAL_REASON_TP = 5
+
+TRADE_ACTION_DEAL = 1
+TRADE_ACTION_SLTP = 6
+
+ORDER_TIME_GTC = 0
+ORDER_FILLING_FOK = 0
+ORDER_FILLING_IOC = 1
+
+TRADE_RETCODE_REQUOTE = 10004
+TRADE_RETCODE_DONE = 10009
+TRADE_RETCODE_INVALID = 10013
+TRADE_RETCODE_INVALID_VOLUME = 10014
+TRADE_RETCODE_INVALID_STOPS = 10016
+TRADE_RETCODE_NO_MONEY = 10019
+TRADE_RETCODE_POSITION_CLOSED = 10036
+
+# Same record layout the real terminal returns from copy_rates_*
+RATES_DTYPE = np.dtype([
+    ('time', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('tick_volume', '<u8'),
+    ('spread', '<i4'),
+    ('real_volume', '<u8'),
+])
+
+DEFAULT_SYMBOLS = ("EURUSD", "GBPUSD", "USDJPY", "XAUUSD", "US30", "NDX100")
+
+# =========================
+# RESULT TYPES (namedtuples, like the real package)
+# =========================
+AccountInfo = namedtuple("AccountInfo", [
+    "login", "server", "currency", "leverage", "balance", "equity",
+    "profit", "margin", "margin_free", "margin_level",
+])
+SymbolInfo = namedtuple("SymbolInfo", [
+    "name", "point", "digits", "spread", "visible", "select", "trade_mode",
+    "trade_contract_size", "trade_tick_size", "trade_tick_value",
+    "volume_min", "volume_max", "volume_step", "bid", "ask", "session_deals",
+])
+Tick = namedtuple("Tick", ["time", "bid", "ask", "last", "volume", "time_msc"])
+TradePosition = namedtuple("TradePosition", [
+    "ticket", "time", "type", "magic", "identifier", "volume", "price_open",
+    "sl", "tp", "price_current", "swap", "profit", "symbol", "comment",
+])
+TradeDeal = namedtuple("TradeDeal", [
+    "ticket", "order", "time", "time_msc", "type", "entry", "magic",
+    "position_id", "reason", "volume", "price", "commission", "swap",
+    "profit", "symbol", "comment",
+])
+OrderSendResult = namedtuple("OrderSendResult", [
+    "retcode", "deal", "order", "volume", "price", "bid", "ask",
+    "comment", "request_id", "request",
+])
+
+
+def _symbol_spec(symbol):
+    """(digits, contract size, starting price) guessed from the symbol name."""
+    if symbol.startswith("XAU"):
+        return 2, 100.0, 2000.0
+    if not symbol.isalpha():          # indices: US30, NDX100, ...
+        return 2, 1.0, 20000.0
+    if symbol.endswith("JPY"):
+        return 3, 100_000.0, 150.0
+    return 5, 100_000.0, 1.1
+
+
+def _to_account(symbol, amount, price):
+    """Converts an amount in the symbol's quote currency to USD."""
+    if len(symbol) == 6 and symbol.isalpha() and symbol.startswith("USD"):
+        return amount / price
+    return amount
+
+
+def _epoch(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+# =========================
+# PRICE PATH
+# =========================
+class _PricePath:
+    """
+    Seeded M1 random walk for one symbol, generated lazily in fixed-size
+    blocks so the path does not depend on how it is queried.
+    """
+
+    BLOCK = 1440
+
+    def __init__(self, seed, symbol, start_time, spread_points, volatility):
+        self.symbol = symbol
+        self.digits, self.contract_size, price = _symbol_spec(symbol)
+        self.point = 10.0 ** -self.digits
+        self.spread_points = spread_points
+        self.volatility = volatility
+        self.start_time = start_time
+        self._rng = np.random.default_rng([seed, zlib.crc32(symbol.encode())])
+        self._last_close = price
+        self.bars = np.zeros(0, dtype=RATES_DTYPE)
+
+    def index_at(self, now):
+        return max(0, int(now - self.start_time) // 60)
+
+    def ensure(self, index):
+        while len(self.bars) <= index:
+            self._extend()
+
+    def _extend(self):
+        n, rng, vol = self.BLOCK, self._rng, self.volatility
+        closes = self._last_close * np.exp(np.cumsum(rng.normal(0.0, vol, n)))
+        opens = np.concatenate(([self._last_close], closes[:-1]))
+        wicks = np.abs(rng.normal(0.0, vol / 2, (2, n))) * opens
+
+        block = np.zeros(n, dtype=RATES_DTYPE)
+        block["time"] = self.start_time + 60 * (len(self.bars) + np.arange(n))
+        block["open"] = np.round(opens, self.digits)
+        block["close"] = np.round(closes, self.digits)
+        block["high"] = np.round(np.maximum(opens, closes) + wicks[0], self.digits)
+        block["low"] = np.round(np.minimum(opens, closes) - wicks[1], self.digits)
+        block["tick_volume"] = rng.integers(50, 500, n)
+        block["spread"] = self.spread_points
+        self._last_close = closes[-1]
+        self.bars = np.concatenate([self.bars, block])
+
+    def bid_at(self, now):
+        """Bid inside the forming bar, interpolated from its open to its close."""
+        index = self.index_at(now)
+        self.ensure(index)
+        bar = self.bars[index]
+        frac = min(max((now - bar["time"]) / 60.0, 0.0), 1.0)
+        return round(float(bar["open"] + (bar["close"] - bar["open"]) * frac), self.digits)
+
+    def rates(self, now, start_pos, count, period):
+        """copy_rates_from_pos for `period`; the newest bar is still forming."""
+        index = self.index_at(now)
+        self.ensure(index)
+        newest = int(self.bars["time"][index]) // period * period
+        first_m1 = self.index_at(newest - (start_pos + count - 1) * period)
+
+        m1 = self.bars[first_m1:index + 1].copy()
+        if len(m1) == 0:
+            return m1
+        bid = self.bid_at(now)
+        m1[-1]["close"] = bid
+        m1[-1]["high"] = max(m1[-1]["open"], bid)
+        m1[-1]["low"] = min(m1[-1]["open"], bid)
+        if period > 60:
+            m1 = _aggregate(m1, period)
+        end = len(m1) - start_pos
+        return m1[max(0, end - count):max(0, end)]
+
+
+def _aggregate(rates, period):
+    buckets = rates["time"] // period * period
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    out = np.zeros(len(starts), dtype=RATES_DTYPE)
+    out["time"] = buckets[starts]
+    out["open"] = rates["open"][starts]
+    out["high"] = np.maximum.reduceat(rates["high"], starts)
+    out["low"] = np.minimum.reduceat(rates["low"], starts)
+    out["close"] = rates["close"][np.append(starts[1:], len(rates)) - 1]
+    out["tick_volume"] = np.add.reduceat(rates["tick_volume"], starts)
+    out["spread"] = np.minimum.reduceat(rates["spread"], starts)
+    return out
+
+
+# =========================
+# BROKER SIMULATOR
+# =========================
+class BrokerSimulator:
+    """
+    seed:             random walk and slippage seed
+    balance:          starting account balance (USD)
+    spread_points:    fixed spread in points
+    slippage_points:  maximum adverse slippage per fill, in points
+    commission_per_lot: USD charged per lot on every deal (entry and exit)
+    latency:          seconds slept per API call, or {function name: seconds}
+    volatility:       standard deviation of M1 log returns
+    history_bars:     M1 bars available before the start time
+    time_source:      callable returning epoch seconds (default time.time)
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        balance: float = 100_000.0,
+        leverage: int = 100,
+        spread_points: int = 10,
+        slippage_points: int = 0,
+        commission_per_lot: float = 0.0,
+        latency=0.0,
+        volatility: float = 0.0003,
+        history_bars: int = 10_000,
+        symbols=DEFAULT_SYMBOLS,
+        time_source=time.time,
+    ):
+        self.seed = seed
+        self.balance = float(balance)
+        self.leverage = leverage
+        self.spread_points = spread_points
+        self.slippage_points = slippage_points
+        self.commission_per_lot = commission_per_lot
+        self.latency = latency
+        self.volatility = volatility
+        self.symbols = list(symbols)
+        self.time_source = time_source
+
+        self._start_time = int(time_source()) // 60 * 60 - history_bars * 60
+        self._paths = {}
+        self._positions = {}         # ticket -> mutable position dict
+        self._deals = []
+        self._next_ticket = 1
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.RLock()
+        self.calls = {}
+
+    # -------------------------
+    # INTERNAL
+    # -------------------------
+    def _call(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        delay = self.latency.get(name, 0.0) if isinstance(self.latency, dict) else self.latency
+        if delay:
+            time.sleep(delay)
+
+    def _path(self, symbol):
+        path = self._paths.get(symbol)
+        if path is None:
+            path = _PricePath(self.seed, symbol, self._start_time, self.spread_points, self.volatility)
+            self._paths[symbol] = path
+        return path
+
+    def _quote(self, symbol, now):
+        path = self._path(symbol)
+        bid = path.bid_at(now)
+        return path, bid, round(bid + path.spread_points * path.point, path.digits)
+
+    def _ticket(self):
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        return ticket
+
+    def _position_profit(self, pos, bid, ask):
+        path = self._paths[pos["symbol"]]
+        if pos["type"] == POSITION_TYPE_BUY:
+            current, diff = bid, bid - pos["price_open"]
+        else:
+            current, diff = ask, pos["price_open"] - ask
+        return current, _to_account(pos["symbol"], diff * pos["volume"] * path.contract_size, current)
+
+    def _margin(self, symbol, volume, price):
+        path = self._path(symbol)
+        notional = volume * path.contract_size
+        if symbol.startswith("USD"):
+            return notional / self.leverage
+        return _to_account(symbol, notional * price, price) / self.leverage
+
+    def _exposure(self, now):
+        """(floating profit, used margin) over all open positions."""
+        profit = margin = 0.0
+        for pos in self._positions.values():
+            _, bid, ask = self._quote(pos["symbol"], now)
+            price, pnl = self._position_profit(pos, bid, ask)
+            profit += pnl
+            margin += self._margin(pos["symbol"], pos["volume"], price)
+        return profit, margin
+
+    def _record_deal(self, pos, volume, price, entry, reason, now, profit=0.0, comment=""):
+        commission = -self.commission_per_lot * volume
+        self.balance += profit + commission
+        if entry == DEAL_ENTRY_IN:
+            deal_type = DEAL_TYPE_BUY if pos["type"] == POSITION_TYPE_BUY else DEAL_TYPE_SELL
+        else:
+            deal_type = DEAL_TYPE_SELL if pos["type"] == POSITION_TYPE_BUY else DEAL_TYPE_BUY
+        deal = TradeDeal(
+            ticket=self._ticket(), order=self._ticket(), time=int(now), time_msc=int(now * 1000),
+            type=deal_type, entry=entry, magic=pos["magic"], position_id=pos["ticket"],
+            reason=reason, volume=volume, price=price, commission=commission, swap=0.0,
+            profit=round(float(profit), 2), symbol=pos["symbol"], comment=comment,
+        )
+        self._deals.append(deal)
+        return deal
+
+    def _close(self, pos, volume, price, reason, now, comment=""):
+        path = self._paths[pos["symbol"]]
+        direction = 1 if pos["type"] == POSITION_TYPE_BUY else -1
+        profit = _to_account(
+            pos["symbol"], direction * (price - pos["price_open"]) * volume * path.contract_size, price
+        )
+        deal = self._record_deal(pos, volume, price, DEAL_ENTRY_OUT, reason, now, profit, comment)
+        pos["volume"] = round(pos["volume"] - volume, 2)
+        if pos["volume"] <= 0:
+            del self._positions[pos["ticket"]]
+        return deal
+
+    def _check_stops(self, now, symbol=None):
+        """Closes positions whose SL or TP was touched since the last check."""
+        for pos in [p for p in self._positions.values() if symbol is None or p["symbol"] == symbol]:
+            if not pos["sl"] and not pos["tp"]:
+                continue
+            path = self._paths[pos["symbol"]]
+            index = path.index_at(now)
+            path.ensure(index)
+            offset = path.spread_points * path.point if pos["type"] == POSITION_TYPE_SELL else 0.0
+
+            # Completed bars since the last check (the opening bar is only
+            # checked at the prices seen while it was forming)
+            bars = path.bars[pos["checked"]:index]
+            pos["checked"] = max(pos["checked"], index)
+            hit = self._first_hit(pos, bars["open"] + offset, bars["high"] + offset, bars["low"] + offset)
+            if hit is None:
+                price = path.bid_at(now) + offset
+                hit = self._first_hit(pos, [price], [price], [price])
+                hit_time = now
+            else:
+                hit_time = float(bars["time"][hit[0]])
+            if hit is not None:
+                _, price, reason = hit
+                self._close(pos, pos["volume"], round(float(price), path.digits), reason, hit_time,
+                            "sl" if reason == DEAL_REASON_SL else "tp")
+
+    @staticmethod
+    def _first_hit(pos, opens, highs, lows):
+        """(bar, fill price, reason) of the first SL/TP touch; SL wins ties."""
+        sl, tp = pos["sl"], pos["tp"]
+        buy = pos["type"] == POSITION_TYPE_BUY
+        for i, (o, h, l) in enumerate(zip(opens, highs, lows)):
+            if sl and (l <= sl if buy else h >= sl):
+                return i, (min(o, sl) if buy else max(o, sl)), DEAL_REASON_SL
+            if tp and (h >= tp if buy else l <= tp):
+                return i, (max(o, tp) if buy else min(o, tp)), DEAL_REASON_TP
+        return None
+
+    # -------------------------
+    # MARKET DATA
+    # -------------------------
+    def symbol_info(self, symbol):
+        self._call("symbol_info")
+        with self._lock:
+            path, bid, ask = self._quote(symbol, self.time_source())
+            return SymbolInfo(
+                name=symbol, point=path.point, digits=path.digits, spread=path.spread_points,
+                visible=True, select=True, trade_mode=SYMBOL_TRADE_MODE_FULL,
+                trade_contract_size=path.contract_size, trade_tick_size=path.point,
+                trade_tick_value=_to_account(symbol, path.point * path.contract_size, bid),
+                volume_min=0.01, volume_max=100.0, volume_step=0.01,
+                bid=bid, ask=ask, session_deals=1,
+            )
+
+    def symbol_info_tick(self, symbol):
+        self._call("symbol_info_tick")
+        with self._lock:
+            now = self.time_source()
+            _, bid, ask = self._quote(symbol, now)
+            return Tick(time=int(now), bid=bid, ask=ask, last=0.0, volume=0, time_msc=int(now * 1000))
+
+    def symbols_get(self, group=None):
+        self._call("symbols_get")
+        return tuple(self.symbol_info(s) for s in self.symbols)
+
+    def copy_rates_from_pos(self, symbol, timeframe, start_pos, count):
+        self._call("copy_rates_from_pos")
+        period = _TIMEFRAME_SECONDS.get(timeframe)
+        if period is None:
+            return None
+        with self._lock:
+            return self._path(symbol).rates(self.time_source(), start_pos, count, period)
+
+    # -------------------------
+    # ACCOUNT / POSITIONS
+    # -------------------------
+    def account_info(self):
+        self._call("account_info")
+        with self._lock:
+            now = self.time_source()
+            self._check_stops(now)
+            profit, margin = self._exposure(now)
+            equity = self.balance + profit
+            return AccountInfo(
+                login=12345, server="Simulator", currency="USD", leverage=self.leverage,
+                balance=round(self.balance, 2), equity=round(equity, 2), profit=round(profit, 2),
+                margin=round(margin, 2), margin_free=round(equity - margin, 2),
+                margin_level=round(equity / margin * 100, 2) if margin else 0.0,
+            )
+
+    def positions_get(self, symbol=None, group=None, ticket=None):
+        self._call("positions_get")
+        with self._lock:
+            now = self.time_source()
+            self._check_stops(now, symbol)
+            out = []
+            for pos in self._positions.values():
+                if symbol is not None and pos["symbol"] != symbol:
+                    continue
+                if ticket is not None and pos["ticket"] != ticket:
+                    continue
+                _, bid, ask = self._quote(pos["symbol"], now)
+                current, profit = self._position_profit(pos, bid, ask)
+                out.append(TradePosition(
+                    ticket=pos["ticket"], time=pos["time"], type=pos["type"], magic=pos["magic"],
+                    identifier=pos["ticket"], volume=pos["volume"], price_open=pos["price_open"],
+                    sl=pos["sl"], tp=pos["tp"], price_current=current, swap=0.0,
+                    profit=round(profit, 2), symbol=pos["symbol"], comment=pos["comment"],
+                ))
+            return tuple(out)
+
+    def positions_total(self):
+        return len(self.positions_get())
+
+    def history_deals_get(self, date_from=None, date_to=None, group=None, ticket=None, position=None):
+        self._call("history_deals_get")
+        start, end = _epoch(date_from), _epoch(date_to)
+        with self._lock:
+            self._check_stops(self.time_source())
+            return tuple(
+                d for d in self._deals
+                if (start is None or d.time >= start)
+                and (end is None or d.time <= end)
+                and (ticket is None or d.ticket == ticket)
+                and (position is None or d.position_id == position)
+            )
+
+    def history_deals_total(self, date_from=None, date_to=None):
+        return len(self.history_deals_get(date_from, date_to))
+
+    # -------------------------
+    # TRADING
+    # -------------------------
+    def order_send(self, request):
+        self._call("order_send")
+        with self._lock:
+            now = self.time_source()
+            self._check_stops(now)
+            action = request.get("action")
+            if action == TRADE_ACTION_SLTP:
+                return self._modify(request)
+            if action != TRADE_ACTION_DEAL or not request.get("symbol"):
+                return self._result(TRADE_RETCODE_INVALID, request)
+            if request.get("position"):
+                return self._close_request(request, now)
+            return self._open(request, now)
+
+    def _result(self, retcode, request, deal=None, price=0.0, bid=0.0, ask=0.0, order=0):
+        comment = "Request executed" if retcode == TRADE_RETCODE_DONE else "Request rejected"
+        return OrderSendResult(
+            retcode=retcode, deal=deal.ticket if deal else 0, order=order,
+            volume=request.get("volume", 0.0), price=price, bid=bid, ask=ask,
+            comment=comment, request_id=0, request=request,
+        )
+
+    def _fill_price(self, path, market, buying):
+        slip = int(self._rng.integers(0, self.slippage_points + 1)) if self.slippage_points else 0
+        return round(market + (slip if buying else -slip) * path.point, path.digits)
+
+    def _valid_volume(self, volume):
+        steps = round(volume / 0.01)
+        return volume >= 0.01 and abs(steps * 0.01 - volume) < 1e-9
+
+    def _requoted(self, request, path, price):
+        requested = request.get("price")
+        deviation = request.get("deviation")
+        return requested and deviation is not None and abs(price - requested) > deviation * path.point
+
+    def _open(self, request, now):
+        symbol = request["symbol"]
+        volume = float(request.get("volume", 0.0))
+        order_type = request.get("type")
+        path, bid, ask = self._quote(symbol, now)
+
+        if order_type not in (ORDER_TYPE_BUY, ORDER_TYPE_SELL):
+            return self._result(TRADE_RETCODE_INVALID, request, bid=bid, ask=ask)
+        if not self._valid_volume(volume):
+            return self._result(TRADE_RETCODE_INVALID_VOLUME, request, bid=bid, ask=ask)
+
+        buying = order_type == ORDER_TYPE_BUY
+        sl, tp = float(request.get("sl") or 0.0), float(request.get("tp") or 0.0)
+        if (sl and (sl >= bid if buying else sl <= ask)) or (tp and (tp <= ask if buying else tp >= bid)):
+            return self._result(TRADE_RETCODE_INVALID_STOPS, request, bid=bid, ask=ask)
+
+        price = self._fill_price(path, ask if buying else bid, buying)
+        if self._requoted(request, path, price):
+            return self._result(TRADE_RETCODE_REQUOTE, request, bid=bid, ask=ask)
+
+        profit, margin = self._exposure(now)
+        if self._margin(symbol, volume, price) > self.balance + profit - margin:
+            return self._result(TRADE_RETCODE_NO_MONEY, request, bid=bid, ask=ask)
+
+        ticket = self._ticket()
+        pos = {
+            "ticket": ticket, "symbol": symbol, "time": int(now), "magic": request.get("magic", 0),
+            "type": POSITION_TYPE_BUY if buying else POSITION_TYPE_SELL, "volume": volume,
+            "price_open": price, "sl": sl, "tp": tp, "comment": request.get("comment", ""),
+            "checked": path.index_at(now) + 1,
+        }
+        self._positions[ticket] = pos
+        deal = self._record_deal(pos, volume, price, DEAL_ENTRY_IN, DEAL_REASON_EXPERT, now,
+                                 comment=pos["comment"])
+        return self._result(TRADE_RETCODE_DONE, request, deal, price, bid, ask, order=ticket)
+
+    def _close_request(self, request, now):
+        pos = self._positions.get(request["position"])
+        if pos is None:
+            return self._result(TRADE_RETCODE_POSITION_CLOSED, request)
+
+        path, bid, ask = self._quote(pos["symbol"], now)
+        volume = float(request.get("volume", pos["volume"]))
+        if not self._valid_volume(volume) or volume > pos["volume"] + 1e-9:
+            return self._result(TRADE_RETCODE_INVALID_VOLUME, request, bid=bid, ask=ask)
+
+        closing_buy = pos["type"] == POSITION_TYPE_BUY
+        price = self._fill_price(path, bid if closing_buy else ask, not closing_buy)
+        if self._requoted(request, path, price):
+            return self._result(TRADE_RETCODE_REQUOTE, request, bid=bid, ask=ask)
+
+        deal = self._close(pos, min(volume, pos["volume"]), price, DEAL_REASON_EXPERT, now,
+                           request.get("comment", ""))
+        return self._result(TRADE_RETCODE_DONE, request, deal, price, bid, ask, order=deal.order)
+
+    def _modify(self, request):
+        pos = self._positions.get(request.get("position"))
+        if pos is None:
+            return self._result(TRADE_RETCODE_POSITION_CLOSED, request)
+        pos["sl"] = float(request.get("sl") or 0.0)
+        pos["tp"] = float(request.get("tp") or 0.0)
+        return self._result(TRADE_RETCODE_DONE, request, order=pos["ticket"])
+
+
+# =========================
+# MODULE API
+# =========================
+_simulator = BrokerSimulator()
+
+
+def configure(**kwargs):
+    """Replaces the default simulator; returns the new instance."""
+    global _simulator
+    _simulator = BrokerSimulator(**kwargs)
+    return _simulator
+
+
+def get_simulator():
+    return _simulator
+
+
+def initialize(*args, **kwargs):
+    return True
+
+def login(*args, **kwargs):
     return True
 
 def shutdown():
     pass
 
-class AccountInfo:
-    def __init__(self, login, equity, margin_free, balance):
-        self.login = login
-        self.equity = equity
-        self.margin_free = margin_free
-        self.balance = balance
+def last_error():
+    return (1, "Success")
 
 def account_info():
-    return AccountInfo(
-        login='12345',
-        equity=100000.0,
-        margin_free=100000.0,
-        balance=100000.0
-    )
-
-class Tick:
-    def __init__(self, ask, bid):
-        self.ask = ask
-        self.bid = bid
+    return _simulator.account_info()
+
+def symbol_info(symbol):
+    return _simulator.symbol_info(symbol)
 
 def symbol_info_tick(symbol):
-    return Tick(
-        ask=1.12345,
-        bid=1.12340
-    )
+    return _simulator.symbol_info_tick(symbol)
 
-class SymbolInfo:
-    def __init__(self, point, visible, trade_mode):
-        self.point = point
-        self.visible = visible
-        self.trade_mode = trade_mode
+def symbol_select(symbol, enable=True):
+    return True
 
-TIMEFRAME_M1 = 1
-SYMBOL_TRADE_MODE_FULL = 0
+def symbols_get(group=None):
+    return _simulator.symbols_get(group)
 
-def symbol_info(symbol):
-    return SymbolInfo(
-        point=0.00001,
-        visible=True,
-        trade_mode=SYMBOL_TRADE_MODE_FULL
-    )
+def symbols_total():
+    return len(_simulator.symbols)
+
+def positions_get(symbol=None, group=None, ticket=None):
+    return _simulator.positions_get(symbol=symbol, group=group, ticket=ticket)
+
+def positions_total():
+    return _simulator.positions_total()
+
+def history_deals_get(date_from=None, date_to=None, group=None, ticket=None, position=None):
+    return _simulator.history_deals_get(date_from, date_to, group=group, ticket=ticket, position=position)
+
+def history_deals_total(date_from=None, date_to=None):
+    return _simulator.history_deals_total(date_from, date_to)
 
-def positions_get(symbol=None):
-    return []
+def order_send(request):
+    return _simulator.order_send(request)
 
 def copy_rates_from_pos(symbol, timeframe, start_pos, count):
-    # Return a DataFrame with the correct columns
-    return pd.DataFrame({
-        'time': pd.to_datetime(np.arange(count), unit='s'),
-        'open': np.random.rand(count) * 100,
-        'high': np.random.rand(count) * 100,
-        'low': np.random.rand(count) * 100,
-        'close': np.random.rand(count) * 100,
-        'tick_volume': np.random.randint(100, 1000, count),
-        'spread': np.random.randint(0, 10, count),
-        'real_volume': np.random.randint(1000, 10000, count)
-    })
+    return _simulator.copy_rates_from_pos(symbol, timeframe, start_pos, count)
 
 print("USING MOCK METATRADER5 MODULE")
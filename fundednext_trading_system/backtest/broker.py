@@ -0,0 +1,234 @@
+"""
+broker.py
+
+Bar-driven simulated broker with the subset of the MetaTrader5 API used
+by the exit managers (positions_get, symbol_info_tick, order_send and
+the order/action/retcode constants), so PartialTPManager and
+TrailingSLManager run unchanged against it.
+
+The backtester pushes each bar with update_bar(); SL/TP levels of
+positions opened before that bar are checked against its range (SL wins
+when both are inside the same bar, gaps fill at the open). Market orders
+fill at the current close through the CostModel.
+"""
+
+from collections import namedtuple
+from types import SimpleNamespace
+
+from fundednext_trading_system.backtest.costs import CostModel, spec_for
+
+Deal = namedtuple("Deal", [
+    "time", "symbol", "ticket", "side", "entry", "volume", "price",
+    "profit", "commission", "reason",
+])
+
+OrderResult = namedtuple("OrderResult", ["retcode", "order", "volume", "price", "comment"])
+
+
+class _Position:
+    __slots__ = (
+        "ticket", "symbol", "type", "volume", "price_open", "price_current",
+        "sl", "tp", "magic", "profit", "comment", "time", "spec",
+    )
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+
+class BacktestBroker:
+    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_SELL = 1
+    TRADE_ACTION_DEAL = 1
+    TRADE_ACTION_SLTP = 6
+    TRADE_RETCODE_DONE = 10009
+    TRADE_RETCODE_INVALID = 10013
+    TRADE_RETCODE_INVALID_VOLUME = 10014
+    TRADE_RETCODE_POSITION_CLOSED = 10036
+
+    VOLUME_STEP = 0.01
+
+    def __init__(self, balance: float, cost_model: CostModel = None, on_deal=None):
+        """
+        on_deal: optional callback(deal) after every closing deal (risk feedback)
+        """
+        self.balance = float(balance)
+        self.cost_model = cost_model or CostModel()
+        self.on_deal = on_deal
+        self.deals = []
+        self.now = 0
+        self._specs = {}
+        self._bid = {}
+        self._ticks = {}
+        self._positions = {}          # ticket -> _Position
+        self._by_symbol = {}          # symbol -> [_Position]
+        self._next_ticket = 1
+
+    def spec(self, symbol):
+        spec = self._specs.get(symbol)
+        if spec is None:
+            spec = self._specs[symbol] = spec_for(symbol)
+        return spec
+
+    # =========================
+    # BAR UPDATES
+    # =========================
+    def update_bar(self, symbol, bar_time, open_, high, low, close):
+        """
+        Advances `symbol` to a closed bar: triggers SL/TP inside the bar,
+        then marks open positions to the close.
+        """
+        self.now = bar_time
+        self._bid[symbol] = close
+        self._ticks.pop(symbol, None)
+
+        positions = self._by_symbol.get(symbol)
+        if not positions:
+            return
+
+        spread = self.cost_model.spread_points * self.spec(symbol).point
+        for pos in list(positions):
+            if pos.time < bar_time:
+                self._check_stops(pos, open_, high, low, spread)
+        self._mark(symbol)
+
+    def _check_stops(self, pos, open_, high, low, spread):
+        sl, tp = pos.sl, pos.tp
+        slip = self.cost_model.slippage_points * pos.spec.point
+        if pos.type == self.ORDER_TYPE_BUY:
+            if sl and low <= sl:
+                self._close(pos, pos.volume, min(open_, sl) - slip, "sl")
+            elif tp and high >= tp:
+                self._close(pos, pos.volume, max(open_, tp), "tp")
+        else:
+            if sl and high + spread >= sl:
+                self._close(pos, pos.volume, max(open_ + spread, sl) + slip, "sl")
+            elif tp and low + spread <= tp:
+                self._close(pos, pos.volume, min(open_ + spread, tp), "tp")
+
+    def _mark(self, symbol):
+        bid = self._bid[symbol]
+        spec = self.spec(symbol)
+        ask = self.cost_model.ask(bid, spec)
+        for pos in self._by_symbol.get(symbol, ()):
+            if pos.type == self.ORDER_TYPE_BUY:
+                pos.price_current = bid
+                diff = bid - pos.price_open
+            else:
+                pos.price_current = ask
+                diff = pos.price_open - ask
+            pos.profit = spec.to_account(diff * pos.volume * spec.contract_size, pos.price_current)
+
+    # =========================
+    # ACCOUNT
+    # =========================
+    def equity(self) -> float:
+        return self.balance + sum(pos.profit for pos in self._positions.values())
+
+    def has_positions(self, symbol=None) -> bool:
+        return bool(self._by_symbol.get(symbol) if symbol is not None else self._positions)
+
+    def account_info(self):
+        equity = self.equity()
+        return SimpleNamespace(balance=self.balance, equity=equity, profit=equity - self.balance)
+
+    # =========================
+    # MT5-COMPATIBLE API
+    # =========================
+    def positions_get(self, symbol=None, ticket=None):
+        if ticket is not None:
+            pos = self._positions.get(ticket)
+            return (pos,) if pos else ()
+        if symbol is not None:
+            return tuple(self._by_symbol.get(symbol, ()))
+        return tuple(self._positions.values())
+
+    def symbol_info_tick(self, symbol):
+        tick = self._ticks.get(symbol)
+        if tick is None:
+            bid = self._bid.get(symbol)
+            if bid is None:
+                return None
+            tick = SimpleNamespace(bid=bid, ask=self.cost_model.ask(bid, self.spec(symbol)), time=self.now)
+            self._ticks[symbol] = tick
+        return tick
+
+    def order_send(self, request):
+        action = request.get("action")
+        if action == self.TRADE_ACTION_SLTP:
+            pos = self._positions.get(request.get("position"))
+            if pos is None:
+                return OrderResult(self.TRADE_RETCODE_POSITION_CLOSED, 0, 0.0, 0.0, "position closed")
+            pos.sl = float(request.get("sl") or 0.0)
+            pos.tp = float(request.get("tp") or 0.0)
+            return OrderResult(self.TRADE_RETCODE_DONE, pos.ticket, pos.volume, 0.0, "done")
+
+        if action != self.TRADE_ACTION_DEAL or request.get("symbol") not in self._bid:
+            return OrderResult(self.TRADE_RETCODE_INVALID, 0, 0.0, 0.0, "invalid request")
+
+        volume = float(request.get("volume", 0.0))
+        steps = round(volume / self.VOLUME_STEP)
+        if steps < 1 or abs(steps * self.VOLUME_STEP - volume) > 1e-9:
+            return OrderResult(self.TRADE_RETCODE_INVALID_VOLUME, 0, volume, 0.0, "invalid volume")
+
+        if request.get("position"):
+            return self._close_request(request, volume)
+        return self._open(request, volume)
+
+    def _open(self, request, volume):
+        symbol = request["symbol"]
+        spec = self.spec(symbol)
+        buying = request.get("type") == self.ORDER_TYPE_BUY
+        price = self.cost_model.fill_price(self._bid[symbol], buying, spec)
+
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        pos = _Position(
+            ticket=ticket, symbol=symbol, volume=volume,
+            type=self.ORDER_TYPE_BUY if buying else self.ORDER_TYPE_SELL,
+            price_open=price, price_current=price, profit=0.0,
+            sl=float(request.get("sl") or 0.0), tp=float(request.get("tp") or 0.0),
+            magic=request.get("magic", 0), comment=request.get("comment", ""),
+            time=self.now, spec=spec,
+        )
+        self._positions[ticket] = pos
+        self._by_symbol.setdefault(symbol, []).append(pos)
+
+        commission = self.cost_model.commission(volume)
+        self.balance -= commission
+        self.deals.append(Deal(self.now, symbol, ticket, "buy" if buying else "sell", "in",
+                               volume, price, 0.0, commission, "signal"))
+        self._mark(symbol)
+        return OrderResult(self.TRADE_RETCODE_DONE, ticket, volume, price, "done")
+
+    def _close_request(self, request, volume):
+        pos = self._positions.get(request["position"])
+        if pos is None:
+            return OrderResult(self.TRADE_RETCODE_POSITION_CLOSED, 0, volume, 0.0, "position closed")
+        if volume > pos.volume + 1e-9:
+            return OrderResult(self.TRADE_RETCODE_INVALID_VOLUME, pos.ticket, volume, 0.0, "invalid volume")
+
+        closing_buy = pos.type == self.ORDER_TYPE_BUY
+        price = self.cost_model.fill_price(self._bid[pos.symbol], not closing_buy, pos.spec)
+        self._close(pos, min(volume, pos.volume), price, request.get("comment") or "close")
+        self._mark(pos.symbol)
+        return OrderResult(self.TRADE_RETCODE_DONE, pos.ticket, volume, price, "done")
+
+    def _close(self, pos, volume, price, reason):
+        spec = pos.spec
+        direction = 1 if pos.type == self.ORDER_TYPE_BUY else -1
+        profit = spec.to_account(direction * (price - pos.price_open) * volume * spec.contract_size, price)
+        commission = self.cost_model.commission(volume)
+        self.balance += profit - commission
+
+        pos.volume = round(pos.volume - volume, 2)
+        if pos.volume <= 0:
+            del self._positions[pos.ticket]
+            self._by_symbol[pos.symbol].remove(pos)
+
+        deal = Deal(self.now, pos.symbol, pos.ticket, "sell" if direction > 0 else "buy", "out",
+                    volume, price, profit, commission, reason)
+        self.deals.append(deal)
+        if self.on_deal is not None:
+            self.on_deal(deal)
+        return deal
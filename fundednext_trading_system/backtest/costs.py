@@ -0,0 +1,57 @@
+"""
+costs.py
+
+Contract specifications and the trading cost model used by the backtester.
+
+Prices in recorded bars are bid prices. Buys fill at the ask (bid plus
+spread), sells at the bid; slippage always moves the fill against the
+trader and commission is charged per lot on every deal.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SymbolSpec:
+    point: float
+    pip_size: float
+    contract_size: float
+    usd_base: bool = False   # USDxxx: quote-currency P&L is converted at the fill price
+
+    def to_account(self, amount: float, price: float) -> float:
+        """Converts an amount in the quote currency to USD."""
+        return amount / price if self.usd_base else amount
+
+    def pip_value(self, price: float) -> float:
+        """USD value of one pip for one lot."""
+        return self.to_account(self.pip_size * self.contract_size, price)
+
+
+def spec_for(symbol: str) -> SymbolSpec:
+    """Specification guessed from the symbol name (FX, JPY pairs, gold, indices)."""
+    if symbol.startswith("XAU"):
+        return SymbolSpec(point=0.01, pip_size=0.1, contract_size=100.0)
+    if not symbol.isalpha():
+        return SymbolSpec(point=0.01, pip_size=1.0, contract_size=1.0)
+    usd_base = symbol.startswith("USD")
+    if symbol.endswith("JPY"):
+        return SymbolSpec(point=0.001, pip_size=0.01, contract_size=100_000.0, usd_base=usd_base)
+    return SymbolSpec(point=0.00001, pip_size=0.0001, contract_size=100_000.0, usd_base=usd_base)
+
+
+@dataclass(frozen=True)
+class CostModel:
+    spread_points: float = 10.0
+    slippage_points: float = 0.0
+    commission_per_lot: float = 3.5      # USD per lot per side
+
+    def ask(self, bid: float, spec: SymbolSpec) -> float:
+        return bid + self.spread_points * spec.point
+
+    def fill_price(self, bid: float, buying: bool, spec: SymbolSpec) -> float:
+        """Market fill: buys at ask plus slippage, sells at bid minus slippage."""
+        slip = self.slippage_points * spec.point
+        return self.ask(bid, spec) + slip if buying else bid - slip
+
+    def commission(self, volume: float) -> float:
+        return self.commission_per_lot * volume
@@ -0,0 +1,389 @@
+"""
+engine.py
+
+Event-driven portfolio backtester.
+
+Drives the live risk and exit classes over multi-symbol bar history:
+
+    entry signal → RiskManager.position_size / can_open_trade (correlation)
+                 → BacktestBroker fill (spread, slippage, commission)
+    every bar    → SL/TP inside the bar → PartialTPManager → TrailingSLManager
+    every step   → equity → RiskManager.update_equity (CapitalScaler)
+
+Entry signals are precomputed int8 arrays per symbol (+1 buy, -1 sell,
+0 none), e.g. from signals_from_model(), so the event loop only does
+work on bars that have a signal or an open position. Bars are processed
+in time order across symbols; a FixedClock follows the bar times so the
+daily-loss reset runs on simulated days.
+
+Usage:
+    python -m fundednext_trading_system.backtest.engine <start YYYY-MM-DD> <end YYYY-MM-DD> [SYMBOL ...]
+"""
+
+import math
+import sys
+import time
+from collections import Counter
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from fundednext_trading_system.backtest.broker import BacktestBroker
+from fundednext_trading_system.backtest.costs import CostModel
+from fundednext_trading_system.config.settings import (
+    ALLOWED_SYMBOLS,
+    ATR_PERIOD,
+    ATR_SL_MULTIPLIER,
+    ATR_TP_MULTIPLIERS,
+    CANDLE_STORE_DIR,
+    TIMEFRAME_BARS,
+    TP_CLOSE_PERCENTS,
+)
+from fundednext_trading_system.execution.candle_store import CandleStore
+from fundednext_trading_system.execution.candles import Candles
+from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed
+from fundednext_trading_system.execution.partial_tp_manager import PartialTPManager
+from fundednext_trading_system.execution.trailing_sl_manager import TrailingSLManager
+from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core import clock
+from fundednext_trading_system.trading_core.risk_manager import RiskManager
+
+
+class HistoricalCorrelation:
+    """
+    CorrelationManager stand-in: correlation of close-to-close returns over
+    the backtest history, aligned on common bar times.
+    """
+
+    def __init__(self, bars: dict):
+        closes = pd.DataFrame({
+            symbol: pd.Series(records["close"], index=records["time"])
+            for symbol, records in bars.items()
+        })
+        self.correlation_matrix = closes.pct_change().corr()
+        self.matrix_ready = True
+
+    def get_correlation(self, symbol1: str, symbol2: str) -> float:
+        try:
+            value = self.correlation_matrix.loc[symbol1, symbol2]
+        except KeyError:
+            return 0.0
+        return float(value) if pd.notna(value) else 0.0
+
+
+def signals_from_model(model, features: pd.DataFrame, min_confidence: float = 0.5) -> np.ndarray:
+    """
+    Scores every row in one predict_proba call: +1 buy, -1 sell, 0 when
+    confidence is below `min_confidence` or the row has missing features.
+    """
+    values = features.to_numpy(dtype=float)
+    signals = np.zeros(len(values), dtype=np.int8)
+    valid = np.isfinite(values).all(axis=1)
+    if not valid.any():
+        return signals
+
+    proba = model.predict_proba(values[valid])
+    side = np.where(proba[:, 1] > proba[:, 0], 1, -1)
+    confidence = proba.max(axis=1)
+    signals[valid] = np.where(confidence >= min_confidence, side, 0)
+    return signals
+
+
+class PortfolioBacktester:
+    def __init__(
+        self,
+        bars: dict,
+        signals: dict,
+        cost_model: CostModel = None,
+        risk_manager: RiskManager = None,
+        atr_period: int = ATR_PERIOD,
+        atr_sl_multiplier: float = ATR_SL_MULTIPLIER,
+        tp_multipliers=ATR_TP_MULTIPLIERS,
+        tp_close_percents=TP_CLOSE_PERCENTS,
+        take_profit_atr: float = None,
+    ):
+        """
+        bars:    {symbol: time-ordered record array with time/open/high/low/close}
+        signals: {symbol: int8 array aligned with that symbol's bars}
+        take_profit_atr: optional hard TP in ATRs (live orders send none)
+        """
+        self.bars = {symbol: records for symbol, records in bars.items() if len(records)}
+        self.signals = {}
+        for symbol, records in self.bars.items():
+            sig = np.asarray(signals.get(symbol, np.zeros(len(records))), dtype=np.int8)
+            if len(sig) != len(records):
+                raise ValueError(f"{symbol}: {len(sig)} signals for {len(records)} bars")
+            self.signals[symbol] = sig
+
+        self.risk_manager = risk_manager or RiskManager(correlation_manager=HistoricalCorrelation(self.bars))
+        self.broker = BacktestBroker(self.risk_manager.start_balance, cost_model, on_deal=self._on_deal)
+        self.partial_tp_manager = PartialTPManager(
+            tp_multipliers=tp_multipliers,
+            close_percents=tp_close_percents,
+            atr_period=atr_period,
+            atr_multiplier=atr_sl_multiplier,
+            broker=self.broker,
+        )
+        self.trailing_sl_manager = TrailingSLManager(
+            atr_period=atr_period,
+            atr_multiplier=atr_sl_multiplier,
+            broker=self.broker,
+        )
+        self.atr_sl_multiplier = atr_sl_multiplier
+        self.take_profit_atr = take_profit_atr
+        # Bars handed to the managers: enough history for the ATR
+        self.window = max(4 * atr_period, 50)
+
+        self.decisions = Counter()
+        self.equity_curve = None
+
+    @property
+    def symbols(self):
+        return list(self.bars)
+
+    # =========================
+    # RISK FEEDBACK
+    # =========================
+    def _on_deal(self, deal):
+        net = deal.profit - deal.commission
+        if net < 0:
+            self.risk_manager.register_loss(-net)
+        else:
+            self.risk_manager.register_profit(net)
+
+    # =========================
+    # EVENT ORDER
+    # =========================
+    def _events(self):
+        """
+        (step, symbol id, bar index) for every bar, in time order; bars of
+        several symbols closing at the same time share a step.
+        """
+        times = np.unique(np.concatenate([r["time"] for r in self.bars.values()]))
+        steps, ids, index = [], [], []
+        for sym_id, records in enumerate(self.bars.values()):
+            steps.append(np.searchsorted(times, records["time"]))
+            ids.append(np.full(len(records), sym_id))
+            index.append(np.arange(len(records)))
+        steps, ids, index = np.concatenate(steps), np.concatenate(ids), np.concatenate(index)
+        order = np.lexsort((ids, steps))
+        return times, steps[order].tolist(), ids[order].tolist(), index[order].tolist()
+
+    # =========================
+    # RUN
+    # =========================
+    def run(self, quiet: bool = True, close_at_end: bool = True) -> dict:
+        """
+        Runs the whole history and returns a report.
+        quiet: silence pipeline logging while running (logging dominates runtime).
+        """
+        if not self.bars:
+            return {"bars": 0}
+
+        times, ev_steps, ev_ids, ev_index = self._events()
+        names = list(self.bars)
+        columns = [
+            (r["time"].tolist(), r["open"].tolist(), r["high"].tolist(), r["low"].tolist(), r["close"].tolist())
+            for r in self.bars.values()
+        ]
+        signals = [self.signals[s].tolist() for s in names]
+        records = list(self.bars.values())
+
+        broker = self.broker
+        by_symbol = broker._by_symbol
+        equity = np.full(len(times), np.nan)
+        current_step = -1
+
+        sim_clock = clock.FixedClock(int(times[0]))
+        previous_clock = clock.set_clock(sim_clock)
+        if quiet:
+            logger.disable("fundednext_trading_system")
+
+        started = time.perf_counter()
+        try:
+            for step, sym_id, i in zip(ev_steps, ev_ids, ev_index):
+                symbol = names[sym_id]
+                sig = signals[sym_id][i]
+                if not sig and not by_symbol.get(symbol):
+                    continue
+
+                if step != current_step:
+                    if current_step >= 0:
+                        self._close_step(current_step, equity)
+                    current_step = step
+                    sim_clock.set(int(times[step]))
+
+                t, o, h, l, c = columns[sym_id]
+                broker.update_bar(symbol, t[i], o[i], h[i], l[i], c[i])
+
+                candles = None
+                if by_symbol.get(symbol):
+                    candles = Candles(records[sym_id][max(0, i + 1 - self.window):i + 1])
+                    self.partial_tp_manager.manage(symbol, candles)
+                    self.trailing_sl_manager.manage(symbol, candles)
+
+                if sig:
+                    if candles is None:
+                        candles = Candles(records[sym_id][max(0, i + 1 - self.window):i + 1])
+                    self._enter(symbol, sig, candles)
+
+            if current_step >= 0:
+                if close_at_end:
+                    self._close_all()
+                self._close_step(current_step, equity)
+        finally:
+            elapsed = time.perf_counter() - started
+            clock.set_clock(previous_clock)
+            if quiet:
+                logger.enable("fundednext_trading_system")
+
+        # Steps without events left equity unchanged
+        equity = pd.Series(equity).ffill().fillna(self.risk_manager.start_balance).to_numpy()
+        self.equity_curve = equity
+
+        report = self._report(len(ev_steps), elapsed)
+        logger.success(
+            f"⏹️ Backtest finished | bars={report['bars']} | {elapsed:.1f}s | "
+            f"{report['bars_per_second']:,.0f} bars/s | net=${report['net_profit']:.2f} | "
+            f"maxDD={report['max_drawdown']:.2%}"
+        )
+        return report
+
+    def _close_step(self, step, equity):
+        value = self.broker.equity()
+        equity[step] = value
+        if self.broker.has_positions():
+            self.risk_manager.update_equity(value)
+
+    def _enter(self, symbol, sig, candles):
+        self.decisions["signals"] += 1
+        broker = self.broker
+
+        atr = self.trailing_sl_manager._calculate_atr(candles, symbol)
+        if atr <= 0:
+            self.decisions["no_atr"] += 1
+            return
+
+        spec = broker.spec(symbol)
+        tick = broker.symbol_info_tick(symbol)
+        sl_distance = atr * self.atr_sl_multiplier
+        stop_loss_pips = sl_distance / spec.pip_size
+        pip_value = spec.pip_value(tick.bid)
+
+        volume = self.risk_manager.position_size(symbol, stop_loss_pips, pip_value)
+        volume = math.floor(round(volume / broker.VOLUME_STEP, 6)) * broker.VOLUME_STEP
+        risk_amount = stop_loss_pips * pip_value * volume
+
+        if volume <= 0 or not self.risk_manager.can_open_trade(risk_amount, symbol, broker.positions_get()):
+            self.decisions["risk_rejected"] += 1
+            return
+
+        buying = sig > 0
+        entry = tick.ask if buying else tick.bid
+        direction = 1 if buying else -1
+        tp = entry + direction * self.take_profit_atr * atr if self.take_profit_atr else 0.0
+
+        result = broker.order_send({
+            "action": broker.TRADE_ACTION_DEAL,
+            "symbol": symbol,
+            "volume": round(volume, 2),
+            "type": broker.ORDER_TYPE_BUY if buying else broker.ORDER_TYPE_SELL,
+            "price": entry,
+            "sl": entry - direction * sl_distance,
+            "tp": tp,
+            "magic": 777001,
+            "comment": "BACKTEST",
+        })
+        if result.retcode == broker.TRADE_RETCODE_DONE:
+            self.decisions["opened"] += 1
+        else:
+            self.decisions["order_failed"] += 1
+
+    def _close_all(self):
+        broker = self.broker
+        for pos in broker.positions_get():
+            broker.order_send({
+                "action": broker.TRADE_ACTION_DEAL,
+                "symbol": pos.symbol,
+                "position": pos.ticket,
+                "volume": pos.volume,
+                "comment": "end of test",
+            })
+
+    # =========================
+    # REPORT
+    # =========================
+    def _report(self, bars, elapsed):
+        deals = self.broker.deals
+        start = self.risk_manager.start_balance
+
+        per_position = Counter()
+        per_symbol = {s: {"trades": 0, "net_profit": 0.0} for s in self.bars}
+        commission = 0.0
+        for deal in deals:
+            net = deal.profit - deal.commission
+            commission += deal.commission
+            per_position[deal.ticket] += net
+            per_symbol[deal.symbol]["net_profit"] += net
+            if deal.entry == "in":
+                per_symbol[deal.symbol]["trades"] += 1
+
+        peaks = np.maximum.accumulate(self.equity_curve)
+        drawdown = float(np.max((peaks - self.equity_curve) / peaks)) if len(peaks) else 0.0
+        wins = sum(1 for net in per_position.values() if net > 0)
+
+        return {
+            "bars": bars,
+            "elapsed_seconds": round(elapsed, 3),
+            "bars_per_second": round(bars / elapsed, 1) if elapsed > 0 else 0.0,
+            "trades": len(per_position),
+            "win_rate": round(wins / len(per_position), 4) if per_position else 0.0,
+            "net_profit": round(self.broker.balance - start, 2),
+            "final_equity": round(self.broker.equity(), 2),
+            "max_drawdown": round(drawdown, 6),
+            "commission": round(commission, 2),
+            "decisions": dict(self.decisions),
+            "per_symbol": {
+                s: {"trades": v["trades"], "net_profit": round(v["net_profit"], 2)}
+                for s, v in per_symbol.items()
+            },
+        }
+
+
+def backtest_main(argv):
+    """
+    Backtests the saved per-symbol models over stored candles.
+    """
+    from fundednext_trading_system.execution.candle_store import records_to_frame
+    from fundednext_trading_system.ml.model_loader import load_model_for_symbol
+    from fundednext_trading_system.trading_core.signal_engine import SignalEngine
+
+    if len(argv) < 2:
+        print("Usage: backtest <start YYYY-MM-DD> <end YYYY-MM-DD> [SYMBOL ...]")
+        sys.exit(1)
+
+    start, end = date.fromisoformat(argv[0]), date.fromisoformat(argv[1])
+    symbols = argv[2:] or ALLOWED_SYMBOLS
+    timeframe_str = DukascopyDataFeed.TIMEFRAME_MAP.get(TIMEFRAME_BARS, "M5")
+    store = CandleStore(CANDLE_STORE_DIR)
+    signal_engine = SignalEngine()
+
+    bars, signals = {}, {}
+    for symbol in symbols:
+        records = store.read_range(symbol, timeframe_str, start, end)
+        model = load_model_for_symbol(symbol)
+        if len(records) == 0 or model is None:
+            logger.warning(f"{symbol}: no candles or no model, skipping")
+            continue
+        features = signal_engine.prepare_features(records_to_frame(records), symbol=symbol)
+        bars[symbol] = records
+        signals[symbol] = signals_from_model(model, features, min_confidence=0.7)
+
+    report = PortfolioBacktester(bars, signals).run()
+    for key, value in report.items():
+        logger.info(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    backtest_main(sys.argv[1:])
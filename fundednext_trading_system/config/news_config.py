@@ -7,3 +7,7 @@ NEWS_SOURCES = [
     "alphavantage",
     "yahoo"
 ]
+
+# News sentiment cache
+NEWS_SENTIMENT_TTL_SECONDS = 900        # cached score considered fresh for 15 min
+NEWS_SENTIMENT_REFRESH_SECONDS = 300    # background refresh interval
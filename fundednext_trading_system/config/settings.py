@@ -5,8 +5,7 @@ import os
 
 ENVIRONMENT = os.getenv("ENVIRONMENT", "production").lower()
 TIMEFRAME_BARS = 300
-LOOP_SLEEP_SECONDS = 60
-PER_SYMBOL_THROTTLE = 0.3
+BAR_POLL_SECONDS = 1.0  # bar-close scheduler poll interval
 
 # =========================================================
 # SYMBOLS
@@ -28,23 +27,30 @@ ATR_SL_MULTIPLIER = 1.2
 ATR_TP_MULTIPLIERS = (1.0, 2.0)
 TP_CLOSE_PERCENTS = (0.3, 0.3)
 
+# =========================================================
+# REGIME DETECTION
+# =========================================================
+REGIME_MA_PERIOD = 50
+REGIME_SLOPE_THRESHOLD = 0.1  # trend when |MA slope| > threshold * std(close)
+
 # =========================================================
 # ACCOUNT & EXECUTION MODES
 # =========================================================
 # These settings are now derived from the ENVIRONMENT variable.
 if ENVIRONMENT == "production":
     DRY_RUN = False
-    REPLAY_MODE = False
     ACCOUNT_PHASE = os.getenv("ACCOUNT_PHASE", "CHALLENGE").upper()
     EXECUTION_MODE = "LIVE"
     ML_MODE = "INFERENCE"
 else:
     DRY_RUN = True
-    REPLAY_MODE = False
     ACCOUNT_PHASE = "CHALLENGE"
     EXECUTION_MODE = "PAPER"
     ML_MODE = "TRAINING"
 
+# Historical replay from the local candle store (see replay.py)
+REPLAY_MODE = os.getenv("REPLAY_MODE", "false").lower() in ("1", "true", "yes")
+
 # =========================================================
 # PHASE-SPECIFIC RULES (FundedNext)
 # =========================================================
@@ -72,8 +78,25 @@ CURRENT_RULES = PHASE_RULES[ACCOUNT_PHASE]
 # FILE PATHS
 # =========================================================
 MODELS_DIR = "fundednext_trading_system/models/"
+CANDLE_STORE_DIR = "fundednext_trading_system/data/candles/"
+TICK_BAR_STORE_DIR = "fundednext_trading_system/data/tick_bars/"
+TRAINING_LOG_DIR = "logs/training/"
+FEATURE_CACHE_DIR = "fundednext_trading_system/data/features/"
+SWEEP_CACHE_DIR = "fundednext_trading_system/data/sweeps/"
 STATS_PATH = "stats.pkl"
 
+# =========================================================
+# ML
+# =========================================================
+MODEL_VERSION = "v1"
+RETRAIN_AFTER_N_TRADES = 50  # live fills per symbol between retraining runs
+
+# Walk-forward validation
+WALK_FORWARD_FOLDS = 5
+WALK_FORWARD_SCHEME = "anchored"   # "anchored" (expanding train) or "rolling"
+WALK_FORWARD_PURGE_BARS = 1        # >= label horizon (next-bar direction)
+WALK_FORWARD_EMBARGO_BARS = 0
+
 # =========================================================
 # RISK MANAGEMENT
 # =========================================================
@@ -0,0 +1,142 @@
+"""
+bar_aggregator.py
+
+Builds higher-timeframe bars (M5, M15, H1, H4, ...) locally from M1 bars.
+
+Bars are bucketed by floor(time / period) * period, which is how the
+terminal labels its own bars, so aggregated timestamps line up with
+copy_rates_* for the same timeframe. Completed buckets are committed once
+into a ring buffer; the bucket of the newest M1 bar is kept as a forming
+bar and rebuilt on every update (the M1 bar itself may still be forming).
+
+aggregate_bars() is the vectorised core and also works offline on any
+time-ordered M1 record array.
+"""
+
+import numpy as np
+
+from fundednext_trading_system.execution.candle_buffer import CandleRingBuffer
+from fundednext_trading_system.execution.candles import Candles
+
+# Default higher timeframes, in seconds
+DEFAULT_TIMEFRAMES = (300, 900, 3600, 14400)
+
+# How each field combines across the M1 bars of a bucket; others take the last value
+_FIRST = ("open",)
+_MAX = ("high",)
+_MIN = ("low", "spread")
+_SUM = ("tick_volume", "real_volume", "volume")
+
+
+def aggregate_bars(rates: np.ndarray, timeframe_in_seconds: int) -> np.ndarray:
+    """
+    Aggregates time-ordered bars into `timeframe_in_seconds` bars with the
+    same record layout. Buckets without bars produce no output row.
+    """
+    if len(rates) == 0:
+        return rates[:0].copy()
+
+    buckets = rates["time"] // timeframe_in_seconds * timeframe_in_seconds
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    ends = np.append(starts[1:], len(rates)) - 1
+
+    out = np.empty(len(starts), dtype=rates.dtype)
+    for name in rates.dtype.names:
+        column = rates[name]
+        if name == "time":
+            out[name] = buckets[starts]
+        elif name in _FIRST:
+            out[name] = column[starts]
+        elif name in _MAX:
+            out[name] = np.maximum.reduceat(column, starts)
+        elif name in _MIN:
+            out[name] = np.minimum.reduceat(column, starts)
+        elif name in _SUM:
+            out[name] = np.add.reduceat(column, starts)
+        else:
+            out[name] = column[ends]
+    return out
+
+
+class BarAggregator:
+    def __init__(self, timeframe_in_seconds: int, capacity: int = 500, base_seconds: int = 60):
+        if timeframe_in_seconds % base_seconds:
+            raise ValueError("timeframe must be a multiple of the base timeframe")
+        self.timeframe = timeframe_in_seconds
+        self.base_seconds = base_seconds
+        self.capacity = capacity
+        self._committed = None      # CandleRingBuffer, created on first update
+        self._forming = None        # single-row record array
+        self._last_bucket = None    # open time of the newest committed bar
+
+    def update(self, m1_rates: np.ndarray) -> int:
+        """
+        Folds a window of M1 bars (e.g. the feed's ring buffer view) into
+        the higher timeframe. Windows may overlap earlier ones; only buckets
+        not yet committed are aggregated. Returns the number of bars committed.
+        """
+        if len(m1_rates) == 0:
+            return 0
+
+        tf = self.timeframe
+        times = m1_rates["time"]
+        current = int(times[-1]) // tf * tf
+
+        if self._committed is None:
+            self._committed = CandleRingBuffer(self.capacity, m1_rates.dtype)
+
+        # First bucket that still needs committing
+        if self._last_bucket is None or int(times[0]) > self._last_bucket + tf:
+            # Cold start (or the window skipped bars): the leading bucket is
+            # only complete if the window starts exactly on its boundary
+            first = int(times[0]) // tf * tf
+            if int(times[0]) != first:
+                first += tf
+        else:
+            first = self._last_bucket + tf
+
+        lo = int(np.searchsorted(times, first, side="left"))
+        hi = int(np.searchsorted(times, current, side="left"))
+
+        committed = 0
+        if hi > lo:
+            bars = aggregate_bars(m1_rates[lo:hi], tf)
+            committed = self._committed.merge(bars)
+            self._last_bucket = int(bars["time"][-1])
+
+        self._forming = aggregate_bars(m1_rates[hi:], tf)
+        return committed
+
+    def view(self, count: int = None, include_forming: bool = True) -> np.ndarray:
+        """
+        Newest `count` bars. Committed-only results are a zero-copy view;
+        with the forming bar appended a small copy is returned.
+        """
+        if self._committed is None:
+            return None
+
+        if not include_forming or self._forming is None or len(self._forming) == 0:
+            return self._committed.view(count)
+
+        committed = self._committed.view(None if count is None else max(count - 1, 0))
+        bars = np.concatenate([committed, self._forming])
+        return bars if count is None else bars[-count:]
+
+
+class MultiTimeframeAggregator:
+    """
+    Keeps several higher timeframes up to date from one M1 stream.
+    """
+
+    def __init__(self, timeframes=DEFAULT_TIMEFRAMES, capacity: int = 500):
+        self.aggregators = {tf: BarAggregator(tf, capacity) for tf in timeframes}
+
+    def update(self, m1_rates: np.ndarray) -> dict:
+        return {tf: agg.update(m1_rates) for tf, agg in self.aggregators.items()}
+
+    def candles(self, timeframe_in_seconds: int, count: int = None, include_forming: bool = True):
+        aggregator = self.aggregators.get(timeframe_in_seconds)
+        if aggregator is None:
+            raise KeyError(f"Timeframe not aggregated: {timeframe_in_seconds}s")
+        bars = aggregator.view(count, include_forming)
+        return None if bars is None else Candles(bars)
@@ -0,0 +1,108 @@
+"""
+candle_buffer.py
+
+Fixed-capacity per-symbol candle store backed by the MT5 rates record array.
+
+Rows live in a buffer twice the capacity so the newest `capacity` bars are
+always one contiguous slice; view() hands that slice out without copying.
+When the write position reaches the end, the live window is moved back to
+the front once (amortised O(1) per appended bar).
+"""
+
+import numpy as np
+
+
+class CandleRingBuffer:
+    def __init__(self, capacity: int, dtype: np.dtype):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.empty(capacity * 2, dtype=dtype)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    @property
+    def last_time(self):
+        if self._end == self._start:
+            return None
+        return int(self._data["time"][self._end - 1])
+
+    # =========================
+    # WRITES
+    # =========================
+    def seed(self, rates: np.ndarray):
+        """
+        Replaces the contents with the newest `capacity` rows of rates.
+        """
+        rates = rates[-self.capacity:]
+        n = len(rates)
+        self._data[:n] = rates
+        self._start = 0
+        self._end = n
+
+    def merge(self, rates: np.ndarray) -> int:
+        """
+        Merges a time-ascending block of rates that overlaps or directly
+        follows the stored bars. The stored last bar is overwritten (it may
+        still have been forming) and newer bars are appended.
+
+        Returns the number of new bars appended.
+        """
+        if len(rates) == 0:
+            return 0
+
+        last = self.last_time
+        if last is None:
+            self.seed(rates)
+            return len(self)
+
+        idx = int(np.searchsorted(rates["time"], last, side="left"))
+        fresh = rates[idx:]
+        if len(fresh) == 0:
+            return 0
+
+        if int(fresh["time"][0]) == last:
+            self._end -= 1  # refresh the previous (possibly forming) bar
+            appended = len(fresh) - 1
+        else:
+            appended = len(fresh)
+
+        n = len(fresh)
+        if n >= self.capacity:
+            self.seed(fresh)
+            return appended
+
+        if self._end + n > len(self._data):
+            keep_from = max(self._start, self._end - (self.capacity - n))
+            kept = self._end - keep_from
+            self._data[:kept] = self._data[keep_from:self._end]
+            self._start = 0
+            self._end = kept
+
+        self._data[self._end:self._end + n] = fresh
+        self._end += n
+
+        if len(self) > self.capacity:
+            self._start = self._end - self.capacity
+
+        return appended
+
+    # =========================
+    # READS
+    # =========================
+    def view(self, count: int = None) -> np.ndarray:
+        """
+        Read-only, zero-copy view of the newest `count` bars.
+        Valid until the next write to this buffer.
+        """
+        start = self._start if count is None else max(self._start, self._end - count)
+        out = self._data[start:self._end]
+        out.flags.writeable = False
+        return out
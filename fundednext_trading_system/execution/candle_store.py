@@ -0,0 +1,199 @@
+"""
+candle_store.py
+
+Local columnar store for historical candles.
+
+Layout: <root>/<SYMBOL>/<TIMEFRAME>/<YYYY-MM-DD>.npy, one structured NumPy
+array per UTC day. Day files are read memory-mapped, so a range query only
+touches the pages it needs. Past days are immutable once written; the
+current day is treated as incomplete and re-fetched by the caller.
+A day written while it was still in progress gets a <YYYY-MM-DD>.partial
+marker next to its file and stays missing until rewritten as complete,
+so a partial day cannot pass as a full one once the date rolls over.
+The record layout defaults to CANDLE_DTYPE and can be widened per store
+(e.g. tick-built bars with spread).
+
+An empty day file means "fetched, no bars" (weekends, holidays), so those
+days are not downloaded again.
+"""
+
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from fundednext_trading_system.config.settings import CANDLE_STORE_DIR
+from fundednext_trading_system.monitoring.logger import logger
+
+CANDLE_DTYPE = np.dtype([
+    ("time", "i8"),          # epoch seconds, UTC
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("tick_volume", "f8"),
+])
+
+SECONDS_PER_DAY = 24 * 3600
+
+
+def utc_day(ts: int) -> date:
+    return datetime.fromtimestamp(int(ts), tz=timezone.utc).date()
+
+
+def day_bounds(day: date):
+    start = int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
+    return start, start + SECONDS_PER_DAY
+
+
+def frame_to_records(df: pd.DataFrame, dtype: np.dtype = CANDLE_DTYPE) -> np.ndarray:
+    """
+    Converts a candle DataFrame (time in epoch seconds) to `dtype`,
+    sorted by time with duplicate timestamps removed (last one wins).
+    """
+    records = np.empty(len(df), dtype=dtype)
+    for name in dtype.names:
+        if name in df.columns:
+            records[name] = df[name].to_numpy()
+        else:
+            records[name] = 0
+
+    # Keep the last occurrence of each timestamp, then sort
+    _, last = np.unique(records["time"][::-1], return_index=True)
+    return records[len(records) - 1 - last]
+
+
+def records_to_frame(records: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame({name: records[name] for name in records.dtype.names})
+
+
+class CandleStore:
+    def __init__(self, root: str = CANDLE_STORE_DIR, dtype: np.dtype = CANDLE_DTYPE):
+        self.root = root
+        self.dtype = np.dtype(dtype)
+        self._lock = threading.Lock()
+
+    # =========================
+    # PATHS
+    # =========================
+    def _dir(self, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.root, symbol, timeframe)
+
+    def _path(self, symbol: str, timeframe: str, day: date) -> str:
+        return os.path.join(self._dir(symbol, timeframe), f"{day.isoformat()}.npy")
+
+    def _partial_path(self, symbol: str, timeframe: str, day: date) -> str:
+        return os.path.join(self._dir(symbol, timeframe), f"{day.isoformat()}.partial")
+
+    # =========================
+    # QUERIES
+    # =========================
+    def stored_days(self, symbol: str, timeframe: str) -> set:
+        """
+        Days stored as complete (day files without a .partial marker).
+        """
+        directory = self._dir(symbol, timeframe)
+        if not os.path.isdir(directory):
+            return set()
+        names = os.listdir(directory)
+        partial = {name[:-8] for name in names if name.endswith(".partial")}
+        return {
+            date.fromisoformat(name[:-4])
+            for name in names
+            if name.endswith(".npy") and name[:-4] not in partial
+        }
+
+    def missing_days(self, symbol: str, timeframe: str, start: date, end: date, today: date = None) -> list:
+        """
+        Days in [start, end] that still need downloading. Today (UTC) is
+        always missing because its file may hold a partial day, and so is
+        any earlier day that was only stored partially.
+        """
+        today = today or datetime.now(timezone.utc).date()
+        stored = self.stored_days(symbol, timeframe)
+
+        missing = []
+        day = start
+        while day <= end:
+            if day >= today or day not in stored:
+                missing.append(day)
+            day += timedelta(days=1)
+        return missing
+
+    def read_range(self, symbol: str, timeframe: str, start: date, end: date) -> np.ndarray:
+        """
+        Returns the stored candles for [start, end] as one record array.
+        """
+        parts = []
+        day = start
+        while day <= end:
+            path = self._path(symbol, timeframe, day)
+            if os.path.exists(path):
+                day_records = np.load(path, mmap_mode="r")
+                if len(day_records):
+                    parts.append(day_records)
+            day += timedelta(days=1)
+
+        if not parts:
+            return np.empty(0, dtype=self.dtype)
+        return np.concatenate(parts)
+
+    def read_frame(self, symbol: str, timeframe: str, start: date, end: date) -> pd.DataFrame:
+        return records_to_frame(self.read_range(symbol, timeframe, start, end))
+
+    # =========================
+    # WRITES
+    # =========================
+    def write_days(self, symbol: str, timeframe: str, df: pd.DataFrame, days, partial: bool = False) -> int:
+        """
+        Stores the bars of `df` (DataFrame or record array) falling on each
+        of `days`. Days without bars are written as empty files. Existing
+        bars of a day are kept and merged with the new ones (append-only:
+        newer bars win on overlap).
+        partial=True marks the days as still in progress, so missing_days
+        keeps reporting them; a later complete write clears the mark.
+        Returns the number of day files written.
+        """
+        if df is None or len(df) == 0:
+            records = np.empty(0, dtype=self.dtype)
+        elif isinstance(df, np.ndarray):
+            records = frame_to_records(records_to_frame(df), self.dtype)
+        else:
+            records = frame_to_records(df, self.dtype)
+        directory = self._dir(symbol, timeframe)
+
+        written = 0
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            for day in days:
+                lo, hi = day_bounds(day)
+                i, j = np.searchsorted(records["time"], [lo, hi])
+                day_records = records[i:j]
+
+                path = self._path(symbol, timeframe, day)
+                partial_path = self._partial_path(symbol, timeframe, day)
+                if partial:
+                    # Mark first: a crash must never leave an unmarked partial day
+                    open(partial_path, "wb").close()
+                if os.path.exists(path):
+                    existing = np.load(path)
+                    if len(existing):
+                        day_records = frame_to_records(
+                            records_to_frame(np.concatenate([existing, day_records])), self.dtype
+                        )
+
+                self._atomic_save(path, day_records)
+                if not partial and os.path.exists(partial_path):
+                    os.remove(partial_path)
+                written += 1
+
+        logger.debug(f"CandleStore | {symbol} {timeframe} | {written} day file(s) written")
+        return written
+
+    def _atomic_save(self, path: str, records: np.ndarray):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(records, dtype=self.dtype))
+        os.replace(tmp_path, path)
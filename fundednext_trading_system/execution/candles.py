@@ -0,0 +1,67 @@
+"""
+candles.py
+
+Light candle container for the live path.
+
+Wraps the MT5 rates record array (time, open, high, low, close, ...) as
+returned by the feed's ring buffer. Columns are zero-copy NumPy views, so
+per-cycle consumers (ATR, moving averages, regime detection, latest-row
+features) read prices without building a DataFrame. to_frame() is kept
+for offline tools and training.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class Candles:
+    __slots__ = ("_rates",)
+
+    def __init__(self, rates: np.ndarray):
+        if rates.dtype.names is None:
+            raise TypeError("Candles requires a structured (record) array")
+        self._rates = rates
+
+    # =========================
+    # CONTAINER
+    # =========================
+    def __len__(self):
+        return len(self._rates)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Zero-copy column view."""
+        return self._rates[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._rates.dtype.names
+
+    @property
+    def columns(self):
+        return self._rates.dtype.names
+
+    @property
+    def empty(self) -> bool:
+        return len(self._rates) == 0
+
+    @property
+    def rates(self) -> np.ndarray:
+        return self._rates
+
+    @property
+    def last_time(self):
+        if len(self._rates) == 0:
+            return None
+        return int(self._rates["time"][-1])
+
+    def tail(self, count: int) -> "Candles":
+        return Candles(self._rates[-count:])
+
+    # =========================
+    # CONVERSION (offline use)
+    # =========================
+    def to_frame(self) -> pd.DataFrame:
+        """Copies the bars into a DataFrame with a RangeIndex."""
+        return pd.DataFrame({name: self._rates[name] for name in self._rates.dtype.names})
+
+    def __repr__(self):
+        return f"Candles(bars={len(self)}, last_time={self.last_time})"
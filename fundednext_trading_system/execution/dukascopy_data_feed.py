@@ -1,6 +1,18 @@
+import os
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from fundednext_trading_system.execution.candle_buffer import CandleRingBuffer
+from fundednext_trading_system.execution.candle_store import (
+    CANDLE_DTYPE,
+    SECONDS_PER_DAY,
+    frame_to_records,
+    records_to_frame,
+    utc_day,
+)
 from fundednext_trading_system.monitoring.logger import logger
 
 class DukascopyDataFeed:
@@ -14,19 +26,187 @@ class DukascopyDataFeed:
         86400: "D1",
     }
 
+    # Rows parsed per block while streaming the CSV from dukascopy-node
+    CHUNK_ROWS = 50_000
+    PRICE_DTYPES = {c: "float64" for c in ("open", "high", "low", "close", "volume")}
+
+    # Bulk fetch: days per download chunk and worker pool size (None = per CPU)
+    CHUNK_DAYS = 7
+    MAX_WORKERS = None
+
+    def __init__(self, store=None):
+        """
+        store: optional CandleStore. When set, only days missing from the
+        store are downloaded and candles are served from local disk.
+        """
+        self.store = store
+
     def get_candles(self, symbol, timeframe_in_seconds, count):
         """
         Fetches historical candle data from Dukascopy.
         """
+        timeframe_str = self._timeframe_str(timeframe_in_seconds)
+        start_date, end_date = self._date_range(timeframe_in_seconds, count)
+
+        if self.store is not None:
+            return self._get_candles_from_store(symbol, timeframe_str, start_date.date(), end_date.date(), count)
+
+        # Only the newest `count` bars are kept while the download streams in
+        tail = CandleRingBuffer(max(1, count), CANDLE_DTYPE)
+        if not self._download(symbol, timeframe_str, start_date, end_date, tail.merge):
+            return None
+        return records_to_frame(tail.view(count))
+
+    def _timeframe_str(self, timeframe_in_seconds):
         timeframe_str = self.TIMEFRAME_MAP.get(timeframe_in_seconds)
         if not timeframe_str:
             logger.warning(f"Unsupported timeframe: {timeframe_in_seconds} seconds. Defaulting to M5.")
             timeframe_str = "M5"
+        return timeframe_str
 
+    @staticmethod
+    def _date_range(timeframe_in_seconds, count):
         end_date = datetime.utcnow()
         days_to_fetch = (count * timeframe_in_seconds) / (24 * 3600) + 1
         start_date = end_date - timedelta(days=days_to_fetch)
+        return start_date, end_date
+
+    # =========================
+    # BULK FETCH
+    # =========================
+    def get_candles_bulk(self, symbols, timeframe_in_seconds, count, chunk_days=None, max_workers=None):
+        """
+        Fetches `count` candles for every symbol at once. Each symbol's date
+        range (or its missing days, with a store) is split into chunks of
+        chunk_days that download in parallel on a bounded thread pool
+        (each worker drives its own dukascopy-node process). Chunk results
+        are merged, de-duplicated and gap-checked.
+
+        Returns {symbol: DataFrame or None}.
+        """
+        timeframe_str = self._timeframe_str(timeframe_in_seconds)
+        start_date, end_date = self._date_range(timeframe_in_seconds, count)
+        chunk_days = chunk_days or self.CHUNK_DAYS
+        max_workers = max_workers or self.MAX_WORKERS or min(32, os.cpu_count() or 4)
+
+        # (symbol, first day, last day) for every chunk to download
+        jobs = []
+        for symbol in symbols:
+            if self.store is not None:
+                days = self.store.missing_days(symbol, timeframe_str, start_date.date(), end_date.date())
+            else:
+                days = _day_span(start_date.date(), end_date.date())
+            jobs.extend((symbol, first, last) for first, last in _chunk_days(days, chunk_days))
+
+        logger.info(
+            f"Bulk fetch | {len(symbols)} symbol(s) | {timeframe_str} | "
+            f"{len(jobs)} chunk(s) | workers={max_workers}"
+        )
+
+        parts = {symbol: [] for symbol in symbols}
+        failed = {symbol: 0 for symbol in symbols}
+        if jobs:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dukascopy") as executor:
+                futures = {
+                    executor.submit(self._fetch_chunk, symbol, timeframe_str, first, last, count): symbol
+                    for symbol, first, last in jobs
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        records = future.result()
+                    except Exception as e:
+                        logger.error(f"{symbol}: chunk download failed | {e}")
+                        records = None
+                    if records is None:
+                        failed[symbol] += 1
+                    elif len(records):
+                        parts[symbol].append(records)
+
+        results = {}
+        for symbol in symbols:
+            if failed[symbol]:
+                logger.warning(f"{symbol} {timeframe_str}: {failed[symbol]} chunk(s) failed")
+
+            if self.store is not None:
+                records = self.store.read_range(symbol, timeframe_str, start_date.date(), end_date.date())
+            elif parts[symbol]:
+                records = frame_to_records(records_to_frame(np.concatenate(parts[symbol])))
+            else:
+                records = np.empty(0, dtype=CANDLE_DTYPE)
+
+            records = records[-count:] if count else records
+            if len(records) == 0:
+                results[symbol] = None
+                continue
+
+            gaps = find_gaps(records["time"], timeframe_in_seconds)
+            if gaps:
+                logger.warning(
+                    f"{symbol} {timeframe_str}: {len(gaps)} unexpected gap(s), "
+                    f"largest {max(end - start for start, end in gaps) // 60} min"
+                )
+            results[symbol] = records_to_frame(records)
+
+        return results
+
+    def _fetch_chunk(self, symbol, timeframe_str, first_day, last_day, count):
+        """
+        Downloads one chunk. With a store the days are written to disk and
+        an empty array is returned; otherwise the newest `count` bars of the
+        chunk are returned. None means the download failed.
+        """
+        start = datetime.combine(first_day, datetime.min.time())
+        end = datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+
+        if self.store is not None:
+            writer = _DayWriter(self.store, symbol, timeframe_str, _day_span(first_day, last_day))
+            if not self._download(symbol, timeframe_str, start, end, writer.add):
+                return None
+            writer.finish()
+            return np.empty(0, dtype=CANDLE_DTYPE)
+
+        tail = CandleRingBuffer(max(1, count), CANDLE_DTYPE)
+        if not self._download(symbol, timeframe_str, start, end, tail.merge):
+            return None
+        return tail.view().copy()
+
+    # =========================
+    # LOCAL STORE
+    # =========================
+    def _get_candles_from_store(self, symbol, timeframe_str, start_day, end_day, count):
+        missing = self.store.missing_days(symbol, timeframe_str, start_day, end_day)
 
+        if missing:
+            # One download spanning the missing days; only those days are written
+            logger.info(f"{symbol} {timeframe_str}: downloading {len(missing)} missing day(s)")
+            writer = _DayWriter(self.store, symbol, timeframe_str, missing)
+            ok = self._download(
+                symbol,
+                timeframe_str,
+                datetime.combine(missing[0], datetime.min.time()),
+                datetime.combine(missing[-1] + timedelta(days=1), datetime.min.time()),
+                writer.add,
+            )
+            if ok:
+                writer.finish()
+            else:
+                logger.warning(f"{symbol} {timeframe_str}: download failed, serving stored candles only")
+
+        df = self.store.read_frame(symbol, timeframe_str, start_day, end_day)
+        if df.empty:
+            return None
+        return df.tail(count).reset_index(drop=True)
+
+    # =========================
+    # DOWNLOAD
+    # =========================
+    def _download(self, symbol, timeframe_str, start_date, end_date, on_chunk) -> bool:
+        """
+        Runs dukascopy-node and parses its CSV output straight from the pipe
+        in CHUNK_ROWS blocks. Each block is handed to on_chunk() as a sorted
+        CANDLE_DTYPE array, so memory use does not grow with the range.
+        """
         command = [
             "dukascopy-node",
             symbol,
@@ -37,19 +217,132 @@ class DukascopyDataFeed:
         ]
 
         try:
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            stdout, stderr = process.communicate()
+            # stderr goes to a temp file so a chatty process cannot block on a full pipe
+            with tempfile.TemporaryFile() as stderr_file:
+                process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file)
+                try:
+                    reader = pd.read_csv(process.stdout, chunksize=self.CHUNK_ROWS, dtype=self.PRICE_DTYPES)
+                    for chunk in reader:
+                        chunk.rename(columns={'timestamp': 'time', 'volume': 'tick_volume'}, inplace=True)
 
-            if process.returncode != 0:
-                logger.error(f"Error fetching data from Dukascopy: {stderr.decode()}")
-                return None
+                        # dukascopy-node emits millisecond timestamps; normalise to seconds
+                        if chunk['time'].iloc[0] > 1e11:
+                            chunk['time'] = chunk['time'] // 1000
+
+                        on_chunk(frame_to_records(chunk))
+                except pd.errors.EmptyDataError:
+                    pass
+                finally:
+                    process.stdout.close()
+                    returncode = process.wait()
 
-            from io import StringIO
-            data = StringIO(stdout.decode())
-            df = pd.read_csv(data)
-            df.rename(columns={'timestamp': 'time', 'volume': 'tick_volume'}, inplace=True)
-            return df.tail(count)
+                if returncode != 0:
+                    stderr_file.seek(0)
+                    logger.error(f"Error fetching data from Dukascopy: {stderr_file.read().decode(errors='replace')}")
+                    return False
+
+            return True
 
         except FileNotFoundError:
             logger.error("The 'dukascopy-node' command-line tool is not installed or not in the system's PATH.")
-            return None
+            return False
+
+
+# =========================
+# CHUNKING / GAP CHECK
+# =========================
+def _day_span(first_day, last_day):
+    return [first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+
+
+def _chunk_days(days, chunk_days):
+    """
+    Groups sorted days into contiguous runs of at most chunk_days,
+    returned as (first, last) pairs.
+    """
+    chunks = []
+    for day in days:
+        if chunks and (day - chunks[-1][1]).days == 1 and (day - chunks[-1][0]).days < chunk_days:
+            chunks[-1][1] = day
+        else:
+            chunks.append([day, day])
+    return [tuple(chunk) for chunk in chunks]
+
+
+def find_gaps(times, timeframe_in_seconds, tolerance_bars=3):
+    """
+    Returns (start, end) epoch-second pairs where consecutive bars are more
+    than tolerance_bars apart. The weekend market close (Friday to
+    Sunday/Monday) is not reported.
+    """
+    times = np.asarray(times, dtype=np.int64)
+    if len(times) < 2:
+        return []
+
+    idx = np.flatnonzero(np.diff(times) > timeframe_in_seconds * tolerance_bars)
+    gaps = []
+    for i in idx:
+        start, end = int(times[i]), int(times[i + 1])
+        # 1970-01-01 was a Thursday: weekday 0 = Monday
+        start_wd = (start // SECONDS_PER_DAY + 3) % 7
+        end_wd = (end // SECONDS_PER_DAY + 3) % 7
+        if start_wd in (4, 5) and end_wd in (6, 0) and end - start < 4 * SECONDS_PER_DAY:
+            continue
+        gaps.append((start, end))
+    return gaps
+
+
+class _DayWriter:
+    """
+    Collects streamed chunks for the missing days and writes each day to the
+    store once the stream has moved past it. At most one day is buffered.
+    Days from `today` (UTC) on are still forming and are stored as partial.
+    """
+
+    def __init__(self, store, symbol, timeframe_str, days, today=None):
+        self.store = store
+        self.symbol = symbol
+        self.timeframe_str = timeframe_str
+        self.pending_days = set(days)
+        self.today = today or datetime.now(timezone.utc).date()
+        self._day = None
+        self._parts = []
+
+    def add(self, records):
+        day_ids = records["time"] // SECONDS_PER_DAY
+        cuts = np.flatnonzero(np.diff(day_ids)) + 1
+        for part in np.split(records, cuts):
+            if len(part):
+                self._append_day(part)
+
+    def _append_day(self, records):
+        day = utc_day(records["time"][0])
+        if day != self._day:
+            self._flush()
+            self._day = day
+        self._parts.append(records)
+
+    def _flush(self):
+        if self._day is not None and self._day in self.pending_days:
+            self.store.write_days(
+                self.symbol,
+                self.timeframe_str,
+                records_to_frame(np.concatenate(self._parts)),
+                [self._day],
+                partial=self._day >= self.today,
+            )
+            self.pending_days.discard(self._day)
+        self._day = None
+        self._parts = []
+
+    def finish(self):
+        """
+        Writes the last buffered day and marks missing days without bars.
+        """
+        self._flush()
+        complete = sorted(day for day in self.pending_days if day < self.today)
+        forming = sorted(day for day in self.pending_days if day >= self.today)
+        if complete:
+            self.store.write_days(self.symbol, self.timeframe_str, None, complete)
+        if forming:
+            self.store.write_days(self.symbol, self.timeframe_str, None, forming, partial=True)
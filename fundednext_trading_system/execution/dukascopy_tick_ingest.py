@@ -0,0 +1,231 @@
+"""
+dukascopy_tick_ingest.py
+
+Offline ingestion of Dukascopy .bi5 tick files into a local bar archive.
+
+Input layout (as served by Dukascopy, month is zero-based):
+    <root>/<SYMBOL>/<YYYY>/<MM>/<DD>/<HH>h_ticks.bi5
+
+Each .bi5 file is an LZMA stream of 20-byte big-endian records:
+    ms offset from the hour (u4), ask (u4), bid (u4), ask volume (f4), bid volume (f4)
+Prices are integers in points; the point size is per instrument (see
+POINT_SIZES: 1e-5 for most FX pairs, 1e-3 for JPY pairs, gold and indices).
+
+Days are decoded in worker processes, resampled to every requested
+TIMEFRAME_MAP resolution with vectorised NumPy (bid OHLC, tick count,
+summed volume, mean spread in points) and written to a CandleStore.
+
+Usage:
+    python -m fundednext_trading_system.execution.dukascopy_tick_ingest <bi5_root> [SYMBOL ...]
+"""
+
+import lzma
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from fundednext_trading_system.config.settings import TICK_BAR_STORE_DIR
+from fundednext_trading_system.execution.candle_store import CANDLE_DTYPE, CandleStore, day_bounds
+from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed
+from fundednext_trading_system.monitoring.logger import logger
+
+BI5_RECORD = np.dtype([
+    ("ms", ">u4"),
+    ("ask", ">u4"),
+    ("bid", ">u4"),
+    ("ask_volume", ">f4"),
+    ("bid_volume", ">f4"),
+])
+
+TICK_DTYPE = np.dtype([
+    ("time_ms", "i8"),       # epoch milliseconds, UTC
+    ("ask", "f8"),
+    ("bid", "f8"),
+    ("spread", "f8"),        # points
+    ("volume", "f8"),
+])
+
+TICK_BAR_DTYPE = np.dtype(CANDLE_DTYPE.descr + [("volume", "f8"), ("spread", "f8")])
+
+
+# Dukascopy price factor per instrument. Symbols missing here are rejected
+# rather than guessed: a wrong factor shifts every bar by orders of magnitude.
+POINT_SIZES = {
+    "EURUSD": 0.00001,
+    "GBPUSD": 0.00001,
+    "USDJPY": 0.001,
+    "XAUUSD": 0.001,
+    "US30": 0.001,
+    "NDX100": 0.001,
+}
+
+
+def point_size(symbol: str) -> float:
+    try:
+        return POINT_SIZES[symbol.upper()]
+    except KeyError:
+        raise ValueError(f"No Dukascopy point size known for {symbol}") from None
+
+
+# =========================
+# DECODING
+# =========================
+def decode_bi5(data: bytes, hour_start: int, point: float) -> np.ndarray:
+    """
+    Decodes one hourly .bi5 payload. hour_start is the hour's epoch seconds.
+    """
+    if not data:
+        return np.empty(0, dtype=TICK_DTYPE)
+
+    raw = np.frombuffer(lzma.decompress(data), dtype=BI5_RECORD)
+    ticks = np.empty(len(raw), dtype=TICK_DTYPE)
+    ticks["time_ms"] = hour_start * 1000 + raw["ms"].astype(np.int64)
+    ticks["ask"] = raw["ask"] * point
+    ticks["bid"] = raw["bid"] * point
+    ticks["spread"] = raw["ask"].astype(np.int64) - raw["bid"].astype(np.int64)
+    ticks["volume"] = raw["ask_volume"].astype(np.float64) + raw["bid_volume"]
+    return ticks
+
+
+def day_dir(root: str, symbol: str, day: date) -> str:
+    return os.path.join(root, symbol, f"{day.year:04d}", f"{day.month - 1:02d}", f"{day.day:02d}")
+
+
+def load_day_ticks(root: str, symbol: str, day: date) -> np.ndarray:
+    """
+    Decodes and concatenates the hourly files of one day, in time order.
+    """
+    directory = day_dir(root, symbol, day)
+    point = point_size(symbol)
+    day_start = day_bounds(day)[0]
+
+    parts = []
+    for hour in range(24):
+        path = os.path.join(directory, f"{hour:02d}h_ticks.bi5")
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            ticks = decode_bi5(f.read(), day_start + hour * 3600, point)
+        if len(ticks):
+            parts.append(ticks)
+
+    if not parts:
+        return np.empty(0, dtype=TICK_DTYPE)
+    return np.concatenate(parts)
+
+
+# =========================
+# RESAMPLING
+# =========================
+def resample_ticks(ticks: np.ndarray, timeframe_in_seconds: int) -> np.ndarray:
+    """
+    Aggregates time-ordered ticks into bars labelled by their open time.
+    OHLC is built from bid prices; empty intervals produce no bar.
+    """
+    if len(ticks) == 0:
+        return np.empty(0, dtype=TICK_BAR_DTYPE)
+
+    bucket = (ticks["time_ms"] // 1000) // timeframe_in_seconds * timeframe_in_seconds
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket)) + 1))
+    counts = np.diff(np.append(starts, len(ticks)))
+    ends = starts + counts - 1
+    price = ticks["bid"]
+
+    bars = np.empty(len(starts), dtype=TICK_BAR_DTYPE)
+    bars["time"] = bucket[starts]
+    bars["open"] = price[starts]
+    bars["high"] = np.maximum.reduceat(price, starts)
+    bars["low"] = np.minimum.reduceat(price, starts)
+    bars["close"] = price[ends]
+    bars["tick_volume"] = counts
+    bars["volume"] = np.add.reduceat(ticks["volume"], starts)
+    bars["spread"] = np.add.reduceat(ticks["spread"], starts) / counts
+    return bars
+
+
+# =========================
+# INGESTION
+# =========================
+def discover_days(root: str, symbol: str) -> list:
+    days = []
+    symbol_dir = os.path.join(root, symbol)
+    if not os.path.isdir(symbol_dir):
+        return days
+
+    for year in sorted(os.listdir(symbol_dir)):
+        year_dir = os.path.join(symbol_dir, year)
+        if not year.isdigit() or not os.path.isdir(year_dir):
+            continue
+        for month in sorted(os.listdir(year_dir)):
+            month_dir = os.path.join(year_dir, month)
+            if not month.isdigit() or not os.path.isdir(month_dir):
+                continue
+            for day in sorted(os.listdir(month_dir)):
+                if day.isdigit():
+                    days.append(date(int(year), int(month) + 1, int(day)))
+    return days
+
+
+def ingest_day(root: str, symbol: str, day: date, timeframes, store_root: str) -> int:
+    """
+    Worker: decodes one day of ticks and stores its bars for every
+    timeframe. Returns the number of ticks processed.
+    """
+    ticks = load_day_ticks(root, symbol, day)
+    store = CandleStore(store_root, dtype=TICK_BAR_DTYPE)
+    for timeframe_in_seconds in timeframes:
+        bars = resample_ticks(ticks, timeframe_in_seconds)
+        store.write_days(symbol, DukascopyDataFeed.TIMEFRAME_MAP[timeframe_in_seconds], bars, [day])
+    return len(ticks)
+
+
+def ingest_directory(root: str, symbols=None, timeframes=None, store_root: str = TICK_BAR_STORE_DIR,
+                     max_workers: int = None) -> dict:
+    """
+    Ingests every day found under root for the given symbols (default:
+    all symbol directories) into the bar archive at store_root.
+    Returns {symbol: ticks ingested}.
+    """
+    symbols = symbols or sorted(
+        name for name in os.listdir(root) if os.path.isdir(os.path.join(root, name))
+    )
+    timeframes = tuple(timeframes or DukascopyDataFeed.TIMEFRAME_MAP)
+    unknown = [tf for tf in timeframes if tf not in DukascopyDataFeed.TIMEFRAME_MAP]
+    if unknown:
+        raise ValueError(f"Unsupported timeframe(s): {unknown}")
+    unknown = [symbol for symbol in symbols if symbol.upper() not in POINT_SIZES]
+    if unknown:
+        raise ValueError(f"Unsupported symbol(s): {unknown}")
+
+    jobs = [(symbol, day) for symbol in symbols for day in discover_days(root, symbol)]
+    logger.info(f"Tick ingest | {len(symbols)} symbol(s) | {len(jobs)} day(s) | timeframes={timeframes}")
+
+    totals = {symbol: 0 for symbol in symbols}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(ingest_day, root, symbol, day, timeframes, store_root): (symbol, day)
+            for symbol, day in jobs
+        }
+        for future in as_completed(futures):
+            symbol, day = futures[future]
+            try:
+                totals[symbol] += future.result()
+            except Exception as e:
+                logger.error(f"{symbol} {day}: tick ingest failed | {e}")
+
+    for symbol, count in totals.items():
+        logger.success(f"{symbol}: {count} ticks ingested")
+    return totals
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m fundednext_trading_system.execution.dukascopy_tick_ingest <bi5_root> [SYMBOL ...]")
+        sys.exit(1)
+
+    started = datetime.now(timezone.utc)
+    ingest_directory(sys.argv[1], symbols=sys.argv[2:] or None)
+    logger.info(f"Tick ingest finished in {(datetime.now(timezone.utc) - started).total_seconds():.1f}s")
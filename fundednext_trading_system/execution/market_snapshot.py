@@ -0,0 +1,96 @@
+"""
+market_snapshot.py
+
+Immutable per-cycle view of broker state.
+
+The orchestrator captures one MarketSnapshot per cycle (positions, ticks,
+symbol info, account info) and passes it to every stage, instead of each
+stage calling positions_get / symbol_info_tick / account_info itself.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional, Tuple
+
+from fundednext_trading_system.monitoring.performance_tracker import record_broker_call
+from fundednext_trading_system.trading_core import clock
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    taken_at: float
+    positions: Tuple[Any, ...]
+    ticks: Mapping[str, Any]
+    symbol_info: Mapping[str, Any]
+    account_info: Any
+    broker_calls: int = 0
+    _by_symbol: Mapping[str, Tuple[Any, ...]] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        by_symbol = {}
+        for pos in self.positions:
+            by_symbol.setdefault(pos.symbol, []).append(pos)
+        object.__setattr__(
+            self, "_by_symbol", MappingProxyType({s: tuple(p) for s, p in by_symbol.items()})
+        )
+
+    # =========================
+    # ACCESSORS
+    # =========================
+    def positions_for(self, symbol: str) -> Tuple[Any, ...]:
+        return self._by_symbol.get(symbol, ())
+
+    def tick(self, symbol: str):
+        return self.ticks.get(symbol)
+
+    def info(self, symbol: str):
+        return self.symbol_info.get(symbol)
+
+    @property
+    def equity(self) -> Optional[float]:
+        if self.account_info is None:
+            return None
+        return float(self.account_info.equity)
+
+    # =========================
+    # CAPTURE
+    # =========================
+    @classmethod
+    def capture(cls, broker, symbols: Iterable[str], previous: "MarketSnapshot" = None) -> "MarketSnapshot":
+        """
+        Fetches broker state once. Contract specs (symbol_info) do not
+        change intraday, so they are reused from `previous` when available.
+        """
+        symbols = list(symbols)
+        calls = 0
+
+        positions = broker.positions_get()
+        record_broker_call("positions_get")
+        calls += 1
+
+        ticks = {}
+        for symbol in symbols:
+            ticks[symbol] = broker.symbol_info_tick(symbol)
+        record_broker_call("symbol_info_tick", len(symbols))
+        calls += len(symbols)
+
+        info = dict(previous.symbol_info) if previous is not None else {}
+        missing = [s for s in symbols if info.get(s) is None]
+        for symbol in missing:
+            info[symbol] = broker.symbol_info(symbol)
+        if missing:
+            record_broker_call("symbol_info", len(missing))
+            calls += len(missing)
+
+        account = broker.account_info()
+        record_broker_call("account_info")
+        calls += 1
+
+        return cls(
+            taken_at=clock.timestamp(),
+            positions=tuple(positions) if positions else (),
+            ticks=MappingProxyType(ticks),
+            symbol_info=MappingProxyType(info),
+            account_info=account,
+            broker_calls=calls,
+        )
@@ -1,5 +1,12 @@
+import threading
+import numpy as np
 from fundednext_trading_system.config.settings import ENVIRONMENT
 from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.execution.candle_buffer import CandleRingBuffer
+from fundednext_trading_system.execution.candles import Candles
+from fundednext_trading_system.execution.bar_aggregator import MultiTimeframeAggregator
+from fundednext_trading_system.execution.market_snapshot import MarketSnapshot
+from fundednext_trading_system.monitoring.performance_tracker import record_broker_call
 
 if ENVIRONMENT == "production":
     try:
@@ -10,24 +17,131 @@ if ENVIRONMENT == "production":
 else:
     from fundednext_trading_system.MetaTrader5 import MetaTrader5 as mt5
 
+# Bars requested per incremental refresh; doubled until it overlaps the buffer
+INCREMENTAL_FETCH_BARS = 4
+
+
 class MT5DataFeed:
     def __init__(self):
         if not mt5 or not mt5.initialize():
             logger.error("❌ MT5 initialization failed")
             raise SystemExit("MT5 not initialized")
 
+        self._buffers = {}  # (symbol, timeframe) -> CandleRingBuffer
+        self._buffer_locks = {}
+        self._buffers_lock = threading.Lock()
+        self._aggregators = {}  # symbol -> MultiTimeframeAggregator (built from M1)
+        self.last_snapshot = None
+
     def get_candles(self, symbol, timeframe, count):
-        """Return recent candles as a DataFrame-like object."""
-        rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, count)
+        """Return recent candles as a DataFrame (copy; for offline tools)."""
+        candles = self.get_candles_compact(symbol, timeframe, count)
+        if candles is None:
+            return None
+        return candles.to_frame()
+
+    def get_candles_compact(self, symbol, timeframe, count):
+        """
+        Return recent candles as a Candles container over the ring buffer
+        view (no copy). Same validity as get_candle_view().
+        """
+        rates = self.get_candle_view(symbol, timeframe, count)
         if rates is None:
             return None
-        import pandas as pd
-        df = pd.DataFrame(rates)
-        return df
+        return Candles(rates)
+
+    def get_candle_view(self, symbol, timeframe, count):
+        """
+        Return the newest `count` bars as a zero-copy view of the symbol's
+        ring buffer (MT5 rates record array). The buffer is seeded once and
+        afterwards only bars newer than the last stored bar are fetched.
+        The view is valid until the next refresh of the same symbol.
+        """
+        key = (symbol, timeframe)
+        with self._buffers_lock:
+            lock = self._buffer_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            buffer = self._buffers.get(key)
+            if buffer is None or buffer.capacity < count:
+                rates = self._copy_rates(symbol, timeframe, count)
+                if rates is None:
+                    return None
+                buffer = CandleRingBuffer(count, rates.dtype)
+                buffer.seed(rates)
+                self._buffers[key] = buffer
+            elif not self._refresh(buffer, symbol, timeframe):
+                return None
+
+            return buffer.view(count)
+
+    def get_timeframe_candles(self, symbol, timeframe_in_seconds, count, include_forming=True):
+        """
+        Return M5/M15/H1/H4 bars aggregated locally from the symbol's M1
+        buffer, without a broker call. Call after the cycle's M1 fetch;
+        returns None until the M1 buffer exists. Same validity as
+        get_candle_view().
+        """
+        key = (symbol, mt5.TIMEFRAME_M1)
+        with self._buffers_lock:
+            lock = self._buffer_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            buffer = self._buffers.get(key)
+            if buffer is None or len(buffer) == 0:
+                return None
+
+            aggregator = self._aggregators.get(symbol)
+            if aggregator is None:
+                aggregator = self._aggregators[symbol] = MultiTimeframeAggregator()
+            aggregator.update(buffer.view())
+            return aggregator.candles(timeframe_in_seconds, count, include_forming)
+
+    def _refresh(self, buffer, symbol, timeframe) -> bool:
+        last_time = buffer.last_time
+        fetch = INCREMENTAL_FETCH_BARS
+
+        while True:
+            rates = self._copy_rates(symbol, timeframe, fetch)
+            if rates is None:
+                return False
+
+            # Block overlaps the stored bars (or the buffer would be fully replaced)
+            if int(rates["time"][0]) <= last_time or fetch >= buffer.capacity:
+                buffer.merge(rates)
+                return True
+
+            fetch = min(fetch * 2, buffer.capacity)
+
+    @staticmethod
+    def _copy_rates(symbol, timeframe, count):
+        rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, count)
+        record_broker_call("copy_rates_from_pos")
+        if rates is None or len(rates) == 0:
+            return None
+        return np.asarray(rates)
+
+    def latest_bar_time(self, symbol, timeframe):
+        """Return the open time of the newest bar, or None if unavailable."""
+        rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, 1)
+        record_broker_call("copy_rates_from_pos")
+        if rates is None or len(rates) == 0:
+            return None
+        return int(rates["time"][len(rates) - 1])
+
+    def capture_snapshot(self, symbols):
+        """
+        Fetch positions, ticks, symbol info and account info once for the
+        cycle. The latest snapshot is kept for readers such as the heartbeat.
+        """
+        snapshot = MarketSnapshot.capture(mt5, symbols, previous=self.last_snapshot)
+        self.last_snapshot = snapshot
+        return snapshot
 
     def get_positions(self, symbol):
         """Return a list of open positions for the symbol."""
         positions = mt5.positions_get(symbol=symbol)
+        record_broker_call("positions_get")
         return positions if positions else []
 
     def get_open_positions(self, symbol):
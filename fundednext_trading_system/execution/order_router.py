@@ -11,12 +11,12 @@ ABSOLUTE RULE:
 """
 
 from typing import Optional, Dict
-from datetime import datetime
 import uuid
 
 from fundednext_trading_system.trading_core.execution_flags import ExecutionFlags, ExecutionMode
 from fundednext_trading_system.execution.mt5_executor import MT5Executor
 from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core import clock
 
 # NOTE:
 # Actual MT5 bindings should be injected here
@@ -60,7 +60,7 @@ class OrderRouter:
         """
 
         order_id = self._generate_order_id()
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = clock.utcnow().isoformat()
 
         order_payload = {
             "order_id": order_id,
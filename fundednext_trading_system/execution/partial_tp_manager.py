@@ -1,6 +1,8 @@
 import MetaTrader5 as mt5
 import pandas as pd
 from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core.indicator_cache import indicator_cache
+from fundednext_trading_system.monitoring.performance_tracker import record_broker_call
 
 
 class PartialTPManager:
@@ -10,7 +12,10 @@ class PartialTPManager:
         close_percents=(0.3, 0.3),
         atr_period=14,
         atr_multiplier=1.2,
+        broker=None,
     ):
+        # MT5 module or any object with the same API (e.g. a backtest broker)
+        self.broker = broker if broker is not None else mt5
         self.tp_multipliers = tp_multipliers
         self.close_percents = close_percents
         self.atr_period = atr_period
@@ -18,21 +23,19 @@ class PartialTPManager:
         self.handled = set()  # (ticket, multiplier)
         self._active_symbols = set()
 
-    def _calculate_atr(self, df: pd.DataFrame) -> float:
-        high_low = df["high"] - df["low"]
-        high_close = (df["high"] - df["close"].shift()).abs()
-        low_close = (df["low"] - df["close"].shift()).abs()
+    def _calculate_atr(self, df: pd.DataFrame, symbol: str = None) -> float:
+        return indicator_cache.atr_value(df, self.atr_period, symbol)
 
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = tr.rolling(self.atr_period).mean().iloc[-1]
-        return atr if pd.notna(atr) else 0
-
-    def manage(self, symbol: str, df: pd.DataFrame):
-        positions = mt5.positions_get(symbol=symbol)
+    def manage(self, symbol: str, df: pd.DataFrame, snapshot=None):
+        if snapshot is not None:
+            positions = snapshot.positions_for(symbol)
+        else:
+            positions = self.broker.positions_get(symbol=symbol)
+            record_broker_call("positions_get")
         if not positions:
             return
 
-        atr = self._calculate_atr(df)
+        atr = self._calculate_atr(df, symbol)
         if atr <= 0:
             return
 
@@ -52,7 +55,7 @@ class PartialTPManager:
 
             rr = (
                 (current - entry) / risk
-                if pos.type == mt5.ORDER_TYPE_BUY
+                if pos.type == self.broker.ORDER_TYPE_BUY
                 else (entry - current) / risk
             )
 
@@ -64,16 +67,19 @@ class PartialTPManager:
                     close_volume = round(volume * pct, 2)
                     if close_volume <= 0:
                         continue
-                    self._partial_close(pos, close_volume)
+                    self._partial_close(pos, close_volume, snapshot)
                     self.handled.add(key)
 
-    def _partial_close(self, pos, volume):
-        close_type = mt5.ORDER_TYPE_SELL if pos.type == mt5.ORDER_TYPE_BUY else mt5.ORDER_TYPE_BUY
-        tick = mt5.symbol_info_tick(pos.symbol)
-        price = tick.bid if pos.type == mt5.ORDER_TYPE_BUY else tick.ask
+    def _partial_close(self, pos, volume, snapshot=None):
+        close_type = self.broker.ORDER_TYPE_SELL if pos.type == self.broker.ORDER_TYPE_BUY else self.broker.ORDER_TYPE_BUY
+        tick = snapshot.tick(pos.symbol) if snapshot is not None else None
+        if tick is None:
+            tick = self.broker.symbol_info_tick(pos.symbol)
+            record_broker_call("symbol_info_tick")
+        price = tick.bid if pos.type == self.broker.ORDER_TYPE_BUY else tick.ask
 
         request = {
-            "action": mt5.TRADE_ACTION_DEAL,
+            "action": self.broker.TRADE_ACTION_DEAL,
             "symbol": pos.symbol,
             "position": pos.ticket,
             "volume": volume,
@@ -84,8 +90,9 @@ class PartialTPManager:
             "comment": "PARTIAL TP",
         }
 
-        result = mt5.order_send(request)
-        if result.retcode == mt5.TRADE_RETCODE_DONE:
+        result = self.broker.order_send(request)
+        record_broker_call("order_send")
+        if result.retcode == self.broker.TRADE_RETCODE_DONE:
             logger.success(f"✅ PARTIAL TP executed | {pos.symbol} | vol={volume}")
         else:
             logger.error(f"❌ Partial TP failed | ticket={pos.ticket} | retcode={result.retcode}")
@@ -96,8 +103,12 @@ class PartialTPManager:
     def active_symbols(self):
         return list(self._active_symbols)
 
-    def status(self, symbol: str):
-        positions = mt5.positions_get(symbol=symbol)
+    def status(self, symbol: str, snapshot=None):
+        if snapshot is not None:
+            positions = snapshot.positions_for(symbol)
+        else:
+            positions = self.broker.positions_get(symbol=symbol)
+            record_broker_call("positions_get")
         if not positions:
             return "-"
         status_list = []
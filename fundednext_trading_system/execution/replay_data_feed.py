@@ -0,0 +1,187 @@
+"""
+replay_data_feed.py
+
+Historical replay source with the MT5DataFeed interface used by the
+orchestrator (get_candles_compact, get_candles, get_positions,
+capture_snapshot, latest_bar_time).
+
+Recorded bars (CandleStore day files or DataFrames) are held as one
+record array per symbol. The replay clock advances bar by bar over the
+merged timeline of all symbols; every read returns a zero-copy window
+ending at the current bar, so no future data is visible.
+
+Paper fills are kept on a BacktestBroker: each replayed bar triggers
+SL/TP and marks open positions to its close, and get_positions /
+capture_snapshot report those positions and the simulated account, so
+the risk and gatekeeper stages see the replay's own trades.
+"""
+
+import math
+from types import MappingProxyType
+
+import numpy as np
+
+from fundednext_trading_system.backtest.broker import BacktestBroker
+from fundednext_trading_system.config.settings import CURRENT_RULES
+from fundednext_trading_system.execution.candle_store import frame_to_records
+from fundednext_trading_system.execution.candles import Candles
+from fundednext_trading_system.execution.market_snapshot import MarketSnapshot
+from fundednext_trading_system.monitoring.logger import logger
+
+
+class ReplayDataFeed:
+    def __init__(self, bars: dict, broker: BacktestBroker = None):
+        """
+        bars:   {symbol: time-ordered record array with time/open/high/low/close}
+        broker: simulated broker holding the paper positions (default: one
+                funded with the current account balance)
+        """
+        self._bars = {symbol: records for symbol, records in bars.items() if len(records)}
+        self.broker = broker or BacktestBroker(CURRENT_RULES["ACCOUNT_BALANCE"])
+        self._cursor = {symbol: 0 for symbol in self._bars}   # bars visible per symbol
+        self.now = None
+        self.last_snapshot = None
+
+        logger.info(
+            "ReplayDataFeed ready | "
+            + " | ".join(f"{s}={len(r)} bars" for s, r in self._bars.items())
+        )
+
+    @classmethod
+    def from_store(cls, store, symbols, timeframe_str, start, end):
+        return cls({symbol: store.read_range(symbol, timeframe_str, start, end) for symbol in symbols})
+
+    @classmethod
+    def from_frames(cls, frames: dict):
+        return cls({symbol: frame_to_records(df) for symbol, df in frames.items()})
+
+    @property
+    def symbols(self):
+        return list(self._bars)
+
+    @property
+    def bars(self):
+        return MappingProxyType(self._bars)
+
+    # =========================
+    # REPLAY CLOCK
+    # =========================
+    def timeline(self):
+        """
+        Yields (bar_time, due_symbols) in time order, advancing the feed to
+        each bar close before yielding. Paper positions of the due symbols
+        are stopped out / marked against the new bar first.
+        """
+        if not self._bars:
+            return
+
+        all_times = np.unique(np.concatenate([r["time"] for r in self._bars.values()]))
+        positions = {s: 0 for s in self._bars}
+
+        for bar_time in all_times:
+            due = []
+            for symbol, records in self._bars.items():
+                pos = positions[symbol]
+                if pos < len(records) and records["time"][pos] == bar_time:
+                    positions[symbol] = pos + 1
+                    due.append(symbol)
+
+            self._cursor.update((s, positions[s]) for s in due)
+            self.now = int(bar_time)
+            for symbol in due:
+                bar = self._bars[symbol][positions[symbol] - 1]
+                self.broker.update_bar(
+                    symbol, self.now, float(bar["open"]), float(bar["high"]),
+                    float(bar["low"]), float(bar["close"]),
+                )
+            yield self.now, due
+
+    def total_bars(self) -> int:
+        return sum(len(r) for r in self._bars.values())
+
+    # =========================
+    # FEED INTERFACE
+    # =========================
+    def get_candles_compact(self, symbol, timeframe, count):
+        records = self._bars.get(symbol)
+        end = self._cursor.get(symbol, 0)
+        if records is None or end == 0:
+            return None
+        return Candles(records[max(0, end - count):end])
+
+    def get_candles(self, symbol, timeframe, count):
+        candles = self.get_candles_compact(symbol, timeframe, count)
+        return None if candles is None else candles.to_frame()
+
+    def latest_bar_time(self, symbol, timeframe):
+        end = self._cursor.get(symbol, 0)
+        return int(self._bars[symbol]["time"][end - 1]) if end else None
+
+    def get_positions(self, symbol):
+        return list(self.broker.positions_get(symbol=symbol))
+
+    def get_open_positions(self, symbol):
+        return self.get_positions(symbol)
+
+    def capture_snapshot(self, symbols):
+        """
+        Snapshot of the simulated account: open paper positions, ticks from
+        the replayed closes (ask = bid + modelled spread) and balance/equity.
+        """
+        ticks = {}
+        for symbol in symbols:
+            tick = self.broker.symbol_info_tick(symbol)
+            if tick is not None:
+                ticks[symbol] = tick
+
+        snapshot = MarketSnapshot(
+            taken_at=float(self.now),
+            positions=self.broker.positions_get(),
+            ticks=MappingProxyType(ticks),
+            symbol_info=MappingProxyType({}),
+            account_info=self.broker.account_info(),
+        )
+        self.last_snapshot = snapshot
+        return snapshot
+
+    # =========================
+    # PAPER FILLS
+    # =========================
+    def record_fill(self, order: dict):
+        """
+        Opens the paper position for a simulated OrderRouter result at the
+        current bar's close. stop_loss is a distance in pips, take_profit
+        a price (as sent by symbol_worker). Volume is floored to the lot step.
+
+        Returns the broker OrderResult, or None when the fill was refused.
+        """
+        broker = self.broker
+        symbol = order["symbol"]
+        tick = broker.symbol_info_tick(symbol)
+        if tick is None:
+            return None
+
+        volume = math.floor(round(order["volume"] / broker.VOLUME_STEP, 6)) * broker.VOLUME_STEP
+        buying = order["order_type"] == "buy"
+        direction = 1 if buying else -1
+        entry = tick.ask if buying else tick.bid
+        stop_loss = order.get("stop_loss")
+        sl = entry - direction * stop_loss * broker.spec(symbol).pip_size if stop_loss else 0.0
+
+        result = broker.order_send({
+            "action": broker.TRADE_ACTION_DEAL,
+            "symbol": symbol,
+            "volume": round(volume, 2),
+            "type": broker.ORDER_TYPE_BUY if buying else broker.ORDER_TYPE_SELL,
+            "price": entry,
+            "sl": sl,
+            "tp": order.get("take_profit") or 0.0,
+            "comment": order.get("comment", ""),
+        })
+        if result.retcode != broker.TRADE_RETCODE_DONE:
+            logger.warning(f"{symbol}: paper fill refused | {result.comment}")
+            return None
+        return result
+
+    def shutdown(self):
+        pass
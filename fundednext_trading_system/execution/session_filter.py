@@ -1,5 +1,6 @@
-from datetime import datetime, time as dt_time
+from datetime import time as dt_time
 from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core import clock
 
 
 class SessionFilter:
@@ -18,7 +19,7 @@ class SessionFilter:
         return start <= now <= end
 
     def is_trading_allowed(self) -> bool:
-        now_utc = datetime.utcnow().time()
+        now_utc = clock.utcnow().time()
 
         in_london = self._in_range(
             now_utc, *self.LONDON_SESSION
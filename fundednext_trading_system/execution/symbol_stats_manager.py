@@ -2,7 +2,8 @@
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import timedelta
+from fundednext_trading_system.trading_core import clock
 
 class SymbolStatsManager:
     """
@@ -34,7 +35,7 @@ class SymbolStatsManager:
             self.stats[symbol]["wins"] += 1
         else:
             self.stats[symbol]["losses"] += 1
-        self.stats[symbol]["last_trade"] = datetime.utcnow()
+        self.stats[symbol]["last_trade"] = clock.utcnow()
 
     def detect_regime(self, symbol: str, df: pd.DataFrame) -> str:
         """
@@ -66,7 +67,7 @@ class SymbolStatsManager:
         last = self.stats[symbol]["last_trade"]
         if last is None:
             return True
-        return datetime.utcnow() - last >= self.cooldown
+        return clock.utcnow() - last >= self.cooldown
 
     def get_stats(self, symbol: str):
         self.init_symbol(symbol)
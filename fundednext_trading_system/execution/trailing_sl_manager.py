@@ -1,6 +1,8 @@
 import MetaTrader5 as mt5
 import pandas as pd
 from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core.indicator_cache import indicator_cache
+from fundednext_trading_system.monitoring.performance_tracker import record_broker_call
 
 
 class TrailingSLManager:
@@ -10,35 +12,39 @@ class TrailingSLManager:
         trail_start_r=1.5,
         atr_period=14,
         atr_multiplier=1.2,
+        broker=None,
     ):
+        # MT5 module or any object with the same API (e.g. a backtest broker)
+        self.broker = broker if broker is not None else mt5
         self.breakeven_r = breakeven_r
         self.trail_start_r = trail_start_r
         self.atr_period = atr_period
         self.atr_multiplier = atr_multiplier
         self._active_symbols = set()
 
-    def _calculate_atr(self, df: pd.DataFrame) -> float:
+    def _calculate_atr(self, df: pd.DataFrame, symbol: str = None) -> float:
         """Calculate ATR from high, low, close data"""
-        high_low = df["high"] - df["low"]
-        high_close = (df["high"] - df["close"].shift()).abs()
-        low_close = (df["low"] - df["close"].shift()).abs()
-
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = tr.rolling(self.atr_period).mean().iloc[-1]
-        return atr if pd.notna(atr) else 0
-
-    def manage(self, symbol: str, df: pd.DataFrame):
-        positions = mt5.positions_get(symbol=symbol)
+        return indicator_cache.atr_value(df, self.atr_period, symbol)
+
+    def manage(self, symbol: str, df: pd.DataFrame, snapshot=None):
+        if snapshot is not None:
+            positions = snapshot.positions_for(symbol)
+        else:
+            positions = self.broker.positions_get(symbol=symbol)
+            record_broker_call("positions_get")
         if not positions:
             return
 
-        atr = self._calculate_atr(df)
+        atr = self._calculate_atr(df, symbol)
         if atr <= 0:
             return
 
         self._active_symbols.add(symbol)
 
-        tick = mt5.symbol_info_tick(symbol)
+        tick = snapshot.tick(symbol) if snapshot is not None else None
+        if tick is None:
+            tick = self.broker.symbol_info_tick(symbol)
+            record_broker_call("symbol_info_tick")
         if tick is None:
             return
 
@@ -49,7 +55,7 @@ class TrailingSLManager:
             direction = pos.type
 
             # Current price based on direction
-            current_price = tick.bid if direction == mt5.ORDER_TYPE_BUY else tick.ask
+            current_price = tick.bid if direction == self.broker.ORDER_TYPE_BUY else tick.ask
 
             # Current risk
             risk = abs(entry - sl) if sl > 0 else atr * self.atr_multiplier
@@ -59,7 +65,7 @@ class TrailingSLManager:
             # Current R-multiple
             r_multiple = (
                 (current_price - entry) / risk
-                if direction == mt5.ORDER_TYPE_BUY
+                if direction == self.broker.ORDER_TYPE_BUY
                 else (entry - current_price) / risk
             )
 
@@ -74,20 +80,20 @@ class TrailingSLManager:
             # TRAILING AFTER trail_start_r
             # -------------------------
             if r_multiple >= self.trail_start_r:
-                if direction == mt5.ORDER_TYPE_BUY:
+                if direction == self.broker.ORDER_TYPE_BUY:
                     new_sl = current_price - (atr * self.atr_multiplier)
                 else:
                     new_sl = current_price + (atr * self.atr_multiplier)
 
             # Prevent SL worsening
-            if direction == mt5.ORDER_TYPE_BUY and new_sl <= sl:
+            if direction == self.broker.ORDER_TYPE_BUY and new_sl <= sl:
                 continue
-            if direction == mt5.ORDER_TYPE_SELL and new_sl >= sl:
+            if direction == self.broker.ORDER_TYPE_SELL and new_sl >= sl:
                 continue
 
             # Prepare request
             request = {
-                "action": mt5.TRADE_ACTION_SLTP,
+                "action": self.broker.TRADE_ACTION_SLTP,
                 "position": pos.ticket,
                 "sl": round(new_sl, 5),
                 "tp": tp,
@@ -97,8 +103,9 @@ class TrailingSLManager:
             }
 
             # Send request
-            result = mt5.order_send(request)
-            if result.retcode == mt5.TRADE_RETCODE_DONE:
+            result = self.broker.order_send(request)
+            record_broker_call("order_send")
+            if result.retcode == self.broker.TRADE_RETCODE_DONE:
                 logger.success(
                     f"🔁 Trailing SL updated | {symbol} | ticket={pos.ticket} | new_sl={new_sl:.5f}"
                 )
@@ -113,8 +120,12 @@ class TrailingSLManager:
     def active_symbols(self):
         return list(self._active_symbols)
 
-    def current_sl(self, symbol: str):
-        positions = mt5.positions_get(symbol=symbol)
+    def current_sl(self, symbol: str, snapshot=None):
+        if snapshot is not None:
+            positions = snapshot.positions_for(symbol)
+        else:
+            positions = self.broker.positions_get(symbol=symbol)
+            record_broker_call("positions_get")
         if not positions:
             return "-"
         sl_list = []
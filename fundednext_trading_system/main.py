@@ -1,6 +1,5 @@
 import time
 import threading
-import pandas as pd
 import pickle
 import os
 import sys
@@ -31,6 +30,7 @@ from fundednext_trading_system.monitoring.equity_kill_switch import is_locked
 from fundednext_trading_system.monitoring.startup_validator import StartupValidator
 from fundednext_trading_system.monitoring.heartbeat import print_status as heartbeat_console
 from fundednext_trading_system.monitoring.discord_logger import broadcast, send_discord_update
+from fundednext_trading_system.monitoring.performance_tracker import total_broker_calls, record_cycle_broker_calls
 
 from fundednext_trading_system.trading_core.risk_manager import RiskManager
 from fundednext_trading_system.trading_core.execution_flags import ExecutionFlags, AccountPhase, ExecutionMode, MLMode
@@ -38,23 +38,29 @@ from fundednext_trading_system.trading_core.trade_gatekeeper import TradeGatekee
 from fundednext_trading_system.trading_core.ml_router import MLRouter
 from fundednext_trading_system.trading_core.session_controller import SessionController
 from fundednext_trading_system.trading_core.signal_engine import SignalEngine
+from fundednext_trading_system.trading_core.symbol_worker_pool import SymbolWorkerPool
+from fundednext_trading_system.trading_core.bar_scheduler import BarCloseScheduler
+from fundednext_trading_system.trading_core.indicator_cache import indicator_cache
 
 from fundednext_trading_system.execution.mt5_data_feed import MT5DataFeed
+from fundednext_trading_system.execution.market_snapshot import MarketSnapshot
 from fundednext_trading_system.execution.order_router import OrderRouter
 from fundednext_trading_system.execution.trailing_sl_manager import TrailingSLManager
 from fundednext_trading_system.execution.partial_tp_manager import PartialTPManager
 
 from fundednext_trading_system.ml.retraining.retrain_model import retrain_model_for_symbol
 from fundednext_trading_system.ml.model_loader import load_model_for_symbol
+from fundednext_trading_system.ml.training_service import BackgroundTrainingService
 
 from fundednext_trading_system.config.settings import (
     TIMEFRAME_BARS,
-    LOOP_SLEEP_SECONDS,
-    PER_SYMBOL_THROTTLE,
+    BAR_POLL_SECONDS,
     ATR_PERIOD,
     ATR_SL_MULTIPLIER,
     ATR_TP_MULTIPLIERS,
     TP_CLOSE_PERCENTS,
+    REGIME_MA_PERIOD,
+    REGIME_SLOPE_THRESHOLD,
     DRY_RUN,
     REPLAY_MODE,
     STATS_PATH,
@@ -102,15 +108,20 @@ def wait_for_market_ready(max_wait_seconds: int = 600):
 # =========================================================
 # REGIME DETECTION
 # =========================================================
-def detect_market_regime(df: pd.DataFrame, ma_period: int = 50) -> str:
+def detect_market_regime(
+    df,
+    ma_period: int = REGIME_MA_PERIOD,
+    symbol: str = None,
+    threshold: float = REGIME_SLOPE_THRESHOLD,
+) -> str:
     if len(df) < ma_period + 2:
         return "range"
 
-    ma = df["close"].rolling(ma_period).mean()
-    slope = ma.iloc[-1] - ma.iloc[-2]
-    threshold = df["close"].std() * 0.1
-
-    return "trend" if abs(slope) > threshold else "range"
+    slope = (
+        indicator_cache.sma_value(df, ma_period, symbol)
+        - indicator_cache.sma_value(df, ma_period, symbol, offset=1)
+    )
+    return "trend" if abs(slope) > indicator_cache.std(df, symbol) * threshold else "range"
 
 # =========================================================
 # SYMBOL WORKER
@@ -127,52 +138,68 @@ def symbol_worker(
     trailing_sl_manager: TrailingSLManager,
     execution_flags: ExecutionFlags,
     stats_manager: SymbolStatsManager,
-):
-    df = feed.get_candles(symbol, mt5.TIMEFRAME_M1, TIMEFRAME_BARS)
+    training_service: BackgroundTrainingService = None,
+    snapshot: MarketSnapshot = None,
+    dry_run: bool = DRY_RUN,
+) -> str:
+    """
+    Runs one decision cycle for a symbol and returns its outcome label
+    (e.g. "no_signal", "risk_rejected", "simulated"), used by the replay
+    engine for decision counts.
+    """
+    # Zero-copy candle container; converted to a DataFrame only for training
+    df = feed.get_candles_compact(symbol, mt5.TIMEFRAME_M1, TIMEFRAME_BARS)
     if df is None or df.empty or len(df) < 60:
         logger.debug(f"{symbol}: insufficient candle data")
-        return
+        return "no_data"
 
     # Load model for the symbol
-    ml_router.model = load_model_for_symbol(symbol)
-    if not ml_router.model:
-        return # Skip if model not found
+    model = load_model_for_symbol(symbol)
+    if not model:
+        return "no_model" # Skip if model not found
+
+    # In TRAINING mode the background trainer owns the slot once seeded
+    if training_service is None or ml_router.get_model(symbol) is None:
+        ml_router.set_model(symbol, model)
 
     # -----------------------------------------------------
     # Manage open positions
     # -----------------------------------------------------
-    partial_tp_manager.manage(symbol, df)
-    trailing_sl_manager.manage(symbol, df)
+    partial_tp_manager.manage(symbol, df, snapshot)
+    trailing_sl_manager.manage(symbol, df, snapshot)
 
     # -----------------------------------------------------
     # Regime detection
     # -----------------------------------------------------
-    regime = detect_market_regime(df)
+    regime = detect_market_regime(df, symbol=symbol)
     stats_manager.stats[symbol]["regime"] = regime
 
     # -----------------------------------------------------
-    # Feature prep + ML inference
+    # Feature prep + ML inference (latest row only)
     # -----------------------------------------------------
-    features = signal_engine.prepare_features(df, regime=regime)
-
-    # Align dataframes to ensure features and target are correctly matched
-    features, df = features.align(df, join='inner', axis=0)
-
-    ml_signal = ml_router.infer(features)
+    latest_features = signal_engine.prepare_latest_features(df, regime=regime, symbol=symbol)
+    ml_signal = ml_router.infer(latest_features, symbol)
 
     # Confidence gating
     if ml_signal and ml_signal[1] < 0.7:
         ml_signal = None  # Use rule-based signal if confidence is low
 
-    if execution_flags.ml_mode == MLMode.TRAINING:
-        ml_router.update_model(features, df)
+    if training_service is not None:
+        frame = df.to_frame()
+        features = signal_engine.prepare_features(frame, regime=regime, symbol=symbol)
+
+        # Align dataframes to ensure features and target are correctly matched
+        features, frame = features.align(frame, join='inner', axis=0)
+
+        # Fit runs on the training process pool; never blocks this worker
+        training_service.submit(symbol, features, frame)
 
     # -----------------------------------------------------
     # Rule-based fallback ALWAYS allowed
     # -----------------------------------------------------
     signal = ml_signal or signal_engine.generate_signal(df, symbol, regime=regime)
     if not signal:
-        return
+        return "no_signal"
 
     side, score = signal
     logger.info(f"SIGNAL | {symbol} | {side.upper()} | score={score:.2f} | regime={regime}")
@@ -180,29 +207,29 @@ def symbol_worker(
     # -----------------------------------------------------
     # Risk & position sizing
     # -----------------------------------------------------
-    atr = trailing_sl_manager._calculate_atr(df)
+    atr = trailing_sl_manager._calculate_atr(df, symbol)
     stop_loss_pips = max(1, round(atr * ATR_SL_MULTIPLIER))
 
     volume = risk_manager.position_size(symbol, stop_loss_pips)
     risk_amount = stop_loss_pips * 10 * volume
 
-    open_positions = feed.get_positions()
+    open_positions = snapshot.positions if snapshot is not None else feed.get_positions(symbol)
 
     if volume <= 0 or not risk_manager.can_open_trade(risk_amount, symbol, open_positions):
-        return
+        return "risk_rejected"
 
     allowed, reason = trade_gatekeeper.authorize_trade(symbol, risk_amount)
     if not allowed:
         logger.warning(f"{symbol}: trade blocked — {reason}")
-        return
+        return "gatekeeper_blocked"
 
     # -----------------------------------------------------
-    # Dry-run / Replay
+    # Dry-run
     # -----------------------------------------------------
-    if DRY_RUN or REPLAY_MODE:
+    if dry_run:
         logger.info(f"{symbol}: DRY-RUN | {side.upper()} | vol={volume}")
         stats_manager.stats[symbol]["trades"] += 1
-        return
+        return "dry_run"
 
     # -----------------------------------------------------
     # Execute order
@@ -216,19 +243,22 @@ def symbol_worker(
         comment="FundedNext Live Orchestrator",
     )
 
-    if order.get("status") in ("filled", "simulated"):
+    status = order.get("status")
+    if status in ("filled", "simulated"):
         logger.success(f"ORDER EXECUTED | {symbol} | {side.upper()} | vol={volume}")
         stats_manager.stats[symbol]["trades"] += 1
 
-        # Check for retraining
-        if stats_manager.stats[symbol]["trades"] % RETRAIN_AFTER_N_TRADES == 0:
+        # Check for retraining (live fills only; paper/replay fills never retrain)
+        if status == "filled" and stats_manager.stats[symbol]["trades"] % RETRAIN_AFTER_N_TRADES == 0:
             logger.info(f"Triggering retraining for {symbol} after {stats_manager.stats[symbol]['trades']} trades.")
 
             # Run retraining in a separate process to avoid blocking
             script_path = os.path.join(current_dir, "ml", "retraining", "retrain_model.py")
             subprocess.Popen([sys.executable, script_path, symbol])
-    else:
-        logger.error(f"{symbol}: order failed | {order}")
+        return status
+
+    logger.error(f"{symbol}: order failed | {order}")
+    return "order_failed"
 
 # =========================================================
 # HEARTBEAT WORKER
@@ -292,6 +322,7 @@ def start_master_orchestrator():
 
     feed = MT5DataFeed()
     signal_engine = SignalEngine(confidence_threshold=0.7)
+    signal_engine.news_sentiment.start_background_refresh(ALLOWED_SYMBOLS)
     order_router = OrderRouter(execution_flags)
 
     partial_tp_manager = PartialTPManager(
@@ -329,46 +360,67 @@ def start_master_orchestrator():
         daemon=True,
     ).start()
 
+    training_service = None
+    if execution_flags.ml_mode == MLMode.TRAINING:
+        training_service = BackgroundTrainingService(ml_router)
+
+    worker_pool = SymbolWorkerPool(ALLOWED_SYMBOLS)
+    worker_pool.start()
+
+    bar_scheduler = BarCloseScheduler(
+        feed,
+        ALLOWED_SYMBOLS,
+        mt5.TIMEFRAME_M1,
+        poll_seconds=BAR_POLL_SECONDS,
+    )
+
     try:
         while True:
             session_controller.daily_maintenance()
 
-            if is_locked() or not check_profit_lock() or risk_manager.hard_stop_triggered():
+            # Dispatch only symbols whose M1 bar just closed
+            due_symbols = bar_scheduler.wait_for_new_bars()
+            calls_before = total_broker_calls()
+
+            # One broker round-trip per cycle; every stage reads from it
+            snapshot = feed.capture_snapshot(ALLOWED_SYMBOLS)
+
+            if is_locked() or not check_profit_lock(snapshot.account_info) or risk_manager.hard_stop_triggered():
                 logger.warning("⛔ Trading paused — risk controls active")
                 time.sleep(300)
                 continue
 
-            threads = []
-            for symbol in ALLOWED_SYMBOLS:
-                t = threading.Thread(
-                    target=symbol_worker,
-                    args=(
-                        symbol,
-                        feed,
-                        signal_engine,
-                        ml_router,
-                        risk_manager,
-                        trade_gatekeeper,
-                        order_router,
-                        partial_tp_manager,
-                        trailing_sl_manager,
-                        execution_flags,
-                        stats_manager,
-                    ),
-                )
-                t.start()
-                threads.append(t)
-                time.sleep(PER_SYMBOL_THROTTLE)
-
-            for t in threads:
-                t.join()
-
-            time.sleep(LOOP_SLEEP_SECONDS)
+            cycle_times = worker_pool.run_cycle(
+                symbol_worker,
+                feed,
+                signal_engine,
+                ml_router,
+                risk_manager,
+                trade_gatekeeper,
+                order_router,
+                partial_tp_manager,
+                trailing_sl_manager,
+                execution_flags,
+                stats_manager,
+                training_service=training_service,
+                snapshot=snapshot,
+                symbols=due_symbols,
+            )
+            cycle_calls = total_broker_calls() - calls_before
+            record_cycle_broker_calls(cycle_calls)
+            logger.debug(
+                "Cycle times | "
+                + " | ".join(f"{s}={t * 1000:.0f}ms" for s, t in cycle_times.items())
+                + f" | broker_calls={cycle_calls}"
+            )
 
     except KeyboardInterrupt:
         logger.warning("🛑 Manual shutdown")
 
     finally:
+        worker_pool.shutdown()
+        if training_service is not None:
+            training_service.shutdown()
         feed.shutdown()
         logger.info("Orchestrator shutdown complete")
 
@@ -376,4 +428,8 @@ def start_master_orchestrator():
 # ENTRY POINT
 # =========================================================
 if __name__ == "__main__":
-    start_master_orchestrator()
+    if REPLAY_MODE:
+        from fundednext_trading_system.replay import replay_main
+        replay_main(sys.argv[1:])
+    else:
+        start_master_orchestrator()
@@ -5,10 +5,15 @@ REQUIRED_CLEAN_SESSIONS = 5   # 🔒 SAFE DEFAULT
 
 
 class AutoPromotionGate:
-    def __init__(self, symbol, tracker, shadow_model_path):
+    def __init__(self, symbol, tracker, shadow_model_path, walk_forward_report=None):
+        """
+        walk_forward_report: optional walk_forward_validate() result for the
+        shadow model; when given, promotion also requires it to have passed.
+        """
         self.symbol = symbol
         self.tracker = tracker
         self.shadow_model_path = shadow_model_path
+        self.walk_forward_report = walk_forward_report
 
     def evaluate(self):
         clean_sessions = self.tracker.clean_sessions()
@@ -20,6 +25,16 @@ class AutoPromotionGate:
             )
             return False
 
+        report = self.walk_forward_report
+        if report is not None and not report.get("passed"):
+            stability = report.get("stability", {})
+            logger.warning(
+                f"{self.symbol}: Shadow model blocked by walk-forward validation "
+                f"(positive folds {stability.get('positive_folds', 0):.0%} over "
+                f"{stability.get('scored_folds', 0)}/{stability.get('folds', 0)} folds)"
+            )
+            return False
+
         logger.critical(
             f"🚀 AUTO-PROMOTION TRIGGERED | {self.symbol} | "
             f"{clean_sessions} clean sessions"
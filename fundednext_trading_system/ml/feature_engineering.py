@@ -5,12 +5,16 @@ from loguru import logger
 
 
 class FeatureEngineer:
-    def compute_features(self, df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    def compute_features(self, df: pd.DataFrame, symbol: str, overrides: dict = None) -> pd.DataFrame:
+        """
+        overrides: optional SYMBOLS_CONFIG values to use instead of the
+        configured ones (e.g. ema_fast / rsi_period in a parameter sweep).
+        """
         if symbol not in SYMBOLS_CONFIG:
             logger.error(f"No symbol config found for {symbol}")
             return pd.DataFrame()
 
-        cfg = SYMBOLS_CONFIG[symbol]
+        cfg = {**SYMBOLS_CONFIG[symbol], **(overrides or {})}
         df = df.copy()
 
         # EMA
@@ -1,6 +1,8 @@
-
 import os
 import pickle
+import hashlib
+import threading
+from collections import namedtuple
 from loguru import logger
 import sys
 
@@ -9,9 +11,109 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from fundednext_trading_system.config.settings import MODELS_DIR
 
+_CacheEntry = namedtuple("_CacheEntry", ["model", "path", "mtime_ns", "size", "digest"])
+
+
+class ModelCache:
+    """
+    Process-wide cache of unpickled models keyed by symbol.
+
+    A cached model is returned as long as the file's mtime and size are
+    unchanged. When they change, the file is re-hashed and only unpickled
+    if the content hash differs. New entries are swapped in atomically, so
+    readers always see either the old or the new model, never a partial one.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._reload_locks = {}       # symbol -> lock; reloads of different symbols never wait on each other
+        self._locks_guard = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, symbol: str, model_path: str):
+        try:
+            stat = os.stat(model_path)
+        except FileNotFoundError:
+            self._entries.pop(symbol, None)
+            return None
+
+        entry = self._entries.get(symbol)
+        if self._is_current(entry, model_path, stat):
+            self._count(hit=True)
+            return entry.model
+
+        with self._reload_lock(symbol):
+            # Another worker may have reloaded while we waited
+            entry = self._entries.get(symbol)
+            if self._is_current(entry, model_path, stat):
+                self._count(hit=True)
+                return entry.model
+
+            with open(model_path, "rb") as model_file:
+                payload = model_file.read()
+            digest = hashlib.sha256(payload).hexdigest()
+
+            if entry is not None and entry.path == model_path and entry.digest == digest:
+                # Touched but unchanged — keep the loaded model
+                self._entries[symbol] = entry._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                self._count(hit=True)
+                return entry.model
+
+            model = pickle.loads(payload)
+            self._entries[symbol] = _CacheEntry(model, model_path, stat.st_mtime_ns, stat.st_size, digest)
+            self._count(hit=False)
+            logger.info(f"Successfully loaded model for {symbol} from {model_path}.")
+            return model
+
+    def _reload_lock(self, symbol: str) -> threading.Lock:
+        lock = self._reload_locks.get(symbol)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._reload_locks.setdefault(symbol, threading.Lock())
+        return lock
+
+    def invalidate(self, symbol: str = None):
+        if symbol is None:
+            self._entries = {}
+        else:
+            self._entries.pop(symbol, None)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "cached_symbols": sorted(self._entries),
+        }
+
+    @staticmethod
+    def _is_current(entry, model_path, stat) -> bool:
+        return (
+            entry is not None
+            and entry.path == model_path
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+        )
+
+    def _count(self, hit: bool):
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+model_cache = ModelCache()
+
+
 def load_model_for_symbol(symbol: str):
     """
     Loads a pre-trained model for a specific symbol.
+    Served from the process-wide cache; the file is only unpickled again
+    when it changes on disk.
     """
     model_path = os.path.join(MODELS_DIR, f"model_{symbol}.pkl")
 
@@ -20,10 +122,14 @@ def load_model_for_symbol(symbol: str):
         return None
 
     try:
-        with open(model_path, "rb") as model_file:
-            model = pickle.load(model_file)
-        logger.info(f"Successfully loaded model for {symbol} from {model_path}.")
-        return model
+        return model_cache.get(symbol, model_path)
     except Exception as e:
         logger.error(f"Failed to load the model for {symbol} from {model_path}: {e}")
         return None
+
+
+def model_cache_stats() -> dict:
+    """
+    Hit/miss counters of the process-wide model cache.
+    """
+    return model_cache.stats()
@@ -0,0 +1,355 @@
+"""
+streaming_indicators.py
+
+Stateful O(1)-per-bar versions of the indicators behind the live model's
+features (SignalEngine.prepare_features):
+
+- StreamingSMA         -> Series.rolling(period).mean()          (ma5/20/50)
+- StreamingMomentum    -> Series - Series.shift(lag)             (momentum5/20)
+- StreamingRollingStd  -> Series.rolling(period).std()           (volatility)
+
+StreamingSignalFeatures combines them into the feature row the model
+scores; SignalEngine.prepare_latest_features keeps one per symbol, commits
+each bar once it has closed and peeks the forming bar.
+
+update() commits a closed bar and returns the new value. peek() returns the
+value the indicator would have if the given (still forming) bar were
+committed, without changing state. state()/from_state() checkpoint an
+indicator to plain JSON-serialisable data so a restart needs no warm-up.
+"""
+
+import json
+import math
+import os
+from collections import deque
+
+NAN = float("nan")
+
+
+# =========================
+# ROLLING MEAN
+# =========================
+class StreamingSMA:
+    """
+    Fixed-window mean with Kahan-compensated running sum (as pandas does),
+    so long streams do not drift.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window = deque()
+        self.sum = 0.0
+        self.compensation = 0.0
+        self.value = NAN
+
+    def _add(self, total, comp, x):
+        y = x - comp
+        t = total + y
+        return t, (t - total) - y
+
+    def _next(self, x: float):
+        total, comp = self.sum, self.compensation
+        if len(self.window) == self.period:
+            total, comp = self._add(total, comp, -self.window[0])
+            n = self.period
+        else:
+            n = len(self.window) + 1
+        total, comp = self._add(total, comp, x)
+        value = total / n if n == self.period else NAN
+        return total, comp, value
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        if math.isnan(x):
+            # A missing observation restarts the window (min_periods=period)
+            self.window.clear()
+            self.sum = 0.0
+            self.compensation = 0.0
+            self.value = NAN
+            return self.value
+
+        self.sum, self.compensation, self.value = self._next(x)
+        self.window.append(x)
+        if len(self.window) > self.period:
+            self.window.popleft()
+        return self.value
+
+    def peek(self, x: float) -> float:
+        x = float(x)
+        if math.isnan(x):
+            return NAN
+        return self._next(x)[2]
+
+    def state(self) -> dict:
+        return {
+            "period": self.period,
+            "window": list(self.window),
+            "sum": self.sum,
+            "compensation": self.compensation,
+            "value": self.value,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamingSMA":
+        obj = cls(state["period"])
+        obj.window = deque(state["window"])
+        obj.sum = state["sum"]
+        obj.compensation = state["compensation"]
+        obj.value = state["value"]
+        return obj
+
+
+# =========================
+# ROLLING STD
+# =========================
+class StreamingRollingStd:
+    """
+    Fixed-window sample standard deviation using the same online
+    add/remove variance updates as pandas' rolling var.
+    """
+
+    def __init__(self, period: int, ddof: int = 1):
+        self.period = period
+        self.ddof = ddof
+        self.window = deque()
+        self.mean = 0.0
+        self.ssqdm = 0.0
+        self.value = NAN
+
+    @staticmethod
+    def _add(nobs, mean, ssqdm, x):
+        nobs += 1
+        delta = x - mean
+        mean += delta / nobs
+        ssqdm += ((nobs - 1) * delta ** 2) / nobs
+        return nobs, mean, ssqdm
+
+    @staticmethod
+    def _remove(nobs, mean, ssqdm, x):
+        nobs -= 1
+        if nobs == 0:
+            return 0, 0.0, 0.0
+        delta = x - mean
+        mean -= delta / nobs
+        ssqdm -= ((nobs + 1) * delta ** 2) / nobs
+        return nobs, mean, ssqdm
+
+    def _next(self, x: float):
+        nobs, mean, ssqdm = len(self.window), self.mean, self.ssqdm
+        if nobs == self.period:
+            nobs, mean, ssqdm = self._remove(nobs, mean, ssqdm, self.window[0])
+        nobs, mean, ssqdm = self._add(nobs, mean, ssqdm, x)
+
+        if nobs < self.period or nobs <= self.ddof:
+            value = NAN
+        else:
+            value = math.sqrt(max(ssqdm, 0.0) / (nobs - self.ddof))
+        return mean, ssqdm, value
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        if math.isnan(x):
+            # A missing observation restarts the window (min_periods=period)
+            self.window.clear()
+            self.mean = 0.0
+            self.ssqdm = 0.0
+            self.value = NAN
+            return self.value
+
+        self.mean, self.ssqdm, self.value = self._next(x)
+        self.window.append(x)
+        if len(self.window) > self.period:
+            self.window.popleft()
+        return self.value
+
+    def peek(self, x: float) -> float:
+        x = float(x)
+        if math.isnan(x):
+            return NAN
+        return self._next(x)[2]
+
+    def state(self) -> dict:
+        return {
+            "period": self.period,
+            "ddof": self.ddof,
+            "window": list(self.window),
+            "mean": self.mean,
+            "ssqdm": self.ssqdm,
+            "value": self.value,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamingRollingStd":
+        obj = cls(state["period"], state["ddof"])
+        obj.window = deque(state["window"])
+        obj.mean = state["mean"]
+        obj.ssqdm = state["ssqdm"]
+        obj.value = state["value"]
+        return obj
+
+
+# =========================
+# MOMENTUM
+# =========================
+class StreamingMomentum:
+    """
+    Difference to the value `lag` bars back; NaN until lag + 1 values were
+    seen or when either end is NaN, like x - x.shift(lag).
+    """
+
+    def __init__(self, lag: int):
+        self.lag = lag
+        self.window = deque(maxlen=lag + 1)
+        self.value = NAN
+
+    def _next(self, x: float) -> float:
+        if len(self.window) < self.lag:
+            return NAN
+        # After appending x, the oldest kept value is `lag` bars back
+        return x - self.window[-self.lag]
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        self.value = self._next(x)
+        self.window.append(x)
+        return self.value
+
+    def peek(self, x: float) -> float:
+        return self._next(float(x))
+
+    def state(self) -> dict:
+        return {"lag": self.lag, "window": list(self.window), "value": self.value}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamingMomentum":
+        obj = cls(state["lag"])
+        obj.window.extend(state["window"])
+        obj.value = state["value"]
+        return obj
+
+
+# =========================
+# SIGNAL FEATURES (STREAMING)
+# =========================
+class StreamingSignalFeatures:
+    """
+    Streaming counterpart of SignalEngine.prepare_features for one symbol.
+    Feed closed bars in time order with update(); peek() returns the row
+    for the forming bar. Rows hold NaN where prepare_features fills 0.
+    """
+
+    FEATURES = (
+        "close", "high", "low", "open", "ma5", "ma20", "ma50",
+        "momentum5", "momentum20", "regime", "volatility",
+    )
+
+    def __init__(self):
+        self.ma5 = StreamingSMA(5)
+        self.ma20 = StreamingSMA(20)
+        self.ma50 = StreamingSMA(50)
+        self.momentum5 = StreamingMomentum(5)
+        self.momentum20 = StreamingMomentum(20)
+        self.volatility = StreamingRollingStd(20)
+        self.last_time = None
+
+    @staticmethod
+    def _row(bar, regime, ma5, ma20, ma50, momentum5, momentum20, volatility) -> dict:
+        return {
+            "close": float(bar["close"]),
+            "high": float(bar["high"]),
+            "low": float(bar["low"]),
+            "open": float(bar["open"]),
+            "ma5": ma5,
+            "ma20": ma20,
+            "ma50": ma50,
+            "momentum5": momentum5,
+            "momentum20": momentum20,
+            "regime": 1 if regime == "trend" else 0,
+            "volatility": volatility,
+        }
+
+    def update(self, bar, regime: str = "range") -> dict:
+        """
+        bar: mapping/record with time, open, high, low, close.
+        """
+        close = bar["close"]
+        row = self._row(
+            bar, regime,
+            self.ma5.update(close),
+            self.ma20.update(close),
+            self.ma50.update(close),
+            self.momentum5.update(close),
+            self.momentum20.update(close),
+            self.volatility.update(close),
+        )
+        self.last_time = int(bar["time"]) if "time" in _keys(bar) else None
+        return row
+
+    def peek(self, bar, regime: str = "range") -> dict:
+        """
+        Feature row for a forming bar, without committing it.
+        """
+        close = bar["close"]
+        return self._row(
+            bar, regime,
+            self.ma5.peek(close),
+            self.ma20.peek(close),
+            self.ma50.peek(close),
+            self.momentum5.peek(close),
+            self.momentum20.peek(close),
+            self.volatility.peek(close),
+        )
+
+    # =========================
+    # CHECKPOINTING
+    # =========================
+    def state(self) -> dict:
+        return {
+            "last_time": self.last_time,
+            "ma5": self.ma5.state(),
+            "ma20": self.ma20.state(),
+            "ma50": self.ma50.state(),
+            "momentum5": self.momentum5.state(),
+            "momentum20": self.momentum20.state(),
+            "volatility": self.volatility.state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamingSignalFeatures":
+        obj = cls()
+        obj.last_time = state["last_time"]
+        obj.ma5 = StreamingSMA.from_state(state["ma5"])
+        obj.ma20 = StreamingSMA.from_state(state["ma20"])
+        obj.ma50 = StreamingSMA.from_state(state["ma50"])
+        obj.momentum5 = StreamingMomentum.from_state(state["momentum5"])
+        obj.momentum20 = StreamingMomentum.from_state(state["momentum20"])
+        obj.volatility = StreamingRollingStd.from_state(state["volatility"])
+        return obj
+
+    def checkpoint(self, path: str):
+        save_checkpoint(self.state(), path)
+
+    @classmethod
+    def restore(cls, path: str) -> "StreamingSignalFeatures":
+        return cls.from_state(load_checkpoint(path))
+
+
+def _keys(bar):
+    names = getattr(getattr(bar, "dtype", None), "names", None)
+    return names if names is not None else bar.keys()
+
+
+def save_checkpoint(state: dict, path: str):
+    """
+    Writes indicator state as JSON (write-then-rename, so a crash never
+    leaves a truncated checkpoint).
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,150 @@
+"""
+training_service.py
+
+Background model training for MLMode.TRAINING.
+
+Symbol workers hand labelled bars to submit() and return immediately.
+A dispatcher thread feeds them to a process pool; finished models are
+published to the MLRouter's per-symbol slot with an atomic swap, so live
+inference never waits on a fit.
+
+At most one fit runs per symbol. Bars submitted while a fit is running
+replace any older pending batch for that symbol (latest data wins).
+
+Worker processes use the "spawn" start method: the live process runs
+symbol worker, dispatcher and logging threads, and a forked child could
+inherit a lock one of them was holding at fork time.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+
+from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core.ml_router import build_training_set, fit_direction_model
+
+_STOP = object()
+
+
+class BackgroundTrainingService:
+    def __init__(self, ml_router, max_workers: int = None, executor: Executor = None):
+        """
+        executor: optional executor to run fits on (owned and shut down by
+        the service). Defaults to a spawn-based process pool.
+        """
+        self.ml_router = ml_router
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+
+        self._queue = queue.Queue()
+        self._pending = {}      # symbol -> (X, y) waiting for the running fit to finish
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=get_context("spawn")
+        )
+        self._thread = threading.Thread(target=self._dispatch, name="training-dispatcher", daemon=True)
+        self._thread.start()
+
+        logger.info(f"BackgroundTrainingService started | workers={self.max_workers}")
+
+    # =========================
+    # PUBLIC API
+    # =========================
+    def submit(self, symbol: str, features, df) -> bool:
+        """
+        Labels the bars and queues them for training. Never blocks on a fit.
+        """
+        try:
+            X, y = build_training_set(features, df)
+        except Exception as e:
+            logger.error(f"{symbol}: could not build training set | {e}")
+            return False
+
+        if len(np.unique(y)) < 2:
+            logger.warning(f"{symbol}: training skipped — not enough classes")
+            return False
+
+        self._queue.put((symbol, X, y))
+        return True
+
+    def shutdown(self, wait: bool = False):
+        self._queue.put(_STOP)
+        self._thread.join(timeout=5)
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        logger.info("BackgroundTrainingService stopped")
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": sorted(self._in_flight),
+                "pending": sorted(self._pending),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+    # =========================
+    # DISPATCH
+    # =========================
+    def _dispatch(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            symbol, X, y = item
+            with self._lock:
+                if symbol in self._in_flight:
+                    self._pending[symbol] = (X, y)
+                    continue
+                self._in_flight.add(symbol)
+
+            self._start_fit(symbol, X, y)
+
+    def _start_fit(self, symbol, X, y):
+        try:
+            future = self._executor.submit(fit_direction_model, X, y)
+        except RuntimeError as e:
+            # Executor already shut down
+            logger.warning(f"{symbol}: training not started | {e}")
+            with self._lock:
+                self._in_flight.discard(symbol)
+            return
+
+        with self._lock:
+            self.submitted += 1
+        future.add_done_callback(lambda f, s=symbol: self._on_done(s, f))
+
+    def _on_done(self, symbol, future):
+        if future.cancelled():
+            with self._lock:
+                self._in_flight.discard(symbol)
+            return
+
+        try:
+            model = future.result()
+            self.ml_router.set_model(symbol, model)
+            with self._lock:
+                self.completed += 1
+            logger.info(f"✅ {symbol}: background model published")
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            logger.error(f"❌ {symbol}: background training failed | {e}")
+
+        with self._lock:
+            next_batch = self._pending.pop(symbol, None)
+            if next_batch is None:
+                self._in_flight.discard(symbol)
+
+        if next_batch is not None:
+            self._start_fit(symbol, *next_batch)
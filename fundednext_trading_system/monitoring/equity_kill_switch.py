@@ -1,6 +1,5 @@
 from __future__ import annotations
 import os
-from datetime import date
 from fundednext_trading_system.config.settings import ENVIRONMENT
 
 if ENVIRONMENT == "development":
@@ -10,6 +9,7 @@ else:
 
 from fundednext_trading_system.monitoring.logger import logger
 from fundednext_trading_system.monitoring.discord_logger import broadcast
+from fundednext_trading_system.trading_core import clock
 
 
 # =========================
@@ -34,8 +34,8 @@ LIQUIDATION_TRIGGERED = False
 # =========================
 # MT5 HELPERS
 # =========================
-def _get_account_equity():
-    info = mt5.account_info()
+def _get_account_equity(account_info=None):
+    info = account_info if account_info is not None else mt5.account_info()
     if info is None:
         logger.error("MT5 account info unavailable")
         return None
@@ -45,15 +45,15 @@ def _get_account_equity():
 # =========================
 # DAILY RESET
 # =========================
-def reset_daily_equity():
+def reset_daily_equity(account_info=None):
     global DAILY_START_EQUITY, LAST_RESET_DATE
 
-    equity = _get_account_equity()
+    equity = _get_account_equity(account_info)
     if equity is None:
         return
 
     DAILY_START_EQUITY = equity
-    LAST_RESET_DATE = date.today()
+    LAST_RESET_DATE = clock.today()
 
     logger.info(f"Daily equity baseline reset: ${equity:.2f}")
     broadcast(f"🔄 Daily equity reset → ${equity:.2f}")
@@ -62,21 +62,24 @@ def reset_daily_equity():
 # =========================
 # EQUITY CHECK
 # =========================
-def check_equity_limits():
+def check_equity_limits(account_info=None):
+    """
+    account_info: optional pre-fetched MT5 account info (cycle snapshot).
+    """
     global LOCKED, LOCK_REASON
 
     if LOCKED:
         return False
 
-    equity = _get_account_equity()
+    equity = _get_account_equity(account_info)
     if equity is None:
         return False
 
-    today = date.today()
+    today = clock.today()
 
     # Daily reset
     if LAST_RESET_DATE != today or DAILY_START_EQUITY is None:
-        reset_daily_equity()
+        reset_daily_equity(account_info)
 
     total_dd = (STARTING_BALANCE - equity) / STARTING_BALANCE
     daily_dd = (DAILY_START_EQUITY - equity) / DAILY_START_EQUITY
@@ -43,23 +43,29 @@ def print_status(
             logger.info(header)
             logger.info("-" * len(header))
 
+            # Latest per-cycle broker snapshot, if the orchestrator has taken one
+            snapshot = getattr(feed, "last_snapshot", None)
+
             for symbol in ALLOWED_SYMBOLS:
                 # Open positions
                 try:
-                    positions = feed.get_positions(symbol) if feed else []
+                    if snapshot is not None:
+                        positions = snapshot.positions_for(symbol)
+                    else:
+                        positions = feed.get_positions(symbol) if feed else []
                     positions_count = len(positions)
                 except Exception:
                     positions_count = "ERR"
 
                 # Partial TP
                 try:
-                    tp_status = partial_tp_manager.status(symbol) if partial_tp_manager else "-"
+                    tp_status = partial_tp_manager.status(symbol, snapshot) if partial_tp_manager else "-"
                 except Exception:
                     tp_status = "ERR"
 
                 # Trailing SL
                 try:
-                    sl_level = trailing_sl_manager.current_sl(symbol) if trailing_sl_manager else "-"
+                    sl_level = trailing_sl_manager.current_sl(symbol, snapshot) if trailing_sl_manager else "-"
                 except Exception:
                     sl_level = "ERR"
 
@@ -1,6 +1,10 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 
 signal_count = defaultdict(int)
 buy_count = defaultdict(int)
 sell_count = defaultdict(int)
 confidence_scores = defaultdict(list)
+
+# Broker (MT5) API usage
+broker_calls = defaultdict(int)            # API name -> total calls
+broker_calls_per_cycle = deque(maxlen=1440)
@@ -1,8 +1,11 @@
+import threading
 from fundednext_trading_system.monitoring.metrics import (
     signal_count,
     buy_count,
     sell_count,
-    confidence_scores
+    confidence_scores,
+    broker_calls,
+    broker_calls_per_cycle,
 )
 from loguru import logger
 
@@ -25,3 +28,19 @@ def print_stats():
             f"| Sell={sell_count[symbol]} "
             f"| AvgConf={avg_conf:.2f}"
         )
+
+# =========================
+# BROKER CALL TRACKING
+# =========================
+_broker_lock = threading.Lock()
+
+def record_broker_call(name, count=1):
+    with _broker_lock:
+        broker_calls[name] += count
+
+def total_broker_calls():
+    with _broker_lock:
+        return sum(broker_calls.values())
+
+def record_cycle_broker_calls(count):
+    broker_calls_per_cycle.append(count)
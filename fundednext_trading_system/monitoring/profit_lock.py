@@ -29,8 +29,8 @@ LOCKED_EQUITY_FLOOR = None
 # =========================
 # HELPERS
 # =========================
-def _get_equity():
-    info = mt5.account_info()
+def _get_equity(account_info=None):
+    info = account_info if account_info is not None else mt5.account_info()
     if info is None:
         logger.error("MT5 account info unavailable")
         return None
@@ -40,10 +40,13 @@ def _get_equity():
 # =========================
 # PROFIT LOCK CHECK
 # =========================
-def check_profit_lock():
+def check_profit_lock(account_info=None):
+    """
+    account_info: optional pre-fetched MT5 account info (cycle snapshot).
+    """
     global PROFIT_LOCK_ACTIVE, LOCKED_EQUITY_FLOOR
 
-    equity = _get_equity()
+    equity = _get_equity(account_info)
     if equity is None:
         return True
 
@@ -0,0 +1,456 @@
+"""
+parameter_sweep.py
+
+Parameter sweep for the hand-set strategy constants:
+
+- ATR_PERIOD, ATR_SL_MULTIPLIER, ATR_TP_MULTIPLIERS, TP_CLOSE_PERCENTS
+- the MA-slope threshold of detect_market_regime
+- the per-symbol SYMBOLS_CONFIG ema_fast / ema_slow / rsi_period
+
+Each candidate is a full parameter set for one symbol. Entry signals
+follow the live decision in symbol_worker, vectorised over the history:
+
+- regime per bar as detect_market_regime, with the candidate's threshold
+- the ML signal when a model is given and its confidence passes the live
+  0.7 gate; the model scores FeatureEngineer features built with the
+  candidate's ema_fast / ema_slow / rsi_period
+- otherwise SignalEngine.generate_signal (MA5/MA20/MA50 stacking in trend,
+  close versus MA20 in range) with neutral news sentiment
+
+ema_fast / ema_slow / rsi_period only act through the model's features, so
+they are swept only for symbols that have a model. The symbol is then run
+through PortfolioBacktester with the candidate's ATR stop and partial-TP
+settings. Candidates run on a process pool; results are memoised on disk
+by (symbol, data hash, parameters, cost model, model, account rules and
+regime/timeframe settings), so re-running a sweep only evaluates new
+combinations.
+
+Usage:
+    python -m fundednext_trading_system.offline_training.parameter_sweep <start YYYY-MM-DD> <end YYYY-MM-DD> [--samples=N] [--models=DIR] [SYMBOL ...]
+
+--models=DIR loads <DIR>/<SYMBOL>.pkl (FeatureEngineer models, as saved by
+ml/training/train_model.py); symbols without one use the rule signals only.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import date
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from fundednext_trading_system.backtest.costs import CostModel
+from fundednext_trading_system.backtest.engine import PortfolioBacktester, signals_from_model
+from fundednext_trading_system.config.settings import (
+    ACCOUNT_PHASE,
+    ALLOWED_SYMBOLS,
+    ATR_PERIOD,
+    ATR_SL_MULTIPLIER,
+    ATR_TP_MULTIPLIERS,
+    CANDLE_STORE_DIR,
+    CURRENT_RULES,
+    REGIME_MA_PERIOD,
+    REGIME_SLOPE_THRESHOLD,
+    SWEEP_CACHE_DIR,
+    TIMEFRAME_BARS,
+    TP_CLOSE_PERCENTS,
+    TRAINING_LOG_DIR,
+)
+from fundednext_trading_system.config.symbols_config import SYMBOLS_CONFIG
+from fundednext_trading_system.execution.candle_store import CandleStore, records_to_frame
+from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed
+from fundednext_trading_system.ml.feature_engineering import FeatureEngineer
+from fundednext_trading_system.monitoring.logger import logger
+
+SWEEP_VERSION = "v2"   # bump when the signal rule or the metrics change
+MIN_TRADES = 20        # fewer trades rank below every candidate that has enough
+ML_MIN_CONFIDENCE = 0.7   # symbol_worker's confidence gate for ML signals
+
+# Parameters that only change the model's features
+MODEL_PARAMS = ("ema_fast", "ema_slow", "rsi_period")
+
+# Fallback for symbols without a SYMBOLS_CONFIG entry
+DEFAULT_SYMBOL_PARAMS = {"ema_fast": 21, "ema_slow": 50, "rsi_period": 14}
+
+DEFAULT_GRID = {
+    "atr_period": (10, 14, 20),
+    "atr_sl_multiplier": (1.0, 1.2, 1.5, 2.0),
+    "tp_multipliers": ((1.0, 2.0), (1.5, 3.0)),
+    "tp_close_percents": ((0.3, 0.3), (0.5, 0.25)),
+    "regime_threshold": (0.05, 0.1, 0.2),
+    "ema_fast": (12, 21),
+    "ema_slow": (50, 100),
+    "rsi_period": (9, 14),
+}
+
+RESULT_COLUMNS = ("score", "trades", "win_rate", "net_profit", "max_drawdown", "commission")
+
+
+# =========================
+# PARAMETERS
+# =========================
+def baseline_params(symbol: str) -> dict:
+    """
+    The parameters currently configured for a symbol.
+    """
+    cfg = SYMBOLS_CONFIG.get(symbol, DEFAULT_SYMBOL_PARAMS)
+    return {
+        "atr_period": ATR_PERIOD,
+        "atr_sl_multiplier": ATR_SL_MULTIPLIER,
+        "tp_multipliers": tuple(ATR_TP_MULTIPLIERS),
+        "tp_close_percents": tuple(TP_CLOSE_PERCENTS),
+        "regime_threshold": REGIME_SLOPE_THRESHOLD,
+        "ema_fast": cfg["ema_fast"],
+        "ema_slow": cfg["ema_slow"],
+        "rsi_period": cfg["rsi_period"],
+    }
+
+
+def _valid(params: dict) -> bool:
+    return params["ema_fast"] < params["ema_slow"] and sum(params["tp_close_percents"]) <= 1.0
+
+
+def candidates(symbol: str, grid: dict = None, samples: int = None, seed: int = 0, with_model: bool = True) -> list:
+    """
+    Parameter sets to evaluate for a symbol: the full grid, or `samples`
+    distinct random points of it. Keys missing from the grid keep their
+    baseline value; the baseline itself is always included.
+    with_model=False keeps MODEL_PARAMS at their baseline (they would not
+    change any signal).
+    """
+    grid = DEFAULT_GRID if grid is None else grid
+    if not with_model:
+        grid = {name: values for name, values in grid.items() if name not in MODEL_PARAMS}
+    base = baseline_params(symbol)
+    names = list(grid)
+    points = [dict(base, **dict(zip(names, values))) for values in itertools.product(*grid.values())]
+    points = [p for p in points if _valid(p)]
+
+    if samples is not None and samples < len(points):
+        rng = np.random.default_rng(seed)
+        points = [points[i] for i in sorted(rng.choice(len(points), size=samples, replace=False))]
+
+    if base not in points:
+        points.insert(0, base)
+    return points
+
+
+# =========================
+# SIGNALS
+# =========================
+def market_regime(close: pd.Series, threshold: float) -> np.ndarray:
+    """
+    detect_market_regime for every bar (True = trend): the REGIME_MA_PERIOD
+    SMA moved by more than `threshold` standard deviations of close over
+    the trailing TIMEFRAME_BARS window. Too little history is range.
+    """
+    ma = close.rolling(REGIME_MA_PERIOD).mean()
+    std = close.rolling(TIMEFRAME_BARS, min_periods=REGIME_MA_PERIOD + 2).std()
+    return (ma.diff().abs() > std * threshold).to_numpy()
+
+
+def rule_signals(records: np.ndarray, params: dict) -> np.ndarray:
+    """
+    SignalEngine.generate_signal for every bar: +1 buy, -1 sell, 0 none.
+    Trend: MA5 > MA20 > MA50 buys, MA5 < MA20 < MA50 sells.
+    Range: close above MA20 sells, below buys.
+    """
+    close = pd.Series(records["close"])
+    ma5 = close.rolling(5).mean().to_numpy()
+    ma20 = close.rolling(20).mean().to_numpy()
+    ma50 = close.rolling(50).mean().to_numpy()
+    last = close.to_numpy()
+    trend = market_regime(close, params["regime_threshold"])
+
+    signals = np.zeros(len(close), dtype=np.int8)
+    with np.errstate(invalid="ignore"):
+        signals[trend & (ma5 > ma20) & (ma20 > ma50)] = 1
+        signals[trend & (ma5 < ma20) & (ma20 < ma50)] = -1
+        signals[~trend & (last > ma20)] = -1
+        signals[~trend & (last < ma20)] = 1
+    return signals
+
+
+def model_signals(records: np.ndarray, symbol: str, params: dict, model) -> np.ndarray:
+    """
+    ML signals from FeatureEngineer features built with the candidate's
+    EMA/RSI periods; 0 where confidence is below ML_MIN_CONFIDENCE.
+    """
+    overrides = {name: params[name] for name in MODEL_PARAMS}
+    features = FeatureEngineer().compute_features(records_to_frame(records), symbol, overrides)
+    if features.empty:
+        return np.zeros(len(records), dtype=np.int8)
+    return signals_from_model(model, features, min_confidence=ML_MIN_CONFIDENCE)
+
+
+def candidate_signals(records: np.ndarray, symbol: str, params: dict, model=None) -> np.ndarray:
+    """
+    The live decision per bar: the confident ML signal, else the rule
+    signal. Bars before symbol_worker's 60-bar minimum never trade.
+    """
+    signals = rule_signals(records, params)
+    if model is not None:
+        ml = model_signals(records, symbol, params, model)
+        signals = np.where(ml != 0, ml, signals).astype(np.int8)
+    signals[:60] = 0
+    return signals
+
+
+# =========================
+# MEMO
+# =========================
+class SweepCache:
+    """
+    One JSON file per evaluated (symbol, data, parameters, costs, model).
+    The key also covers the settings results depend on outside the
+    parameter set: account rules (RiskManager sizing and limits) and the
+    regime window.
+    """
+
+    def __init__(self, root: str = SWEEP_CACHE_DIR):
+        self.root = root
+
+    @staticmethod
+    def data_hash(records: np.ndarray) -> str:
+        return hashlib.sha1(np.ascontiguousarray(records).tobytes()).hexdigest()[:16]
+
+    @staticmethod
+    def model_hash(model) -> str:
+        if model is None:
+            return None
+        return hashlib.sha1(pickle.dumps(model)).hexdigest()[:16]
+
+    @staticmethod
+    def key(symbol: str, data_hash: str, params: dict, cost_model: CostModel, model_hash: str = None) -> str:
+        payload = json.dumps(
+            {
+                "v": SWEEP_VERSION,
+                "data": data_hash,
+                "params": params,
+                "costs": asdict(cost_model),
+                "model": model_hash,
+                "settings": {
+                    "account_phase": ACCOUNT_PHASE,
+                    "rules": CURRENT_RULES,
+                    "regime_ma_period": REGIME_MA_PERIOD,
+                    "timeframe_bars": TIMEFRAME_BARS,
+                },
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def _path(self, symbol, key):
+        return os.path.join(self.root, symbol, f"{key}.json")
+
+    def get(self, symbol: str, key: str):
+        try:
+            with open(self._path(symbol, key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, symbol: str, key: str, result: dict):
+        path = self._path(symbol, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+
+
+# =========================
+# EVALUATION
+# =========================
+_WORKER_BARS = {}
+_WORKER_COSTS = None
+_WORKER_MODELS = {}
+
+
+def _init_worker(bars: dict, cost_model: CostModel, models: dict):
+    """
+    Pool initializer: bars and models are shipped once per process, not per task.
+    """
+    global _WORKER_BARS, _WORKER_COSTS, _WORKER_MODELS
+    _WORKER_BARS = bars
+    _WORKER_COSTS = cost_model
+    _WORKER_MODELS = models
+
+
+def evaluate(records: np.ndarray, symbol: str, params: dict, cost_model: CostModel = None, model=None) -> dict:
+    """
+    Backtests one symbol with one parameter set.
+    """
+    backtester = PortfolioBacktester(
+        {symbol: records},
+        {symbol: candidate_signals(records, symbol, params, model)},
+        cost_model=cost_model,
+        atr_period=params["atr_period"],
+        atr_sl_multiplier=params["atr_sl_multiplier"],
+        tp_multipliers=params["tp_multipliers"],
+        tp_close_percents=params["tp_close_percents"],
+    )
+    report = backtester.run(quiet=True)
+    start = backtester.risk_manager.start_balance
+    drawdown = report.get("max_drawdown", 0.0)
+
+    return {
+        # Return over max drawdown; flat runs score 0
+        "score": round((report.get("net_profit", 0.0) / start) / max(drawdown, 1e-3), 4),
+        "trades": report.get("trades", 0),
+        "win_rate": report.get("win_rate", 0.0),
+        "net_profit": report.get("net_profit", 0.0),
+        "max_drawdown": drawdown,
+        "commission": report.get("commission", 0.0),
+    }
+
+
+def _evaluate_task(symbol: str, params: dict) -> dict:
+    return evaluate(_WORKER_BARS[symbol], symbol, params, _WORKER_COSTS, _WORKER_MODELS.get(symbol))
+
+
+def ranked_table(rows: list, min_trades: int = MIN_TRADES) -> pd.DataFrame:
+    """
+    Candidates with at least `min_trades` trades first, then by score and
+    net profit. Index is the 1-based rank.
+    """
+    table = pd.DataFrame([{**row["params"], **row["result"]} for row in rows])
+    if table.empty:
+        return table
+    table["enough_trades"] = table["trades"] >= min_trades
+    table = table.sort_values(
+        ["enough_trades", "score", "net_profit"], ascending=False, kind="stable"
+    ).reset_index(drop=True)
+    table.index = table.index + 1
+    table.index.name = "rank"
+    return table
+
+
+def run_sweep(
+    bars: dict,
+    grid: dict = None,
+    samples: int = None,
+    seed: int = 0,
+    max_workers: int = None,
+    cost_model: CostModel = None,
+    cache: SweepCache = None,
+    min_trades: int = MIN_TRADES,
+    models: dict = None,
+) -> dict:
+    """
+    bars:   {symbol: time-ordered candle record array}
+    models: optional {symbol: FeatureEngineer model}; its confident signals
+            take precedence over the rule signals, as in symbol_worker
+    Returns {symbol: ranked DataFrame of parameters and results}.
+    """
+    cost_model = cost_model or CostModel()
+    cache = cache or SweepCache()
+    models = {symbol: model for symbol, model in (models or {}).items() if symbol in bars}
+
+    rows = {symbol: [] for symbol in bars}
+    pending = []   # (symbol, params, key)
+    for symbol, records in bars.items():
+        data_hash = SweepCache.data_hash(records)
+        model_hash = SweepCache.model_hash(models.get(symbol))
+        for params in candidates(symbol, grid, samples, seed, with_model=symbol in models):
+            key = SweepCache.key(symbol, data_hash, params, cost_model, model_hash)
+            result = cache.get(symbol, key)
+            if result is None:
+                pending.append((symbol, params, key))
+            else:
+                rows[symbol].append({"params": params, "result": result})
+
+    cached = sum(len(r) for r in rows.values())
+    max_workers = max(1, min(len(pending), max_workers or os.cpu_count() or 1))
+    logger.info(
+        f"🔎 Parameter sweep | symbols={len(bars)} | to evaluate={len(pending)} | "
+        f"memoised={cached} | workers={max_workers}"
+    )
+
+    if pending:
+        tasks = ([symbol for symbol, _, _ in pending], [params for _, params, _ in pending])
+        if max_workers == 1:
+            results = [
+                evaluate(bars[symbol], symbol, params, cost_model, models.get(symbol))
+                for symbol, params, _ in pending
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(bars, cost_model, models),
+            ) as pool:
+                results = list(pool.map(_evaluate_task, *tasks, chunksize=max(1, len(pending) // (4 * max_workers))))
+
+        for (symbol, params, key), result in zip(pending, results):
+            cache.put(symbol, key, result)
+            rows[symbol].append({"params": params, "result": result})
+
+    tables = {symbol: ranked_table(symbol_rows, min_trades) for symbol, symbol_rows in rows.items()}
+    for symbol, table in tables.items():
+        if table.empty:
+            continue
+        best = table.iloc[0]
+        logger.info(
+            f"🏆 {symbol}: best score={best['score']:.3f} | trades={best['trades']} | "
+            f"net=${best['net_profit']:.2f} | maxDD={best['max_drawdown']:.2%}"
+        )
+    return tables
+
+
+def sweep_main(argv):
+    """
+    Sweeps the stored candles of each symbol and writes one ranked CSV per symbol.
+    """
+    samples = None
+    models_dir = None
+    args = []
+    for arg in argv:
+        if arg.startswith("--samples="):
+            samples = int(arg.split("=", 1)[1])
+        elif arg.startswith("--models="):
+            models_dir = arg.split("=", 1)[1]
+        else:
+            args.append(arg)
+
+    if len(args) < 2:
+        print("Usage: parameter_sweep <start YYYY-MM-DD> <end YYYY-MM-DD> [--samples=N] [--models=DIR] [SYMBOL ...]")
+        sys.exit(1)
+
+    start, end = date.fromisoformat(args[0]), date.fromisoformat(args[1])
+    symbols = args[2:] or ALLOWED_SYMBOLS
+    timeframe_str = DukascopyDataFeed.TIMEFRAME_MAP.get(TIMEFRAME_BARS, "M5")
+    store = CandleStore(CANDLE_STORE_DIR)
+
+    bars = {}
+    for symbol in symbols:
+        records = store.read_range(symbol, timeframe_str, start, end)
+        if len(records) == 0:
+            logger.warning(f"{symbol}: no candles, skipping")
+            continue
+        bars[symbol] = records
+
+    models = {}
+    if models_dir:
+        for symbol in bars:
+            path = os.path.join(models_dir, f"{symbol}.pkl")
+            if os.path.exists(path):
+                models[symbol] = joblib.load(path)
+            else:
+                logger.warning(f"{symbol}: no model in {models_dir}, rule signals only")
+
+    out_dir = os.path.join(TRAINING_LOG_DIR, "sweeps")
+    os.makedirs(out_dir, exist_ok=True)
+    for symbol, table in run_sweep(bars, samples=samples, models=models).items():
+        path = os.path.join(out_dir, f"{symbol}_{args[0]}_{args[1]}.csv")
+        table.to_csv(path)
+        logger.info(f"{symbol}: ranked table written to {path}")
+
+
+if __name__ == "__main__":
+    sweep_main(sys.argv[1:])
@@ -1,28 +1,64 @@
 
-import pandas as pd
+import json
+import os
 import pickle
 import sys
-import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
+import pandas as pd
 
 from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed
+from fundednext_trading_system.execution.candle_store import CandleStore
 from fundednext_trading_system.trading_core.signal_engine import SignalEngine
 from fundednext_trading_system.trading_core.ml_router import MLRouter
 from fundednext_trading_system.trading_core.execution_flags import ExecutionFlags, MLMode, AccountPhase, ExecutionMode
-from fundednext_trading_system.config.settings import TIMEFRAME_BARS, MODELS_DIR, ALLOWED_SYMBOLS, ENVIRONMENT
+from fundednext_trading_system.config.settings import TIMEFRAME_BARS, MODELS_DIR, ALLOWED_SYMBOLS, ENVIRONMENT, TRAINING_LOG_DIR
 from fundednext_trading_system.monitoring.logger import logger
 from fundednext_trading_system.offline_training.offline_training import MonteCarloValidator
+from fundednext_trading_system.trading_core import clock
 
 def run_backtest(model, features, df):
     """
     Runs a simple backtest and returns a list of trade returns.
+
+    Every bar from the second to the second-to-last is scored in one
+    predict_proba call and traded one bar ahead; returns are computed with
+    array arithmetic. Results match the per-row loop exactly.
     """
     logger.info("Running backtest on hold-out data...")
-    trade_returns = []
 
     # Align features index with df index
     features, df = features.align(df, join='inner', axis=0)
 
+    n = len(features)
+    if n < 3:
+        logger.success("Backtest complete. Generated 0 trade returns.")
+        return []
+
+    try:
+        pred_proba = model.predict_proba(features.values[1:n - 1])
+    except Exception as e:
+        logger.warning(f"Batch prediction failed ({e}); falling back to per-row backtest")
+        return _run_backtest_per_row(model, features, df)
+
+    close = df['close'].to_numpy()
+    price_change = close[2:n] - close[1:n - 1]
+    buy = pred_proba[:, 1] > pred_proba[:, 0]
+    trade_returns = np.where(buy, price_change / close[1:n - 1], -price_change / close[1:n - 1])
+
+    logger.success(f"Backtest complete. Generated {len(trade_returns)} trade returns.")
+    return list(trade_returns)
+
+
+def _run_backtest_per_row(model, features, df):
+    """
+    Row-by-row reference backtest; rows the model cannot score are skipped.
+    """
+    trade_returns = []
+
     for i in range(1, len(features)):
         # Ensure we don't go out of bounds for the target
         if i >= len(df) -1:
@@ -50,14 +86,19 @@ def run_backtest(model, features, df):
     return trade_returns
 
 
-def train_and_save_model():
+def train_symbol(symbol: str, df: pd.DataFrame) -> dict:
     """
-    Trains a machine learning model for each symbol, validates it using Monte Carlo simulation,
-    and saves it if validation passes.
+    Builds features, trains, backtests and Monte-Carlo-validates one symbol;
+    saves the model if validation passes. Returns a summary row.
     """
-    logger.info("🚀 Starting offline model training process for each symbol...")
+    result = {"symbol": symbol, "status": None, "bars": 0 if df is None else len(df)}
+
+    logger.info(f"===== Processing symbol: {symbol} =====")
+    if df is None or df.empty or len(df) < 200:
+        logger.warning(f"Insufficient data for {symbol}, skipping.")
+        result["status"] = "insufficient_data"
+        return result
 
-    feed = DukascopyDataFeed()
     signal_engine = SignalEngine(confidence_threshold=0.7)
     execution_flags = ExecutionFlags(
         account_phase=AccountPhase.CHALLENGE,
@@ -66,67 +107,169 @@ def train_and_save_model():
     )
     validator = MonteCarloValidator()
 
-    # Create models directory if it doesn't exist
-    if not os.path.exists(MODELS_DIR):
-        os.makedirs(MODELS_DIR)
-        logger.info(f"Created directory: {MODELS_DIR}")
+    features = signal_engine.prepare_features(df)
 
-    for symbol in ALLOWED_SYMBOLS:
-        logger.info(f"===== Processing symbol: {symbol} =====")
-        logger.info(f"Fetching data for {symbol}...")
-        df = feed.get_candles(symbol, TIMEFRAME_BARS, count=5000)
-        if df is None or df.empty or len(df) < 200:
-            logger.warning(f"Insufficient data for {symbol}, skipping.")
-            continue
+    # Align dataframes to ensure features and target are correctly matched
+    features, df = features.align(df, join='inner', axis=0)
 
-        features = signal_engine.prepare_features(df)
+    # Split data into training and validation sets (80/20 split)
+    split_index = int(len(df) * 0.8)
 
-        # Align dataframes to ensure features and target are correctly matched
-        features, df = features.align(df, join='inner', axis=0)
+    train_df = df.iloc[:split_index]
+    val_df = df.iloc[split_index:]
 
-        # Split data into training and validation sets (80/20 split)
-        split_index = int(len(df) * 0.8)
+    train_features = features.iloc[:split_index]
+    val_features = features.iloc[split_index:]
 
-        train_df = df.iloc[:split_index]
-        val_df = df.iloc[split_index:]
+    logger.info(f"Training on {len(train_df)} data points, validating on {len(val_df)}.")
 
-        train_features = features.iloc[:split_index]
-        val_features = features.iloc[split_index:]
+    ml_router = MLRouter(execution_flags) # Re-instantiate for a fresh model
 
-        logger.info(f"Training on {len(train_df)} data points, validating on {len(val_df)}.")
+    logger.info(f"Training the ML model for {symbol}...")
+    ml_router.update_model(train_features, train_df)
 
-        ml_router = MLRouter(execution_flags) # Re-instantiate for a fresh model
+    # Run backtest and Monte Carlo validation
+    trade_returns = run_backtest(ml_router.model, val_features, val_df)
+    result["trades"] = len(trade_returns)
+    if not trade_returns:
+        logger.error(f"No trades were generated during backtest for {symbol}. Cannot validate.")
+        result["status"] = "no_trades"
+        return result
 
-        logger.info(f"Training the ML model for {symbol}...")
-        ml_router.update_model(train_features, train_df)
+    report = validator.run(trade_returns)
+    result["validation"] = report
+    logger.info(f"📊 MONTE CARLO VALIDATION RESULT for {symbol}")
+    for k, v in report.items():
+        logger.info(f"{k}: {v}")
 
-        # Run backtest and Monte Carlo validation
-        trade_returns = run_backtest(ml_router.model, val_features, val_df)
-        if not trade_returns:
-            logger.error(f"No trades were generated during backtest for {symbol}. Cannot validate.")
-            continue # Move to the next symbol
+    if not report["passed"]:
+        logger.error(f"❌ Model for {symbol} failed Monte Carlo validation. Not saving the model.")
+        result["status"] = "failed_validation"
+        return result
 
-        report = validator.run(trade_returns)
-        logger.info(f"📊 MONTE CARLO VALIDATION RESULT for {symbol}")
-        for k, v in report.items():
-            logger.info(f"{k}: {v}")
+    logger.success(f"✅ Model for {symbol} passed Monte Carlo validation.")
 
-        if not report["passed"]:
-            logger.error(f"❌ Model for {symbol} failed Monte Carlo validation. Not saving the model.")
-            continue # Move to the next symbol
+    # Save the trained model
+    model_path = os.path.join(MODELS_DIR, f"model_{symbol}.pkl")
+    try:
+        with open(model_path, "wb") as model_file:
+            pickle.dump(ml_router.model, model_file)
+        logger.success(f"✅ Model for {symbol} saved successfully to {model_path}")
+        result["status"] = "saved"
+        result["model_path"] = model_path
+    except Exception as e:
+        logger.error(f"❌ Failed to save the model for {symbol}: {e}")
+        result["status"] = "save_failed"
+        result["error"] = str(e)
 
-        logger.success(f"✅ Model for {symbol} passed Monte Carlo validation.")
+    return result
 
-        # Save the trained model
-        model_path = os.path.join(MODELS_DIR, f"model_{symbol}.pkl")
-        try:
-            with open(model_path, "wb") as model_file:
-                pickle.dump(ml_router.model, model_file)
-            logger.success(f"✅ Model for {symbol} saved successfully to {model_path}")
-        except Exception as e:
-            logger.error(f"❌ Failed to save the model for {symbol}: {e}")
 
-    logger.info("✅ Completed training process for all symbols.")
+def _train_symbol_task(symbol: str, df: pd.DataFrame, log_dir: str) -> dict:
+    """
+    Process-pool entry point: trains one symbol with its own log file.
+    Any exception is reported in the result instead of raised.
+    """
+    started = time.perf_counter()
+    sink = logger.add(
+        os.path.join(log_dir, f"{symbol}.log"),
+        level="DEBUG",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+        filter=lambda record: record["extra"].get("training_symbol") == symbol,
+        backtrace=False,
+        diagnose=False,   # forked stacks hold the other symbols' frames
+    )
+    try:
+        with logger.contextualize(training_symbol=symbol):
+            try:
+                result = train_symbol(symbol, df)
+            except Exception as e:
+                logger.exception(f"❌ Training failed for {symbol}: {e}")
+                result = {"symbol": symbol, "status": "error", "error": repr(e)}
+    finally:
+        logger.remove(sink)
+
+    result["duration_seconds"] = round(time.perf_counter() - started, 2)
+    result["log_file"] = os.path.join(log_dir, f"{symbol}.log")
+    return result
+
+
+def _jsonable(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def train_and_save_model(symbols=None, max_workers: int = None, log_root: str = TRAINING_LOG_DIR) -> dict:
+    """
+    Trains a machine learning model for each symbol, validates it using Monte Carlo simulation,
+    and saves it if validation passes.
+
+    Symbols train in parallel on a process pool (one symbol per process,
+    pool sized to the machine); each writes its own log file, and a
+    failure in one symbol never stops the others. Returns the summary that
+    is also written to training_summary.json in the run's log directory.
+    """
+    symbols = list(symbols or ALLOWED_SYMBOLS)
+    max_workers = max(1, min(len(symbols), max_workers or os.cpu_count() or 1))
+    run_started = time.perf_counter()
+    run_id = clock.utcnow().strftime("%Y%m%d-%H%M%S")
+    log_dir = os.path.join(log_root, run_id)
+    os.makedirs(log_dir, exist_ok=True)
+
+    logger.info(
+        f"🚀 Starting offline model training | symbols={len(symbols)} | "
+        f"workers={max_workers} | logs={log_dir}"
+    )
+
+    # Create models directory if it doesn't exist
+    if not os.path.exists(MODELS_DIR):
+        os.makedirs(MODELS_DIR)
+        logger.info(f"Created directory: {MODELS_DIR}")
+
+    # Fetch the whole universe up front; chunks download in parallel
+    logger.info(f"Fetching data for {len(symbols)} symbols...")
+    feed = DukascopyDataFeed(store=CandleStore())
+    candles = feed.get_candles_bulk(symbols, TIMEFRAME_BARS, count=5000)
+
+    results = {}
+    if max_workers == 1:
+        for symbol in symbols:
+            results[symbol] = _train_symbol_task(symbol, candles.get(symbol), log_dir)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_train_symbol_task, symbol, candles.get(symbol), log_dir): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    # The worker process itself died (e.g. out of memory)
+                    logger.error(f"❌ Training worker for {symbol} crashed: {e}")
+                    results[symbol] = {"symbol": symbol, "status": "error", "error": repr(e)}
+                logger.info(f"{symbol}: {results[symbol]['status']}")
+
+    summary = {
+        "run_id": run_id,
+        "workers": max_workers,
+        "wall_seconds": round(time.perf_counter() - run_started, 2),
+        "statuses": dict(Counter(r["status"] for r in results.values())),
+        "symbols": [results[symbol] for symbol in symbols],
+    }
+    summary_path = os.path.join(log_dir, "training_summary.json")
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=2, default=_jsonable)
+
+    logger.info("📋 Training summary")
+    for row in summary["symbols"]:
+        logger.info(
+            f"  {row['symbol']:<10} {row['status']:<18} {row.get('duration_seconds', 0):>7.1f}s"
+        )
+    logger.info(f"✅ Completed training process for all symbols in {summary['wall_seconds']:.1f}s | {summary_path}")
+    return summary
 
 if __name__ == "__main__":
     if ENVIRONMENT == "production":
@@ -136,4 +279,4 @@ if __name__ == "__main__":
             logger.error("You are trying to run in production mode, but the 'MetaTrader5' library is not installed.")
             logger.error("Please install it and ensure you are on a Windows machine.")
             sys.exit(1)
-    train_and_save_model()
+    train_and_save_model(sys.argv[1:] or None)
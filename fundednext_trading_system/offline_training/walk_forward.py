@@ -0,0 +1,329 @@
+"""
+walk_forward.py
+
+Walk-forward validation for the per-symbol direction model.
+
+The series is cut into consecutive test windows; each fold trains on the
+bars before its window (anchored: from the first bar, rolling: a fixed
+length) and is scored on the window only, with the same next-bar trading
+rule as run_backtest. Folds run in parallel on a process pool.
+
+Leakage controls:
+- purge:   training rows dropped right before the test window (their
+           next-bar labels look into it)
+- embargo: rows skipped at the start of the test window (rolling
+           indicators still overlap the training data)
+
+Feature matrices are cached on disk, keyed by a hash of the OHLC data, so
+repeated runs and every worker read the same arrays instead of rebuilding
+the features.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+
+import numpy as np
+import pandas as pd
+
+from fundednext_trading_system.config.settings import (
+    FEATURE_CACHE_DIR,
+    TIMEFRAME_BARS,
+    TRAINING_LOG_DIR,
+    WALK_FORWARD_EMBARGO_BARS,
+    WALK_FORWARD_FOLDS,
+    WALK_FORWARD_PURGE_BARS,
+    WALK_FORWARD_SCHEME,
+)
+from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core.ml_router import build_training_set, fit_direction_model
+from fundednext_trading_system.trading_core.signal_engine import SignalEngine
+
+FEATURE_SET_VERSION = "v1"   # bump when SignalEngine.prepare_features changes
+MIN_TRAIN_BARS = 100
+RANDOM_STATE = 0             # fixed so reruns and parallel/serial runs agree
+FOLD_METRICS = ("accuracy", "win_rate", "mean_return", "total_return", "sharpe", "max_drawdown")
+
+# Promotion thresholds (mirror MonteCarloValidator defaults)
+MIN_MEAN_WIN_RATE = 0.52
+MAX_FOLD_DRAWDOWN = 0.08
+MIN_POSITIVE_FOLDS = 0.6
+
+
+# =========================
+# FEATURE CACHE
+# =========================
+class FeatureCache:
+    """
+    On-disk cache of (X, y, close) per symbol and data hash, stored as .npz.
+    """
+
+    def __init__(self, root: str = FEATURE_CACHE_DIR):
+        self.root = root
+
+    @staticmethod
+    def data_hash(df: pd.DataFrame) -> str:
+        ohlc = df[["open", "high", "low", "close"]]
+        digest = hashlib.sha1(pd.util.hash_pandas_object(ohlc, index=True).values.tobytes())
+        digest.update(FEATURE_SET_VERSION.encode())
+        return digest.hexdigest()[:16]
+
+    def path_for(self, symbol: str, df: pd.DataFrame) -> str:
+        return os.path.join(self.root, f"{symbol}_{self.data_hash(df)}.npz")
+
+    def get_or_build(self, symbol: str, df: pd.DataFrame) -> str:
+        """
+        Returns the path of the cached matrices, building them on a miss.
+        """
+        path = self.path_for(symbol, df)
+        if os.path.exists(path):
+            logger.debug(f"{symbol}: feature cache hit ({os.path.basename(path)})")
+            return path
+
+        features = SignalEngine().prepare_features(df)
+        features, df = features.align(df, join="inner", axis=0)
+        X, y = build_training_set(features, df)
+
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{path[:-4]}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, X=X.astype(np.float64), y=y, close=df["close"].to_numpy(dtype=np.float64))
+        os.replace(tmp_path, path)   # atomic: concurrent builders never see half a file
+        logger.info(f"{symbol}: cached {X.shape[0]}x{X.shape[1]} feature matrix → {path}")
+        return path
+
+    @staticmethod
+    def load(path: str):
+        with np.load(path) as data:
+            return data["X"], data["y"], data["close"]
+
+
+# =========================
+# FOLDS
+# =========================
+@dataclass(frozen=True)
+class Fold:
+    index: int
+    train_start: int
+    train_end: int     # exclusive
+    test_start: int
+    test_end: int      # exclusive
+
+
+def make_folds(
+    n_samples: int,
+    n_folds: int = WALK_FORWARD_FOLDS,
+    scheme: str = WALK_FORWARD_SCHEME,
+    train_size: int = None,
+    test_size: int = None,
+    purge: int = WALK_FORWARD_PURGE_BARS,
+    embargo: int = WALK_FORWARD_EMBARGO_BARS,
+) -> list:
+    """
+    Consecutive, non-overlapping test windows over [0, n_samples).
+
+    train_size: initial (anchored) or fixed (rolling) training length;
+                defaults to one fold's share of the series
+    test_size:  bars per test window; defaults to an even split of the rest
+    """
+    if scheme not in ("anchored", "rolling"):
+        raise ValueError(f"Unknown walk-forward scheme: {scheme}")
+    if n_folds < 1 or purge < 0 or embargo < 0:
+        raise ValueError("n_folds must be >= 1 and purge/embargo >= 0")
+
+    train_size = train_size or n_samples // (n_folds + 1)
+    test_size = test_size or (n_samples - train_size - purge) // n_folds
+    first_test = train_size + purge
+    if first_test + n_folds * test_size > n_samples:
+        raise ValueError(f"{n_samples} samples cannot hold {n_folds} folds of {test_size} after {first_test} bars")
+    if train_size < MIN_TRAIN_BARS or test_size - embargo < 2:
+        raise ValueError(
+            f"Folds too small: train={train_size} (min {MIN_TRAIN_BARS}), "
+            f"test={test_size} with embargo={embargo}"
+        )
+
+    folds = []
+    for k in range(n_folds):
+        window_start = first_test + k * test_size
+        train_end = window_start - purge
+        train_start = 0 if scheme == "anchored" else train_end - train_size
+        folds.append(Fold(k, train_start, train_end, window_start + embargo, window_start + test_size))
+    return folds
+
+
+# =========================
+# FOLD EVALUATION
+# =========================
+def fold_metrics(predictions: np.ndarray, y: np.ndarray, returns: np.ndarray) -> dict:
+    """
+    predictions/y: 1 = up, 0 = down; returns: next-bar return of each bar.
+    The model trades every bar (buy on 1, sell on 0), as in run_backtest.
+    """
+    trade_returns = np.where(predictions == 1, returns, -returns)
+    equity = np.cumprod(1.0 + trade_returns)
+    peak = np.maximum.accumulate(np.concatenate(([1.0], equity)))[1:]
+    std = trade_returns.std()
+
+    return {
+        "trades": int(len(trade_returns)),
+        "accuracy": float(np.mean(predictions == y)),
+        "win_rate": float(np.mean(trade_returns > 0)),
+        "mean_return": float(trade_returns.mean()),
+        "total_return": float(equity[-1] - 1.0),
+        "sharpe": float(trade_returns.mean() / std * np.sqrt(len(trade_returns))) if std > 0 else 0.0,
+        "max_drawdown": float(np.max((peak - equity) / peak)),
+    }
+
+
+def _evaluate_fold(cache_path: str, fold: Fold) -> dict:
+    """
+    Process-pool entry point: fits on the fold's training rows and scores
+    its test window. Reads the cached matrices itself so only the path and
+    the fold indices cross the process boundary.
+    """
+    X, y, close = FeatureCache.load(cache_path)
+    row = {"fold": fold.index, **asdict(fold)}
+    row.pop("index")
+
+    y_train = y[fold.train_start:fold.train_end]
+    if len(np.unique(y_train)) < 2:
+        row["error"] = "single class in training window"
+        return row
+
+    model = fit_direction_model(X[fold.train_start:fold.train_end], y_train, RANDOM_STATE)
+    test = slice(fold.test_start, fold.test_end)
+    predictions = model.predict(X[test])
+    returns = (close[fold.test_start + 1:fold.test_end + 1] - close[test]) / close[test]
+
+    row.update(fold_metrics(predictions, y[test], returns))
+    return row
+
+
+# =========================
+# AGGREGATION
+# =========================
+def summarize_folds(folds: list) -> dict:
+    """
+    Cross-fold stability statistics and the promotion verdict.
+    """
+    scored = [f for f in folds if "error" not in f]
+    aggregate = {}
+    for metric in FOLD_METRICS:
+        values = np.array([f[metric] for f in scored], dtype=float)
+        if values.size == 0:
+            continue
+        aggregate[metric] = {
+            "mean": round(float(values.mean()), 6),
+            "std": round(float(values.std()), 6),
+            "min": round(float(values.min()), 6),
+            "max": round(float(values.max()), 6),
+        }
+
+    positive = sum(1 for f in scored if f["total_return"] > 0)
+    stability = {
+        "folds": len(folds),
+        "scored_folds": len(scored),
+        "positive_folds": round(positive / len(scored), 3) if scored else 0.0,
+        # Dispersion of per-fold returns relative to their mean: high = regime-sensitive
+        "return_dispersion": (
+            round(aggregate["total_return"]["std"] / abs(aggregate["total_return"]["mean"]), 3)
+            if scored and aggregate["total_return"]["mean"] != 0 else None
+        ),
+    }
+
+    passed = bool(
+        scored
+        and len(scored) == len(folds)
+        and aggregate["win_rate"]["mean"] >= MIN_MEAN_WIN_RATE
+        and aggregate["max_drawdown"]["max"] <= MAX_FOLD_DRAWDOWN
+        and stability["positive_folds"] >= MIN_POSITIVE_FOLDS
+    )
+    return {"aggregate": aggregate, "stability": stability, "passed": passed}
+
+
+# =========================
+# ENTRY POINT
+# =========================
+def walk_forward_validate(
+    symbol: str,
+    df: pd.DataFrame,
+    n_folds: int = WALK_FORWARD_FOLDS,
+    scheme: str = WALK_FORWARD_SCHEME,
+    train_size: int = None,
+    test_size: int = None,
+    purge: int = WALK_FORWARD_PURGE_BARS,
+    embargo: int = WALK_FORWARD_EMBARGO_BARS,
+    max_workers: int = None,
+    cache: FeatureCache = None,
+) -> dict:
+    """
+    Runs walk-forward validation for one symbol.
+
+    Returns:
+        {"symbol", "scheme", "purge", "embargo", "samples", "folds": [per-fold
+         metrics], "aggregate": {metric: mean/std/min/max}, "stability",
+         "passed"}
+    """
+    cache = cache or FeatureCache()
+    cache_path = cache.get_or_build(symbol, df)
+    X, _, _ = FeatureCache.load(cache_path)
+    folds = make_folds(len(X), n_folds, scheme, train_size, test_size, purge, embargo)
+
+    max_workers = max(1, min(len(folds), max_workers or os.cpu_count() or 1))
+    logger.info(
+        f"{symbol}: walk-forward | {scheme} | {len(folds)} folds | "
+        f"purge={purge} embargo={embargo} | workers={max_workers}"
+    )
+
+    if max_workers == 1:
+        rows = [_evaluate_fold(cache_path, fold) for fold in folds]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rows = list(pool.map(_evaluate_fold, [cache_path] * len(folds), folds))
+
+    for row in rows:
+        if "error" in row:
+            logger.warning(f"{symbol} fold {row['fold']}: {row['error']}")
+        else:
+            logger.info(
+                f"{symbol} fold {row['fold']}: acc={row['accuracy']:.3f} "
+                f"win={row['win_rate']:.3f} ret={row['total_return']:+.4f} dd={row['max_drawdown']:.4f}"
+            )
+
+    report = {
+        "symbol": symbol,
+        "scheme": scheme,
+        "purge": purge,
+        "embargo": embargo,
+        "samples": len(X),
+        "folds": rows,
+        **summarize_folds(rows),
+    }
+    logger.info(
+        f"{symbol}: walk-forward {'PASSED' if report['passed'] else 'FAILED'} | "
+        f"positive folds={report['stability']['positive_folds']:.0%}"
+    )
+    return report
+
+
+if __name__ == "__main__":
+    from fundednext_trading_system.config.settings import ALLOWED_SYMBOLS
+    from fundednext_trading_system.execution.candle_store import CandleStore
+    from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed
+
+    symbols = sys.argv[1:] or ALLOWED_SYMBOLS
+    candles = DukascopyDataFeed(store=CandleStore()).get_candles_bulk(symbols, TIMEFRAME_BARS, count=5000)
+
+    os.makedirs(TRAINING_LOG_DIR, exist_ok=True)
+    for symbol in symbols:
+        df = candles.get(symbol)
+        if df is None or df.empty:
+            logger.warning(f"No data for {symbol}, skipping.")
+            continue
+        report = walk_forward_validate(symbol, df)
+        path = os.path.join(TRAINING_LOG_DIR, f"walk_forward_{symbol}.json")
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report written to {path}")
@@ -0,0 +1,236 @@
+"""
+REPLAY ENGINE
+--------------------------------
+Drives the real orchestrator pipeline from recorded candles:
+
+    symbol_worker: SignalEngine → MLRouter → RiskManager → TradeGatekeeper → OrderRouter
+
+Bars come from a ReplayDataFeed and are processed as fast as the CPU
+allows (no bar-close waits, no broker calls). Orders go through PAPER
+execution; each simulated fill opens a position on the feed's
+BacktestBroker, which stops it out on later bars and feeds realised P&L
+back to the RiskManager. Open positions reach the risk and gatekeeper
+stages through the per-bar snapshot, so correlation blocking and the
+daily / max-loss limits act as they would live. The run reports bars per
+second, how many decisions ended at each pipeline stage and the paper
+account result.
+
+Usage:
+    REPLAY_MODE=1 python -m fundednext_trading_system.main <start YYYY-MM-DD> <end YYYY-MM-DD> [SYMBOL ...]
+    python -m fundednext_trading_system.replay <start> <end> [SYMBOL ...]
+"""
+
+import sys
+import time
+from collections import Counter
+from datetime import date
+
+from fundednext_trading_system.config.settings import (
+    ALLOWED_SYMBOLS,
+    ATR_PERIOD,
+    ATR_SL_MULTIPLIER,
+    ATR_TP_MULTIPLIERS,
+    CANDLE_STORE_DIR,
+    TIMEFRAME_BARS,
+    TP_CLOSE_PERCENTS,
+)
+from fundednext_trading_system.monitoring.logger import logger
+
+from fundednext_trading_system.backtest.engine import HistoricalCorrelation
+from fundednext_trading_system.execution.candle_store import CandleStore
+from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed
+from fundednext_trading_system.execution.order_router import OrderRouter
+from fundednext_trading_system.execution.partial_tp_manager import PartialTPManager
+from fundednext_trading_system.execution.replay_data_feed import ReplayDataFeed
+from fundednext_trading_system.execution.symbol_stats_manager import SymbolStatsManager
+from fundednext_trading_system.execution.trailing_sl_manager import TrailingSLManager
+
+from fundednext_trading_system.trading_core import clock
+from fundednext_trading_system.trading_core.execution_flags import ExecutionFlags, AccountPhase, ExecutionMode, MLMode
+from fundednext_trading_system.trading_core.ml_router import MLRouter
+from fundednext_trading_system.trading_core.risk_manager import RiskManager
+from fundednext_trading_system.trading_core.signal_engine import SignalEngine
+from fundednext_trading_system.trading_core.trade_gatekeeper import TradeGatekeeper
+
+from fundednext_trading_system.main import symbol_worker
+
+PROGRESS_EVERY_BARS = 50_000
+
+
+class NeutralSentiment:
+    """
+    Historical news is not recorded; replay uses a neutral score instead
+    of fetching live headlines.
+    """
+
+    def get_sentiment(self, symbol):
+        return 0.0
+
+
+class ReplayOrderRouter(OrderRouter):
+    """
+    Paper router that books every simulated fill on the replay feed, so
+    the position exists for the following bars.
+    """
+
+    def __init__(self, execution_flags: ExecutionFlags, feed: ReplayDataFeed):
+        super().__init__(execution_flags)
+        self.feed = feed
+
+    def _shadow_execute(self, order):
+        fill = self.feed.record_fill(order)
+        if fill is None:
+            return self._reject(order, "Paper fill refused")
+        return {**super()._shadow_execute(order), "ticket": fill.order, "price": fill.price}
+
+
+def _risk_feedback(risk_manager: RiskManager):
+    def on_deal(deal):
+        net = deal.profit - deal.commission
+        if net < 0:
+            risk_manager.register_loss(-net)
+        else:
+            risk_manager.register_profit(net)
+    return on_deal
+
+
+def run_replay(feed: ReplayDataFeed, max_bars: int = None, quiet: bool = True) -> dict:
+    """
+    Replays every bar of the feed through symbol_worker and returns a report.
+    quiet: silence pipeline logging while replaying (logging dominates runtime).
+
+    A FixedClock follows the replayed bar times, so daily-loss resets,
+    session windows and cooldowns run on simulated time.
+    """
+    execution_flags = ExecutionFlags(
+        account_phase=AccountPhase.CHALLENGE,
+        execution_mode=ExecutionMode.PAPER,
+        ml_mode=MLMode.INFERENCE,
+    )
+    risk_manager = RiskManager(correlation_manager=HistoricalCorrelation(feed.bars))
+    trade_gatekeeper = TradeGatekeeper(execution_flags, risk_manager)
+    ml_router = MLRouter(execution_flags)
+    signal_engine = SignalEngine(confidence_threshold=0.7)
+    signal_engine.news_sentiment = NeutralSentiment()
+    order_router = ReplayOrderRouter(execution_flags, feed)
+
+    broker = feed.broker
+    broker.on_deal = _risk_feedback(risk_manager)
+
+    partial_tp_manager = PartialTPManager(
+        tp_multipliers=ATR_TP_MULTIPLIERS,
+        close_percents=TP_CLOSE_PERCENTS,
+        atr_period=ATR_PERIOD,
+        atr_multiplier=ATR_SL_MULTIPLIER,
+        broker=broker,
+    )
+    trailing_sl_manager = TrailingSLManager(
+        atr_period=ATR_PERIOD,
+        atr_multiplier=ATR_SL_MULTIPLIER,
+        broker=broker,
+    )
+
+    stats_manager = SymbolStatsManager()
+    for sym in feed.symbols:
+        stats_manager.init_symbol(sym)
+
+    total = feed.total_bars() if max_bars is None else min(max_bars, feed.total_bars())
+    logger.info(f"▶️ Replay started | symbols={len(feed.symbols)} | bars={total}")
+
+    outcomes = Counter()
+    per_symbol = {sym: Counter() for sym in feed.symbols}
+    bars = 0
+    first_time = last_time = None
+
+    if quiet:
+        logger.disable("fundednext_trading_system")
+
+    sim_clock = clock.FixedClock(0)
+    previous_clock = clock.set_clock(sim_clock)
+
+    started = time.perf_counter()
+    try:
+        for bar_time, due in feed.timeline():
+            sim_clock.set(bar_time)
+            if first_time is None:
+                first_time = bar_time
+            last_time = bar_time
+
+            snapshot = feed.capture_snapshot(due)
+            for symbol in due:
+                outcome = symbol_worker(
+                    symbol,
+                    feed,
+                    signal_engine,
+                    ml_router,
+                    risk_manager,
+                    trade_gatekeeper,
+                    order_router,
+                    partial_tp_manager,
+                    trailing_sl_manager,
+                    execution_flags,
+                    stats_manager,
+                    snapshot=snapshot,
+                    dry_run=False,
+                )
+                outcomes[outcome] += 1
+                per_symbol[symbol][outcome] += 1
+
+            if broker.has_positions():
+                risk_manager.update_equity(broker.equity())
+
+            bars += len(due)
+            if not quiet and bars % PROGRESS_EVERY_BARS < len(due):
+                elapsed = time.perf_counter() - started
+                logger.info(f"Replay progress | {bars}/{total} bars | {bars / elapsed:,.0f} bars/s")
+
+            if max_bars is not None and bars >= max_bars:
+                break
+    finally:
+        elapsed = time.perf_counter() - started
+        clock.set_clock(previous_clock)
+        if quiet:
+            logger.enable("fundednext_trading_system")
+
+    report = {
+        "bars": bars,
+        "elapsed_seconds": round(elapsed, 3),
+        "bars_per_second": round(bars / elapsed, 1) if elapsed > 0 else 0.0,
+        "simulated_minutes": (last_time - first_time) / 60 if bars else 0,
+        "decisions": dict(outcomes),
+        "per_symbol": {sym: dict(c) for sym, c in per_symbol.items()},
+        "trades": {sym: stats_manager.stats[sym]["trades"] for sym in feed.symbols},
+        "paper": {
+            "open_positions": len(broker.positions_get()),
+            "closed_deals": sum(1 for deal in broker.deals if deal.entry == "out"),
+            "net_profit": round(broker.balance - risk_manager.start_balance, 2),
+            "equity": round(broker.equity(), 2),
+            "daily_loss": round(risk_manager.daily_loss, 2),
+            "total_loss": round(risk_manager.total_loss, 2),
+        },
+    }
+
+    logger.success(
+        f"⏹️ Replay finished | bars={bars} | {elapsed:.1f}s | "
+        f"{report['bars_per_second']:,.0f} bars/s"
+    )
+    for outcome, count in outcomes.most_common():
+        logger.info(f"  {outcome:<20} {count}")
+    return report
+
+
+def replay_main(argv):
+    if len(argv) < 2:
+        print("Usage: replay <start YYYY-MM-DD> <end YYYY-MM-DD> [SYMBOL ...]")
+        sys.exit(1)
+
+    start, end = date.fromisoformat(argv[0]), date.fromisoformat(argv[1])
+    symbols = argv[2:] or ALLOWED_SYMBOLS
+    timeframe_str = DukascopyDataFeed.TIMEFRAME_MAP.get(TIMEFRAME_BARS, "M5")
+
+    feed = ReplayDataFeed.from_store(CandleStore(CANDLE_STORE_DIR), symbols, timeframe_str, start, end)
+    run_replay(feed)
+
+
+if __name__ == "__main__":
+    replay_main(sys.argv[1:])
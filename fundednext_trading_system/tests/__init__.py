@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+
+def has_mt5():
+    # The package directory itself can shadow the module when it is on sys.path
+    try:
+        import MetaTrader5
+    except ImportError:
+        return False
+    return hasattr(MetaTrader5, 'TIMEFRAME_M1')
+
+HAS_MT5 = has_mt5()
+
+def make_frame(n, seed, start=1704067200):
+    """Random-walk M5 candles (time in epoch seconds)."""
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+    return pd.DataFrame({
+        'time': start + np.arange(n) * 300,
+        'open': close, 'high': close + 0.0003, 'low': close - 0.0003,
+        'close': close, 'tick_volume': 100.0,
+    })
@@ -0,0 +1,94 @@
+import unittest
+import numpy as np
+from fundednext_trading_system.backtest.broker import BacktestBroker
+from fundednext_trading_system.backtest.costs import CostModel
+from fundednext_trading_system.execution.candle_store import CANDLE_DTYPE
+from fundednext_trading_system.tests import HAS_MT5
+
+def make_bars(closes, start=1704067200, spread=0.0002):
+    closes = np.asarray(closes, dtype=float)
+    bars = np.zeros(len(closes), dtype=CANDLE_DTYPE)
+    bars['time'] = start + 60 * np.arange(len(closes))
+    bars['open'] = np.concatenate(([closes[0]], closes[:-1]))
+    bars['close'] = closes
+    bars['high'] = np.maximum(bars['open'], closes) + spread
+    bars['low'] = np.minimum(bars['open'], closes) - spread
+    return bars
+
+def buy(broker, volume, sl=0.0, tp=0.0):
+    return broker.order_send({
+        'action': broker.TRADE_ACTION_DEAL, 'symbol': 'EURUSD', 'volume': volume,
+        'type': broker.ORDER_TYPE_BUY, 'sl': sl, 'tp': tp,
+    })
+
+class TestBacktestBroker(unittest.TestCase):
+
+    def test_costs_and_partial_close(self):
+        costs = CostModel(spread_points=10, slippage_points=2, commission_per_lot=3.5)
+        broker = BacktestBroker(10_000, costs)
+        broker.update_bar('EURUSD', 0, 1.1000, 1.1000, 1.1000, 1.1000)
+
+        opened = buy(broker, 1.0)
+        self.assertAlmostEqual(opened.price, 1.1000 + 12 * 0.00001)
+        self.assertAlmostEqual(broker.balance, 10_000 - 3.5)
+
+        broker.update_bar('EURUSD', 60, 1.1000, 1.1050, 1.1000, 1.1050)
+        closed = broker.order_send({
+            'action': broker.TRADE_ACTION_DEAL, 'symbol': 'EURUSD', 'volume': 0.5, 'position': opened.order,
+        })
+        self.assertEqual(closed.retcode, broker.TRADE_RETCODE_DONE)
+        (position,) = broker.positions_get('EURUSD')
+        self.assertAlmostEqual(position.volume, 0.5)
+        self.assertAlmostEqual(broker.deals[-1].profit, (1.1050 - 2e-5 - opened.price) * 0.5 * 100_000)
+
+        self.assertEqual(buy(broker, 0.005).retcode, broker.TRADE_RETCODE_INVALID_VOLUME)
+
+    def test_stop_loss_wins_when_both_levels_are_inside_a_bar(self):
+        closed = []
+        broker = BacktestBroker(10_000, CostModel(commission_per_lot=0.0), on_deal=closed.append)
+        broker.update_bar('EURUSD', 0, 1.1000, 1.1000, 1.1000, 1.1000)
+        buy(broker, 0.1, sl=1.0990, tp=1.1010)
+
+        # Same bar as the fill: levels are not checked against its range
+        broker.update_bar('EURUSD', 0, 1.1000, 1.1020, 1.0980, 1.1000)
+        self.assertTrue(broker.has_positions('EURUSD'))
+
+        broker.update_bar('EURUSD', 60, 1.1000, 1.1020, 1.0980, 1.1000)
+        self.assertFalse(broker.has_positions())
+        self.assertEqual(closed[0].reason, 'sl')
+        self.assertAlmostEqual(closed[0].price, 1.0990)
+        self.assertAlmostEqual(broker.equity(), broker.balance)
+
+@unittest.skipUnless(HAS_MT5, 'exit managers import MetaTrader5')
+class TestPortfolioBacktester(unittest.TestCase):
+
+    def run_backtest(self, closes, signal_at):
+        from fundednext_trading_system.backtest.engine import PortfolioBacktester
+        bars = make_bars(closes)
+        signals = np.zeros(len(bars), dtype=np.int8)
+        signals[signal_at] = 1
+        backtester = PortfolioBacktester({'EURUSD': bars}, {'EURUSD': signals}, CostModel(commission_per_lot=0.0))
+        return backtester, backtester.run()
+
+    def test_winning_trade_runs_through_partial_tp_and_trailing_sl(self):
+        closes = np.concatenate([np.full(60, 1.1000), 1.1000 + 0.0004 * np.arange(1, 41)])
+        backtester, report = self.run_backtest(closes, 59)
+
+        self.assertEqual(report['decisions']['opened'], 1)
+        comments = [d.reason for d in backtester.broker.deals]
+        self.assertIn('PARTIAL TP', comments)
+        self.assertGreater(report['net_profit'], 0)
+        self.assertEqual(report['bars'], len(closes))
+        self.assertEqual(len(backtester.equity_curve), len(closes))
+
+    def test_losing_trade_feeds_the_risk_manager(self):
+        closes = np.concatenate([np.full(60, 1.1000), 1.1000 - 0.0004 * np.arange(1, 41)])
+        backtester, report = self.run_backtest(closes, 59)
+
+        (exit_deal,) = [d for d in backtester.broker.deals if d.entry == 'out']
+        self.assertEqual(exit_deal.reason, 'sl')
+        self.assertAlmostEqual(backtester.risk_manager.daily_loss, -report['net_profit'], places=6)
+        self.assertGreater(report['max_drawdown'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.execution.bar_aggregator import BarAggregator, MultiTimeframeAggregator
+
+RATES_DTYPE = np.dtype([
+    ('time', 'i8'), ('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'),
+    ('tick_volume', 'u8'), ('spread', 'i4'), ('real_volume', 'u8'),
+])
+
+def make_m1(n, start=1704067200, seed=5):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+    rates = np.zeros(n, dtype=RATES_DTYPE)
+    rates['time'] = start + np.arange(n) * 60
+    rates['open'] = close + rng.normal(0, 0.0001, n)
+    rates['high'] = close + 0.0003
+    rates['low'] = close - 0.0003
+    rates['close'] = close
+    rates['tick_volume'] = rng.integers(10, 100, n)
+    rates['spread'] = rng.integers(0, 10, n)
+    rates['real_volume'] = rng.integers(100, 1000, n)
+    if n > 760:
+        # Hole in the stream (market closed)
+        rates = np.delete(rates, np.arange(700, 760))
+    return rates
+
+def pandas_resample(rates, seconds):
+    frame = pd.DataFrame(rates, index=pd.to_datetime(rates['time'], unit='s'))
+    out = frame.resample(f'{seconds}s').agg({
+        'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last',
+        'tick_volume': 'sum', 'real_volume': 'sum',
+    })
+    out = out[frame['time'].resample(f'{seconds}s').count() > 0]
+    return out.index.as_unit('s').asi8, out
+
+class TestBarAggregator(unittest.TestCase):
+
+    def test_incremental_matches_pandas_resample(self):
+        m1 = make_m1(2000)
+        mtf = MultiTimeframeAggregator(capacity=1000)
+
+        # Feed a sliding 300-bar window, one new M1 bar at a time
+        for end in range(300, len(m1) + 1):
+            mtf.update(m1[end - 300:end])
+
+        for seconds in (300, 900, 3600, 14400):
+            candles = mtf.candles(seconds)
+            times, expected = pandas_resample(m1, seconds)
+
+            # The cold start drops a leading bucket only if it was incomplete
+            offset = len(times) - len(candles)
+            self.assertIn(offset, (0, 1))
+            np.testing.assert_array_equal(candles['time'], times[offset:])
+            for column in ('open', 'high', 'low', 'close', 'tick_volume', 'real_volume'):
+                np.testing.assert_allclose(candles[column], expected[column].values[offset:], err_msg=f'{seconds}s {column}')
+
+    def test_forming_bar_tracks_latest_m1(self):
+        m1 = make_m1(40)
+        agg = BarAggregator(900)
+        agg.update(m1[:37])
+
+        forming = agg.view(1)
+        self.assertEqual(forming['time'][0], m1['time'][30])
+        self.assertEqual(forming['close'][0], m1['close'][36])
+        self.assertEqual(len(agg.view(include_forming=False)), 2)
+
+if __name__ == '__main__':
+    unittest.main()
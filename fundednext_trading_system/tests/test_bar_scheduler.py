@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+from fundednext_trading_system.trading_core.bar_scheduler import BarCloseScheduler
+
+class FakeFeed:
+    def __init__(self, bar_times):
+        self.bar_times = dict(bar_times)
+        self.calls = 0
+
+    def latest_bar_time(self, symbol, timeframe):
+        self.calls += 1
+        value = self.bar_times[symbol]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+class TestBarCloseScheduler(unittest.TestCase):
+
+    def test_first_poll_dispatches_every_symbol_with_a_bar(self):
+        feed = FakeFeed({'EURUSD': 60, 'GBPUSD': 60, 'USDJPY': None})
+        scheduler = BarCloseScheduler(feed, ['EURUSD', 'GBPUSD', 'USDJPY'], timeframe=1)
+        self.assertEqual(scheduler.poll(), ['EURUSD', 'GBPUSD'])
+        self.assertEqual(scheduler.last_bar_times(), {'EURUSD': 60, 'GBPUSD': 60, 'USDJPY': None})
+
+    def test_only_symbols_with_a_new_bar_are_due(self):
+        feed = FakeFeed({'EURUSD': 60, 'GBPUSD': 60})
+        scheduler = BarCloseScheduler(feed, ['EURUSD', 'GBPUSD'], timeframe=1)
+        scheduler.poll()
+        self.assertEqual(scheduler.poll(), [])
+
+        feed.bar_times['GBPUSD'] = 120
+        self.assertEqual(scheduler.poll(), ['GBPUSD'])
+        self.assertEqual(scheduler.poll(), [])
+
+    def test_poll_errors_skip_the_symbol(self):
+        feed = FakeFeed({'EURUSD': RuntimeError('terminal gone'), 'GBPUSD': 60})
+        scheduler = BarCloseScheduler(feed, ['EURUSD', 'GBPUSD'], timeframe=1)
+        self.assertEqual(scheduler.poll(), ['GBPUSD'])
+
+    def test_wait_returns_empty_without_a_new_bar(self):
+        feed = FakeFeed({'EURUSD': 60})
+        scheduler = BarCloseScheduler(feed, ['EURUSD'], timeframe=1, poll_seconds=0.01)
+        scheduler.poll()
+
+        started = time.monotonic()
+        self.assertEqual(scheduler.wait_for_new_bars(max_wait=0.05), [])
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        self.assertGreater(feed.calls, 2)
+
+        stop = threading.Event()
+        stop.set()
+        self.assertEqual(scheduler.wait_for_new_bars(stop_event=stop), [])
+
+    def test_wait_returns_once_a_bar_closes(self):
+        feed = FakeFeed({'EURUSD': 60})
+        scheduler = BarCloseScheduler(feed, ['EURUSD'], timeframe=1, poll_seconds=0.01)
+        scheduler.poll()
+
+        timer = threading.Timer(0.03, feed.bar_times.__setitem__, ('EURUSD', 120))
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertEqual(scheduler.wait_for_new_bars(max_wait=5), ['EURUSD'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+from fundednext_trading_system.execution.candle_buffer import CandleRingBuffer
+
+DTYPE = np.dtype([('time', '<i8'), ('close', '<f8')])
+
+def make_rates(start, count, close_offset=0.0):
+    rates = np.zeros(count, dtype=DTYPE)
+    rates['time'] = (start + np.arange(count)) * 60
+    rates['close'] = start + np.arange(count) + close_offset
+    return rates
+
+class TestCandleRingBuffer(unittest.TestCase):
+
+    def test_merge_refreshes_forming_bar_and_appends(self):
+        buffer = CandleRingBuffer(5, DTYPE)
+        buffer.seed(make_rates(0, 5))
+
+        # Last stored bar (t=4) is re-sent with a new close, plus two new bars
+        appended = buffer.merge(make_rates(3, 4, close_offset=0.5))
+
+        self.assertEqual(appended, 2)
+        view = buffer.view()
+        np.testing.assert_array_equal(view['time'], np.arange(2, 7) * 60)
+        np.testing.assert_array_equal(view['close'], [2.0, 3.0, 4.5, 5.5, 6.5])
+
+    def test_view_is_zero_copy_and_read_only(self):
+        buffer = CandleRingBuffer(4, DTYPE)
+        buffer.seed(make_rates(0, 4))
+        view = buffer.view(2)
+
+        self.assertFalse(view.flags.writeable)
+        self.assertFalse(view.flags.owndata)
+        np.testing.assert_array_equal(view['time'], [120, 180])
+
+    def test_long_run_matches_tail_of_full_history(self):
+        buffer = CandleRingBuffer(50, DTYPE)
+        buffer.seed(make_rates(0, 50))
+
+        for start in range(49, 500, 3):
+            buffer.merge(make_rates(start, 4))
+
+        np.testing.assert_array_equal(buffer.view()['time'], make_rates(0, 503)['time'][-50:])
+        self.assertEqual(len(buffer), 50)
+
+if __name__ == '__main__':
+    unittest.main()
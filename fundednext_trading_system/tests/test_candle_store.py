@@ -0,0 +1,113 @@
+import io
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.execution.candle_store import CandleStore, day_bounds, frame_to_records
+from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed, _DayWriter
+
+def make_day(day, step=300):
+    start, end = day_bounds(day)
+    times = np.arange(start, end, step)
+    close = np.linspace(1.0, 1.1, len(times))
+    return pd.DataFrame({
+        'time': times, 'open': close, 'high': close + 0.001,
+        'low': close - 0.001, 'close': close, 'tick_volume': 100.0,
+    })
+
+class TestCandleStore(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store = CandleStore(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_write_and_read_range(self):
+        days = [date(2024, 1, 2), date(2024, 1, 3)]
+        df = pd.concat([make_day(d) for d in days], ignore_index=True)
+        self.store.write_days('EURUSD', 'M5', df, days)
+
+        out = self.store.read_frame('EURUSD', 'M5', days[0], days[1])
+        self.assertEqual(len(out), 2 * 288)
+        np.testing.assert_array_equal(out['time'].values, df['time'].values)
+
+    def test_missing_days_skips_stored_and_empty_days(self):
+        self.store.write_days('EURUSD', 'M5', make_day(date(2024, 1, 5)), [date(2024, 1, 5), date(2024, 1, 6)])
+
+        missing = self.store.missing_days('EURUSD', 'M5', date(2024, 1, 4), date(2024, 1, 7), today=date(2024, 2, 1))
+        self.assertEqual(missing, [date(2024, 1, 4), date(2024, 1, 7)])
+
+    def test_append_merges_overlapping_bars(self):
+        day = date(2024, 1, 2)
+        full = make_day(day)
+        self.store.write_days('EURUSD', 'M5', full.iloc[:100], [day])
+
+        update = full.iloc[90:150].copy()
+        update['close'] += 1.0
+        self.store.write_days('EURUSD', 'M5', update, [day])
+
+        out = self.store.read_frame('EURUSD', 'M5', day, day)
+        self.assertEqual(len(out), 150)
+        self.assertTrue(out['time'].is_monotonic_increasing)
+        self.assertAlmostEqual(out['close'].iloc[95], full['close'].iloc[95] + 1.0)
+
+    def test_partial_day_stays_missing_until_complete(self):
+        day = date(2024, 1, 2)
+        full = make_day(day)
+        self.store.write_days('EURUSD', 'M5', full.iloc[:72], [day], partial=True)
+        self.assertEqual(self.store.missing_days('EURUSD', 'M5', day, day, today=day + timedelta(days=1)), [day])
+
+        self.store.write_days('EURUSD', 'M5', full, [day])
+        self.assertEqual(self.store.missing_days('EURUSD', 'M5', day, day, today=day + timedelta(days=1)), [])
+        self.assertEqual(len(self.store.read_frame('EURUSD', 'M5', day, day)), 288)
+
+    def test_day_written_before_midnight_is_refetched_after(self):
+        day = date(2024, 1, 2)
+        full = make_day(day)
+        next_day = day + timedelta(days=1)
+
+        # 06:00 UTC: only the first 72 bars of the day exist yet
+        writer = _DayWriter(self.store, 'EURUSD', 'M5', [day], today=day)
+        writer.add(frame_to_records(full.iloc[:72]))
+        writer.finish()
+        self.assertEqual(len(self.store.read_frame('EURUSD', 'M5', day, day)), 72)
+
+        # After midnight the partial day must still be downloaded
+        self.assertEqual(self.store.missing_days('EURUSD', 'M5', day, next_day, today=next_day), [day, next_day])
+
+        writer = _DayWriter(self.store, 'EURUSD', 'M5', [day, next_day], today=next_day)
+        writer.add(frame_to_records(full))
+        writer.finish()
+
+        self.assertEqual(self.store.missing_days('EURUSD', 'M5', day, next_day, today=next_day), [next_day])
+        self.assertEqual(len(self.store.read_frame('EURUSD', 'M5', day, day)), 288)
+        self.assertEqual(self.store.missing_days('EURUSD', 'M5', day, next_day, today=next_day + timedelta(days=1)), [next_day])
+
+    @patch('subprocess.Popen')
+    def test_feed_downloads_only_missing_days(self, mock_popen):
+        csv = make_day(datetime.now(timezone.utc).date()).to_csv(index=False).replace('tick_volume', 'volume').replace('time', 'timestamp')
+        def popen(*args, **kwargs):
+            process_mock = MagicMock()
+            process_mock.stdout = io.BytesIO(csv.encode())
+            process_mock.wait.return_value = 0
+            return process_mock
+        mock_popen.side_effect = popen
+
+        feed = DukascopyDataFeed(store=self.store)
+        feed.get_candles('EURUSD', 300, 1000)
+        first_call = mock_popen.call_args[0][0]
+        self.assertEqual(mock_popen.call_count, 1)
+
+        # Second request: only the (incomplete) current day is fetched again
+        feed.get_candles('EURUSD', 300, 1000)
+        second_call = mock_popen.call_args[0][0]
+        self.assertEqual(mock_popen.call_count, 2)
+        self.assertLess(first_call[first_call.index('-s') + 1], second_call[second_call.index('-s') + 1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from fundednext_trading_system.execution.candles import Candles
+from fundednext_trading_system.trading_core.indicator_cache import IndicatorCache, atr_series
+from fundednext_trading_system.trading_core.signal_engine import SignalEngine
+
+RATES_DTYPE = np.dtype([
+    ('time', 'i8'), ('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'),
+    ('tick_volume', 'u8'), ('spread', 'i4'), ('real_volume', 'u8'),
+])
+
+def make_rates(n=300, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+    spread = np.abs(rng.normal(0, 0.0003, n))
+    rates = np.zeros(n, dtype=RATES_DTYPE)
+    rates['time'] = 1700000000 + np.arange(n) * 60
+    rates['open'] = close + rng.normal(0, 0.0001, n)
+    rates['high'] = close + spread
+    rates['low'] = close - spread
+    rates['close'] = close
+    return rates
+
+class TestCandles(unittest.TestCase):
+
+    def setUp(self):
+        self.rates = make_rates()
+        self.candles = Candles(self.rates)
+        self.frame = self.candles.to_frame()
+
+    def test_columns_are_zero_copy_views(self):
+        self.assertTrue(np.shares_memory(self.candles['close'], self.rates))
+        self.assertEqual(len(self.candles.tail(10)), 10)
+        self.assertEqual(self.candles.last_time, int(self.rates['time'][-1]))
+
+    def test_latest_indicator_values_match_series(self):
+        cache = IndicatorCache()
+        close = self.frame['close']
+
+        self.assertAlmostEqual(cache.atr_value(self.candles, 14), atr_series(self.frame, 14).iloc[-1], places=12)
+        self.assertAlmostEqual(cache.sma_value(self.candles, 50), close.rolling(50).mean().iloc[-1], places=12)
+        self.assertAlmostEqual(cache.sma_value(self.candles, 50, offset=1), close.rolling(50).mean().iloc[-2], places=12)
+        self.assertAlmostEqual(cache.rolling_std_value(self.candles, 20), close.rolling(20).std().iloc[-1], places=12)
+        self.assertAlmostEqual(cache.std(self.candles), close.std(), places=12)
+
+    def test_latest_features_match_full_frame(self):
+        engine = SignalEngine()
+        expected = engine.prepare_features(self.frame).iloc[[-1]]
+        actual = engine.prepare_latest_features(self.candles)
+
+        self.assertEqual(list(actual.columns), list(expected.columns))
+        np.testing.assert_allclose(actual.values, expected.values.astype(float), rtol=1e-10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from fundednext_trading_system.trading_core import clock
+from fundednext_trading_system.trading_core.risk_manager import RiskManager
+from fundednext_trading_system.trading_core.session_filter import is_within_trading_session
+
+class TestClock(unittest.TestCase):
+
+    def test_fixed_clock_only_moves_when_advanced(self):
+        sim = clock.FixedClock(datetime(2024, 3, 4, 8, 0))
+        with clock.use_clock(sim):
+            self.assertEqual(clock.utcnow(), datetime(2024, 3, 4, 8, 0))
+            clock.sleep(90)
+            self.assertEqual(clock.utcnow(), datetime(2024, 3, 4, 8, 1, 30))
+            sim.set(0)
+            self.assertEqual(clock.today(), datetime(1970, 1, 1).date())
+        self.assertIsInstance(clock.get_clock(), clock.RealClock)
+
+    def test_fast_forward_clock_scales_wall_time(self):
+        start = datetime(2024, 3, 4)
+        with patch.object(clock._time, 'monotonic', side_effect=[100.0, 101.5]):
+            ff = clock.FastForwardClock(start, speed=600)
+            self.assertEqual(ff.now(), start + timedelta(minutes=15))
+
+    def test_session_filter_follows_simulated_time(self):
+        sim = clock.FixedClock(datetime(2024, 3, 4, 8, 0))  # Monday, London
+        with clock.use_clock(sim):
+            self.assertTrue(is_within_trading_session())
+            sim.advance(days=5)  # Saturday
+            self.assertFalse(is_within_trading_session())
+
+    @patch('fundednext_trading_system.trading_core.risk_manager.CorrelationManager')
+    def test_daily_loss_resets_on_simulated_day(self, _):
+        sim = clock.FixedClock(datetime(2024, 3, 4, 23, 0))
+        with clock.use_clock(sim):
+            risk_manager = RiskManager()
+            risk_manager.daily_loss = 120.0
+
+            sim.advance(minutes=30)
+            risk_manager._reset_daily_if_new_day()
+            self.assertEqual(risk_manager.daily_loss, 120.0)
+
+            sim.advance(minutes=30)
+            risk_manager._reset_daily_if_new_day()
+            self.assertEqual(risk_manager.daily_loss, 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
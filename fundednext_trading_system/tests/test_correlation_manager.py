@@ -6,8 +6,8 @@ from fundednext_trading_system.trading_core.correlation_manager import Correlati
 class TestCorrelationManager(unittest.TestCase):
 
     @patch('fundednext_trading_system.trading_core.correlation_manager.threading.Thread')
-    @patch('fundednext_trading_system.execution.dukascopy_data_feed.DukascopyDataFeed.get_candles')
-    def test_correlation_matrix_calculation(self, mock_get_candles, mock_thread):
+    @patch('fundednext_trading_system.execution.dukascopy_data_feed.DukascopyDataFeed.get_candles_bulk')
+    def test_correlation_matrix_calculation(self, mock_get_candles_bulk, mock_thread):
         # Mock the Thread class to prevent the background thread from starting
         mock_thread.return_value = MagicMock()
 
@@ -19,13 +19,13 @@ class TestCorrelationManager(unittest.TestCase):
             'USDJPY': pd.DataFrame({'time': time_index, 'close': [130.0, 129.0, 128.0, 128.5, 127.5]}).set_index('time')
         }
 
-        def side_effect(symbol, timeframe, count):
-            df = mock_data.get(symbol)
-            if df is not None:
-                return df.reset_index()
-            return pd.DataFrame()
+        def side_effect(symbols, timeframe, count):
+            return {
+                symbol: mock_data[symbol].reset_index() if symbol in mock_data else pd.DataFrame()
+                for symbol in symbols
+            }
 
-        mock_get_candles.side_effect = side_effect
+        mock_get_candles_bulk.side_effect = side_effect
 
         # Initialize the correlation manager
         with patch('fundednext_trading_system.config.settings.ALLOWED_SYMBOLS', ['EURUSD', 'GBPUSD', 'USDJPY']):
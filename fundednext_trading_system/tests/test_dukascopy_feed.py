@@ -1,6 +1,7 @@
+import io
 import unittest
 from unittest.mock import patch, MagicMock
-from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed
+from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed, find_gaps
 import pandas as pd
 
 class TestDukascopyDataFeed(unittest.TestCase):
@@ -9,8 +10,8 @@ class TestDukascopyDataFeed(unittest.TestCase):
     def test_get_candles_success(self, mock_popen):
         # Mock the subprocess call
         process_mock = MagicMock()
-        process_mock.communicate.return_value = (b'timestamp,open,high,low,close,volume\n1672531200,1.0,1.1,0.9,1.05,100\n', b'')
-        process_mock.returncode = 0
+        process_mock.stdout = io.BytesIO(b'timestamp,open,high,low,close,volume\n1672531200,1.0,1.1,0.9,1.05,100\n')
+        process_mock.wait.return_value = 0
         mock_popen.return_value = process_mock
 
         # Initialize the data feed and get candles
@@ -27,8 +28,8 @@ class TestDukascopyDataFeed(unittest.TestCase):
     def test_get_candles_failure(self, mock_popen):
         # Mock the subprocess call to simulate an error
         process_mock = MagicMock()
-        process_mock.communicate.return_value = (b'', b'Error')
-        process_mock.returncode = 1
+        process_mock.stdout = io.BytesIO(b'')
+        process_mock.wait.return_value = 1
         mock_popen.return_value = process_mock
 
         # Initialize the data feed and get candles
@@ -38,5 +39,60 @@ class TestDukascopyDataFeed(unittest.TestCase):
         # Assertions
         self.assertIsNone(df)
 
+    @patch('subprocess.Popen')
+    def test_get_candles_streams_in_chunks_and_keeps_tail(self, mock_popen):
+        rows = ''.join(f'{1672531200000 + i * 300000},1.0,1.1,0.9,{i},100\n' for i in range(2500))
+        process_mock = MagicMock()
+        process_mock.stdout = io.BytesIO(('timestamp,open,high,low,close,volume\n' + rows).encode())
+        process_mock.wait.return_value = 0
+        mock_popen.return_value = process_mock
+
+        feed = DukascopyDataFeed()
+        feed.CHUNK_ROWS = 400
+        df = feed.get_candles('EURUSD', 300, 100)
+
+        self.assertEqual(len(df), 100)
+        self.assertEqual(df['close'].tolist(), [float(i) for i in range(2400, 2500)])
+        self.assertEqual(int(df['time'].iloc[-1]), 1672531200 + 2499 * 300)
+
+    @patch('subprocess.Popen')
+    def test_get_candles_bulk_merges_chunks_per_symbol(self, mock_popen):
+        start_ts = 1672531200  # 2023-01-01 00:00 UTC
+        calls = []
+
+        def popen(command, **kwargs):
+            symbol = command[1]
+            start = int(pd.Timestamp(command[command.index('-s') + 1], tz='UTC').timestamp())
+            end = int(pd.Timestamp(command[command.index('-e') + 1], tz='UTC').timestamp())
+            calls.append((symbol, start))
+            # Chunks overlap by one bar at their edges; the merge must dedupe
+            times = range(max(start, start_ts) - 300, end + 300, 300)
+            offset = 1.0 if symbol == 'EURUSD' else 2.0
+            rows = ''.join(f'{t * 1000},1,1,1,{offset + (t - start_ts) / 1e6},1\n' for t in times)
+            process_mock = MagicMock()
+            process_mock.stdout = io.BytesIO(('timestamp,open,high,low,close,volume\n' + rows).encode())
+            process_mock.wait.return_value = 0
+            return process_mock
+
+        mock_popen.side_effect = popen
+
+        feed = DukascopyDataFeed()
+        with patch.object(DukascopyDataFeed, '_date_range', return_value=(
+                pd.Timestamp('2023-01-01').to_pydatetime(), pd.Timestamp('2023-01-10').to_pydatetime())):
+            result = feed.get_candles_bulk(['EURUSD', 'GBPUSD'], 300, 1000, chunk_days=3, max_workers=4)
+
+        self.assertEqual(len(calls), 8)  # 10 days in 3-day chunks, per symbol
+        for symbol, offset in (('EURUSD', 1.0), ('GBPUSD', 2.0)):
+            df = result[symbol]
+            self.assertEqual(len(df), 1000)
+            self.assertTrue((df['time'].diff().dropna() == 300).all())
+            self.assertAlmostEqual(df['close'].iloc[-1], offset + (df['time'].iloc[-1] - start_ts) / 1e6)
+
+    def test_find_gaps_ignores_weekend(self):
+        friday_close = 1673038800   # 2023-01-06 21:00 UTC (Friday)
+        sunday_open = 1673211600    # 2023-01-08 21:00 UTC (Sunday)
+        times = [friday_close - 300, friday_close, sunday_open, sunday_open + 300, sunday_open + 3600]
+        self.assertEqual(find_gaps(times, 300), [(sunday_open + 300, sunday_open + 3600)])
+
 if __name__ == '__main__':
     unittest.main()
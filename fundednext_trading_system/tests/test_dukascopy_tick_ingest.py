@@ -0,0 +1,109 @@
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.execution.candle_store import CandleStore, day_bounds
+from fundednext_trading_system.execution.dukascopy_tick_ingest import (
+    BI5_RECORD,
+    TICK_BAR_DTYPE,
+    day_dir,
+    decode_bi5,
+    ingest_directory,
+    load_day_ticks,
+    point_size,
+    resample_ticks,
+)
+from fundednext_trading_system.config.settings import ALLOWED_SYMBOLS
+
+DAY = date(2024, 3, 5)
+
+def write_hour(root, symbol, day, hour, n, rng, base=108000):
+    raw = np.empty(n, dtype=BI5_RECORD)
+    raw['ms'] = np.sort(rng.integers(0, 3600 * 1000, n))
+    raw['bid'] = base + np.cumsum(rng.integers(-3, 4, n))
+    raw['ask'] = raw['bid'] + rng.integers(1, 20, n)
+    raw['ask_volume'] = rng.random(n)
+    raw['bid_volume'] = rng.random(n)
+
+    directory = day_dir(root, symbol, day)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f'{hour:02d}h_ticks.bi5'), 'wb') as f:
+        f.write(lzma.compress(raw.tobytes()))
+
+class TestDukascopyTickIngest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.store_root = tempfile.mkdtemp()
+        rng = np.random.default_rng(3)
+        for hour in (0, 1, 5):
+            write_hour(self.root, 'EURUSD', DAY, hour, 4000, rng)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+        shutil.rmtree(self.store_root)
+
+    def test_decode_bi5(self):
+        raw = np.array([(1500, 108010, 108000, 1.5, 2.5)], dtype=BI5_RECORD)
+        ticks = decode_bi5(lzma.compress(raw.tobytes()), 1700000000, 0.00001)
+
+        self.assertEqual(ticks['time_ms'][0], 1700000001500)
+        self.assertAlmostEqual(ticks['bid'][0], 1.08)
+        self.assertEqual(ticks['spread'][0], 10)
+        self.assertAlmostEqual(ticks['volume'][0], 4.0)
+
+    def test_gold_decodes_at_its_price_level(self):
+        # Dukascopy stores XAUUSD in 1e-3 points: 2000.000 -> 2000000
+        write_hour(self.root, 'XAUUSD', DAY, 0, 500, np.random.default_rng(5), base=2000000)
+        ticks = load_day_ticks(self.root, 'XAUUSD', DAY)
+
+        self.assertTrue(np.all((ticks['bid'] > 1990) & (ticks['bid'] < 2010)))
+        self.assertAlmostEqual(ticks['bid'][0], 2000.0, delta=1.0)
+
+    def test_point_size_covers_allowed_symbols_and_rejects_unknown(self):
+        for symbol in ALLOWED_SYMBOLS:
+            self.assertGreater(point_size(symbol), 0)
+        self.assertEqual(point_size('US30'), 0.001)
+        with self.assertRaises(ValueError):
+            point_size('BTCUSD')
+        with self.assertRaises(ValueError):
+            ingest_directory(self.root, symbols=['BTCUSD'], store_root=self.store_root)
+
+    def test_resample_matches_pandas(self):
+        ticks = load_day_ticks(self.root, 'EURUSD', DAY)
+        frame = pd.DataFrame(
+            {'bid': ticks['bid'], 'spread': ticks['spread'], 'volume': ticks['volume']},
+            index=pd.to_datetime(ticks['time_ms'], unit='ms'),
+        )
+
+        for timeframe in (60, 900, 3600):
+            bars = resample_ticks(ticks, timeframe)
+            expected = frame.resample(f'{timeframe}s').agg(
+                {'bid': ['first', 'max', 'min', 'last', 'count'], 'spread': 'mean', 'volume': 'sum'}
+            )
+            expected = expected[expected[('bid', 'count')] > 0]
+
+            np.testing.assert_array_equal(bars['time'], expected.index.as_unit('s').asi8)
+            np.testing.assert_allclose(bars['open'], expected[('bid', 'first')])
+            np.testing.assert_allclose(bars['high'], expected[('bid', 'max')])
+            np.testing.assert_allclose(bars['low'], expected[('bid', 'min')])
+            np.testing.assert_allclose(bars['close'], expected[('bid', 'last')])
+            np.testing.assert_array_equal(bars['tick_volume'], expected[('bid', 'count')])
+            np.testing.assert_allclose(bars['spread'], expected[('spread', 'mean')])
+            np.testing.assert_allclose(bars['volume'], expected[('volume', 'sum')], rtol=1e-6)
+
+    def test_ingest_directory_writes_archive(self):
+        totals = ingest_directory(self.root, timeframes=(60, 3600), store_root=self.store_root, max_workers=2)
+        self.assertEqual(totals, {'EURUSD': 12000})
+
+        store = CandleStore(self.store_root, dtype=TICK_BAR_DTYPE)
+        hourly = store.read_range('EURUSD', 'H1', DAY, DAY)
+        self.assertEqual(list(hourly['time'] - day_bounds(DAY)[0]), [0, 3600, 5 * 3600])
+        self.assertEqual(int(hourly['tick_volume'].sum()), 12000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.execution.candle_store import CANDLE_DTYPE
+from fundednext_trading_system.execution.candles import Candles
+from fundednext_trading_system.trading_core.indicator_cache import IndicatorCache, atr_series
+
+def make_frame(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+    return pd.DataFrame({
+        'time': 1704067200 + np.arange(n) * 60,
+        'open': close, 'high': close + 0.0004, 'low': close - 0.0004, 'close': close,
+    })
+
+class TestIndicatorCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = IndicatorCache()
+
+    def test_repeat_calls_on_the_same_bar_hit(self):
+        df = make_frame()
+        first = self.cache.atr_value(df, 14, 'EURUSD')
+        self.assertEqual(self.cache.atr_value(df, 14, 'EURUSD'), first)
+        self.cache.sma_value(df, 20, 'EURUSD')
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 2, 'hit_rate': 0.333})
+        self.assertAlmostEqual(first, atr_series(df, 14).iloc[-1])
+
+    def test_symbols_do_not_share_entries(self):
+        df = make_frame()
+        self.cache.sma_value(df, 20, 'EURUSD')
+        self.cache.sma_value(df, 20, 'GBPUSD')
+        self.assertEqual(self.cache.stats()['misses'], 2)
+
+    def test_no_symbol_is_never_cached(self):
+        df = make_frame()
+        self.cache.sma_value(df, 20)
+        self.cache.sma_value(df, 20)
+        self.assertEqual(self.cache.stats(), {'hits': 0, 'misses': 0, 'hit_rate': 0.0})
+
+    def test_new_bar_invalidates(self):
+        df = make_frame()
+        self.cache.sma_value(df.iloc[:-1], 20, 'EURUSD')
+        after = self.cache.sma_value(df, 20, 'EURUSD')
+        self.assertEqual(self.cache.stats()['misses'], 2)
+        self.assertAlmostEqual(after, df['close'].iloc[-20:].mean())
+
+    def test_forming_bar_range_change_invalidates_with_unchanged_close(self):
+        df = make_frame()
+        stale = self.cache.atr_value(df, 14, 'EURUSD')
+
+        forming = df.copy()
+        forming.loc[forming.index[-1], 'high'] += 0.01   # new high, same close
+        fresh = self.cache.atr_value(forming, 14, 'EURUSD')
+        self.assertAlmostEqual(fresh, atr_series(forming, 14).iloc[-1])
+        self.assertGreater(fresh, stale)
+
+        forming.loc[forming.index[-1], 'low'] -= 0.01
+        self.assertAlmostEqual(self.cache.atr_value(forming, 14, 'EURUSD'), atr_series(forming, 14).iloc[-1])
+        self.assertEqual(self.cache.stats()['misses'], 3)
+
+    def test_candles_and_frames_share_the_key_shape(self):
+        df = make_frame()
+        records = np.zeros(len(df), dtype=CANDLE_DTYPE)
+        for name in ('time', 'open', 'high', 'low', 'close'):
+            records[name] = df[name].to_numpy()
+        candles = Candles(records)
+
+        value = self.cache.sma_value(candles, 20, 'EURUSD')
+        self.assertEqual(self.cache.sma_value(candles, 20, 'EURUSD'), value)
+        self.assertAlmostEqual(value, df['close'].iloc[-20:].mean())
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
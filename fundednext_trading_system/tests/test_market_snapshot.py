@@ -0,0 +1,59 @@
+import unittest
+from types import SimpleNamespace
+from fundednext_trading_system.execution.market_snapshot import MarketSnapshot
+
+class FakeBroker:
+    def __init__(self):
+        self.calls = []
+        self._positions = (
+            SimpleNamespace(symbol='EURUSD', ticket=1),
+            SimpleNamespace(symbol='GBPUSD', ticket=2),
+            SimpleNamespace(symbol='EURUSD', ticket=3),
+        )
+
+    def positions_get(self, symbol=None):
+        self.calls.append('positions_get')
+        return self._positions
+
+    def symbol_info_tick(self, symbol):
+        self.calls.append('symbol_info_tick')
+        return SimpleNamespace(bid=1.0, ask=1.0001)
+
+    def symbol_info(self, symbol):
+        self.calls.append('symbol_info')
+        return SimpleNamespace(point=0.00001)
+
+    def account_info(self):
+        self.calls.append('account_info')
+        return SimpleNamespace(equity=10000.0)
+
+class TestMarketSnapshot(unittest.TestCase):
+
+    def test_capture_groups_positions_by_symbol(self):
+        broker = FakeBroker()
+        snapshot = MarketSnapshot.capture(broker, ['EURUSD', 'GBPUSD'])
+
+        self.assertEqual([p.ticket for p in snapshot.positions_for('EURUSD')], [1, 3])
+        self.assertEqual(snapshot.positions_for('USDJPY'), ())
+        self.assertEqual(snapshot.equity, 10000.0)
+        self.assertEqual(snapshot.broker_calls, len(broker.calls))
+
+    def test_symbol_info_reused_from_previous_snapshot(self):
+        broker = FakeBroker()
+        first = MarketSnapshot.capture(broker, ['EURUSD', 'GBPUSD'])
+        broker.calls.clear()
+
+        second = MarketSnapshot.capture(broker, ['EURUSD', 'GBPUSD'], previous=first)
+
+        self.assertNotIn('symbol_info', broker.calls)
+        self.assertIs(second.info('EURUSD'), first.info('EURUSD'))
+
+    def test_snapshot_is_immutable(self):
+        snapshot = MarketSnapshot.capture(FakeBroker(), ['EURUSD'])
+        with self.assertRaises(Exception):
+            snapshot.positions = ()
+        with self.assertRaises(TypeError):
+            snapshot.ticks['EURUSD'] = None
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.trading_core.ml_router import MLRouter
+
+class CountingModel:
+    def __init__(self, proba):
+        self.proba = np.array([proba])
+        self.calls = []
+
+    def predict_proba(self, X):
+        self.calls.append(np.array(X))
+        return np.repeat(self.proba, len(X), axis=0)
+
+def frame(*rows):
+    return pd.DataFrame(list(rows), columns=['a', 'b'])
+
+class TestInference(unittest.TestCase):
+
+    def setUp(self):
+        self.router = MLRouter(execution_flags=None)
+
+    def test_infer_scores_only_the_latest_row(self):
+        model = CountingModel([0.3, 0.7])
+        self.router.set_model('EURUSD', model)
+
+        self.assertEqual(self.router.infer(frame([1, 2], [3, 4], [5, 6]), 'EURUSD'), ('buy', 0.7))
+        self.assertEqual(len(model.calls), 1)
+        np.testing.assert_array_equal(model.calls[0], [[5, 6]])
+
+    def test_infer_batch_stacks_symbols_sharing_a_model(self):
+        shared, own = CountingModel([0.2, 0.8]), CountingModel([0.9, 0.1])
+        for symbol in ('EURUSD', 'GBPUSD', 'AUDUSD'):
+            self.router.set_model(symbol, shared)
+        self.router.set_model('USDJPY', own)
+
+        results = self.router.infer_batch({
+            'EURUSD': frame([0, 0], [1, 1]),
+            'GBPUSD': frame([2, 2]),
+            'AUDUSD': frame([0, 0], [3, 3]),
+            'USDJPY': frame([4, 4]),
+        })
+
+        self.assertEqual(len(shared.calls), 1)
+        np.testing.assert_array_equal(shared.calls[0], [[1, 1], [2, 2], [3, 3]])
+        self.assertEqual(len(own.calls), 1)
+        self.assertEqual(results, {
+            'EURUSD': ('buy', 0.8), 'GBPUSD': ('buy', 0.8),
+            'AUDUSD': ('buy', 0.8), 'USDJPY': ('sell', 0.9),
+        })
+        self.assertEqual(self.router.last_signal('GBPUSD'), ('buy', 0.8))
+
+    def test_infer_batch_returns_none_for_symbols_without_model(self):
+        model = CountingModel([0.4, 0.6])
+        self.router.set_model('EURUSD', model)
+
+        results = self.router.infer_batch({'EURUSD': frame([1, 1]), 'USDJPY': frame([2, 2])})
+
+        self.assertEqual(results, {'EURUSD': ('buy', 0.6), 'USDJPY': None})
+        np.testing.assert_array_equal(model.calls[0], [[1, 1]])
+        self.assertIsNone(self.router.last_signal('USDJPY'))
+        self.assertNotIn('USDJPY', self.router.latency_stats())
+
+    def test_latency_stats_track_infer_and_infer_batch(self):
+        self.router.set_model('EURUSD', CountingModel([0.4, 0.6]))
+        self.router.set_model('GBPUSD', CountingModel([0.4, 0.6]))
+        self.assertEqual(self.router.latency_stats(), {})
+
+        self.router.infer(frame([1, 1]), 'EURUSD')
+        self.router.infer(frame([1, 1]), 'EURUSD')
+        self.router.infer_batch({'EURUSD': frame([1, 1]), 'GBPUSD': frame([1, 1])})
+
+        stats = self.router.latency_stats()
+        self.assertEqual(stats['EURUSD']['calls'], 3)
+        self.assertEqual(stats['GBPUSD']['calls'], 1)
+        for entry in stats.values():
+            self.assertEqual(set(entry), {'calls', 'p50_ms', 'p95_ms', 'max_ms'})
+            self.assertGreaterEqual(entry['max_ms'], entry['p95_ms'])
+            self.assertGreaterEqual(entry['p95_ms'], entry['p50_ms'])
+            self.assertGreaterEqual(entry['p50_ms'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import unittest
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.trading_core.ml_router import MLRouter
+
+class FixedModel:
+    def __init__(self, proba):
+        self.proba = np.array([proba])
+
+    def predict_proba(self, X):
+        return np.repeat(self.proba, len(X), axis=0)
+
+class TestModelSlots(unittest.TestCase):
+
+    def test_slots_are_per_symbol(self):
+        router = MLRouter(execution_flags=None)
+        buy, sell = FixedModel([0.2, 0.8]), FixedModel([0.9, 0.1])
+        router.set_model('EURUSD', buy)
+        router.set_model('GBPUSD', sell)
+
+        self.assertIs(router.get_model('EURUSD'), buy)
+        self.assertIs(router.get_model('GBPUSD'), sell)
+        self.assertIsNone(router.get_model('USDJPY'))
+        self.assertIsNone(router.get_model())   # unkeyed slot untouched
+
+        row = pd.DataFrame([[1.0, 2.0]])
+        self.assertEqual(router.infer(row, 'EURUSD')[0], 'buy')
+        self.assertEqual(router.infer(row, 'GBPUSD')[0], 'sell')
+        self.assertIsNone(router.infer(row, 'USDJPY'))
+        self.assertEqual(router.last_signal('EURUSD'), ('buy', 0.8))
+        self.assertEqual(router.last_signal('GBPUSD'), ('sell', 0.9))
+        self.assertIsNone(router.last_signal('USDJPY'))
+
+    def test_concurrent_writers_never_expose_a_partial_table(self):
+        router = MLRouter(execution_flags=None)
+        symbols = [f'SYM{i}' for i in range(40)]
+        models = {symbol: [FixedModel([0.5, 0.5]) for _ in range(50)] for symbol in symbols}
+        stop = threading.Event()
+        errors = []
+
+        def writer(symbol):
+            for model in models[symbol]:
+                router.set_model(symbol, model)
+
+        def reader():
+            while not stop.is_set():
+                table = router._models
+                size = len(table)
+                try:
+                    snapshot = dict(table)
+                except RuntimeError as e:   # dict mutated while being copied
+                    errors.append(e)
+                    return
+                if len(table) != size or len(snapshot) != size:
+                    errors.append(AssertionError('published table changed'))
+                    return
+                for symbol, model in snapshot.items():
+                    if model not in models[symbol]:
+                        errors.append(AssertionError(f'{symbol} holds a foreign model'))
+                        return
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        writers = [threading.Thread(target=writer, args=(s,)) for s in symbols]
+        for t in readers + writers:
+            t.start()
+        for t in writers:
+            t.join()
+        stop.set()
+        for t in readers:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual({s: router.get_model(s) for s in symbols}, {s: models[s][-1] for s in symbols})
+
+if __name__ == '__main__':
+    unittest.main()
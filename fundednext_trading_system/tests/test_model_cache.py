@@ -0,0 +1,67 @@
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import unittest
+from fundednext_trading_system.ml.model_loader import ModelCache
+
+class TestModelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.cache = ModelCache()
+
+    def write(self, name, model, mtime=None):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'wb') as f:
+            pickle.dump(model, f)
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+        return path
+
+    def test_hits_and_misses(self):
+        path = self.write('model_EURUSD.pkl', {'w': 1}, mtime=1_000)
+        first = self.cache.get('EURUSD', path)
+        self.assertIs(self.cache.get('EURUSD', path), first)
+        self.assertIs(self.cache.get('EURUSD', path), first)
+
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+        self.assertEqual(stats['cached_symbols'], ['EURUSD'])
+        self.assertIsNone(self.cache.get('GBPUSD', os.path.join(self.tmp, 'missing.pkl')))
+
+    def test_changed_file_is_reloaded_and_touched_file_is_not(self):
+        path = self.write('model_EURUSD.pkl', {'w': 1}, mtime=1_000)
+        first = self.cache.get('EURUSD', path)
+
+        os.utime(path, ns=(2_000, 2_000))   # touched, same content
+        self.assertIs(self.cache.get('EURUSD', path), first)
+
+        self.write('model_EURUSD.pkl', {'w': 2}, mtime=3_000)
+        second = self.cache.get('EURUSD', path)
+        self.assertEqual(second, {'w': 2})
+        self.assertIsNot(second, first)
+        self.assertEqual(self.cache.stats()['misses'], 2)
+
+        self.cache.invalidate('EURUSD')
+        self.assertIsNot(self.cache.get('EURUSD', path), second)
+
+    def test_reload_locks_are_per_symbol(self):
+        self.assertIs(self.cache._reload_lock('EURUSD'), self.cache._reload_lock('EURUSD'))
+        self.assertIsNot(self.cache._reload_lock('EURUSD'), self.cache._reload_lock('GBPUSD'))
+
+        # A reload in progress for one symbol does not block another
+        eurusd = self.write('model_EURUSD.pkl', {'w': 1})
+        gbpusd = self.write('model_GBPUSD.pkl', {'w': 2})
+        loaded = []
+        with self.cache._reload_lock('EURUSD'):
+            worker = threading.Thread(target=lambda: loaded.append(self.cache.get('GBPUSD', gbpusd)))
+            worker.start()
+            worker.join(timeout=5)
+        self.assertEqual(loaded, [{'w': 2}])
+        self.assertEqual(self.cache.get('EURUSD', eurusd), {'w': 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+from fundednext_trading_system.MetaTrader5 import MetaTrader5 as mt5
+
+START = 1_700_000_000.0
+
+class SimTime:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+def market_order(tick, order_type, volume, **extra):
+    price = tick.ask if order_type == mt5.ORDER_TYPE_BUY else tick.bid
+    return dict(action=mt5.TRADE_ACTION_DEAL, symbol='EURUSD', volume=volume,
+                type=order_type, price=price, deviation=10, **extra)
+
+class TestBrokerSimulator(unittest.TestCase):
+
+    def test_same_seed_gives_same_prices(self):
+        a = mt5.BrokerSimulator(seed=5, time_source=SimTime())
+        b = mt5.BrokerSimulator(seed=5, time_source=SimTime())
+        c = mt5.BrokerSimulator(seed=6, time_source=SimTime())
+
+        rates_a = a.copy_rates_from_pos('EURUSD', mt5.TIMEFRAME_M1, 0, 300)
+        np.testing.assert_array_equal(rates_a, b.copy_rates_from_pos('EURUSD', mt5.TIMEFRAME_M1, 0, 300))
+        self.assertFalse(np.array_equal(rates_a['close'], c.copy_rates_from_pos('EURUSD', mt5.TIMEFRAME_M1, 0, 300)['close']))
+        self.assertTrue(np.all(np.diff(rates_a['time']) == 60))
+
+        h1 = a.copy_rates_from_pos('EURUSD', mt5.TIMEFRAME_H1, 0, 3)
+        self.assertTrue(np.all(h1['time'] % 3600 == 0))
+
+    def test_fill_partial_close_and_equity(self):
+        sim = mt5.BrokerSimulator(seed=1, commission_per_lot=7.0, time_source=SimTime())
+        tick = sim.symbol_info_tick('EURUSD')
+        self.assertAlmostEqual(tick.ask - tick.bid, 10 * 0.00001)
+
+        opened = sim.order_send(market_order(tick, mt5.ORDER_TYPE_BUY, 1.0))
+        self.assertEqual(opened.retcode, mt5.TRADE_RETCODE_DONE)
+        self.assertEqual(opened.price, tick.ask)
+
+        # Immediately after the fill the position is down by the spread
+        account = sim.account_info()
+        self.assertAlmostEqual(account.balance, 100_000.0 - 7.0)
+        self.assertAlmostEqual(account.profit, -10.0)
+
+        closed = sim.order_send(market_order(tick, mt5.ORDER_TYPE_SELL, 0.4, position=opened.order))
+        self.assertEqual(closed.retcode, mt5.TRADE_RETCODE_DONE)
+        (position,) = sim.positions_get(symbol='EURUSD')
+        self.assertAlmostEqual(position.volume, 0.6)
+
+        deals = sim.history_deals_get()
+        self.assertEqual([d.entry for d in deals], [mt5.DEAL_ENTRY_IN, mt5.DEAL_ENTRY_OUT])
+        self.assertAlmostEqual(deals[1].profit, -4.0)
+
+        too_big = sim.order_send(market_order(tick, mt5.ORDER_TYPE_SELL, 1.0, position=opened.order))
+        self.assertEqual(too_big.retcode, mt5.TRADE_RETCODE_INVALID_VOLUME)
+
+    def test_stop_loss_triggers_as_time_passes(self):
+        clock = SimTime()
+        sim = mt5.BrokerSimulator(seed=2, time_source=clock)
+        tick = sim.symbol_info_tick('EURUSD')
+        opened = sim.order_send(market_order(
+            tick, mt5.ORDER_TYPE_BUY, 0.1, sl=round(tick.bid - 0.0005, 5), tp=round(tick.ask + 0.0005, 5),
+        ))
+
+        for _ in range(24 * 60):
+            clock.now += 60
+            if not sim.positions_get(symbol='EURUSD'):
+                break
+
+        (exit_deal,) = [d for d in sim.history_deals_get(position=opened.order) if d.entry == mt5.DEAL_ENTRY_OUT]
+        self.assertIn(exit_deal.reason, (mt5.DEAL_REASON_SL, mt5.DEAL_REASON_TP))
+        account = sim.account_info()
+        self.assertAlmostEqual(account.equity, account.balance)
+        self.assertAlmostEqual(account.balance, 100_000.0 + exit_deal.profit)
+
+if __name__ == '__main__':
+    unittest.main()
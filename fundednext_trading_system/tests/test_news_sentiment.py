@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from fundednext_trading_system.trading_core.news_sentiment import NewsSentiment
 from textblob import TextBlob
 
@@ -47,5 +47,34 @@ class TestNewsSentiment(unittest.TestCase):
         # Assertions
         self.assertEqual(score, 0.0)
 
+    @patch('yfinance.Ticker')
+    def test_get_sentiment_served_from_cache(self, mock_ticker):
+        instance = mock_ticker.return_value
+        instance.news = [{'title': 'good'}]
+
+        sentiment = NewsSentiment(ttl_seconds=60)
+        first = sentiment.get_sentiment('AAPL')
+        second = sentiment.get_sentiment('AAPL')
+
+        # Only the cold miss reaches the network
+        self.assertEqual(first, second)
+        self.assertEqual(mock_ticker.call_count, 1)
+        stats = sentiment.cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertIn('AAPL', stats['staleness_seconds'])
+
+    @patch('yfinance.Ticker')
+    def test_stale_entry_returned_while_refreshing(self, mock_ticker):
+        instance = mock_ticker.return_value
+        instance.news = [{'title': 'good'}]
+
+        sentiment = NewsSentiment(ttl_seconds=0)
+        sentiment._cache['AAPL'] = (0.5, 0.0)
+
+        with patch.object(sentiment, '_refresh_async') as mock_refresh:
+            self.assertEqual(sentiment.get_sentiment('AAPL'), 0.5)
+            mock_refresh.assert_called_once_with('AAPL')
+        mock_ticker.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,46 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from fundednext_trading_system.offline_training import train_model
+from fundednext_trading_system.tests import make_frame
+
+class TestParallelTraining(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_failures_are_isolated_and_summarised(self):
+        candles = {
+            'EURUSD': make_frame(600, 1),
+            'GBPUSD': make_frame(50, 2),                         # too short
+            'USDJPY': make_frame(600, 3).drop(columns='close'),  # raises in the worker
+        }
+        models_dir = os.path.join(self.tmp, 'models')
+
+        with patch.object(train_model, 'MODELS_DIR', models_dir), \
+             patch.object(train_model.DukascopyDataFeed, 'get_candles_bulk', return_value=candles), \
+             patch.object(train_model.MonteCarloValidator, 'run', return_value={'passed': True, 'avg_win_rate': np.float64(0.6)}):
+            summary = train_model.train_and_save_model(
+                list(candles), max_workers=2, log_root=os.path.join(self.tmp, 'logs'),
+            )
+
+        statuses = {row['symbol']: row['status'] for row in summary['symbols']}
+        self.assertEqual(statuses, {'EURUSD': 'saved', 'GBPUSD': 'insufficient_data', 'USDJPY': 'error'})
+        self.assertTrue(os.path.exists(os.path.join(models_dir, 'model_EURUSD.pkl')))
+
+        run_dir = os.path.dirname(summary['symbols'][0]['log_file'])
+        with open(os.path.join(run_dir, 'training_summary.json')) as f:
+            self.assertEqual(json.load(f)['statuses'], {'saved': 1, 'insufficient_data': 1, 'error': 1})
+
+        with open(os.path.join(run_dir, 'USDJPY.log')) as f:
+            usdjpy_log = f.read()
+        self.assertIn('Training failed for USDJPY', usdjpy_log)
+        self.assertNotIn('EURUSD', usdjpy_log)
+
+if __name__ == '__main__':
+    unittest.main()
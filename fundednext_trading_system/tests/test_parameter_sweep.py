@@ -0,0 +1,136 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.execution.candle_store import CANDLE_DTYPE
+from fundednext_trading_system.tests import HAS_MT5
+
+class NeutralSentiment:
+    def get_sentiment(self, symbol):
+        return 0.0
+
+class EmaModel:
+    """Confident buy when ema_diff > 0, unsure otherwise."""
+    def predict_proba(self, X):
+        up = X[:, 0] > 0
+        return np.column_stack([np.where(up, 0.1, 0.5), np.where(up, 0.9, 0.5)])
+
+def make_bars(n, seed, start=1704067200):
+    rng = np.random.default_rng(seed)
+    # Alternating drifts so both regimes show up
+    drift = np.repeat(rng.choice([-0.0002, 0.0002], size=n // 200 + 1), 200)[:n]
+    closes = 1.1 + np.cumsum(drift + rng.normal(0, 0.0004, n))
+    bars = np.zeros(n, dtype=CANDLE_DTYPE)
+    bars['time'] = start + 300 * np.arange(n)
+    bars['open'] = np.concatenate(([closes[0]], closes[:-1]))
+    bars['close'] = closes
+    bars['high'] = np.maximum(bars['open'], closes) + 0.0003
+    bars['low'] = np.minimum(bars['open'], closes) - 0.0003
+    return bars
+
+@unittest.skipUnless(HAS_MT5, 'backtester imports MetaTrader5')
+class TestParameterSweep(unittest.TestCase):
+
+    def setUp(self):
+        from fundednext_trading_system.offline_training import parameter_sweep
+        self.sweep = parameter_sweep
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_candidates_filter_invalid_points_and_keep_the_baseline(self):
+        points = self.sweep.candidates('EURUSD', {'ema_fast': (12, 60), 'ema_slow': (50,)})
+        self.assertEqual(points[0], self.sweep.baseline_params('EURUSD'))
+        self.assertEqual([p['ema_fast'] for p in points], [21, 12])
+
+        sampled = self.sweep.candidates('EURUSD', samples=10, seed=7)
+        self.assertEqual(sampled, self.sweep.candidates('EURUSD', samples=10, seed=7))
+        self.assertIn(len(sampled), (10, 11))
+        self.assertEqual(len({repr(sorted(p.items())) for p in sampled}), len(sampled))
+
+    def test_rule_signals_match_live_decision(self):
+        from fundednext_trading_system.execution.candle_store import records_to_frame
+        from fundednext_trading_system.main import detect_market_regime
+        from fundednext_trading_system.trading_core.signal_engine import SignalEngine
+
+        bars = make_bars(700, 4)
+        params = dict(self.sweep.baseline_params('EURUSD'), regime_threshold=0.05)
+        signals = self.sweep.candidate_signals(bars, 'EURUSD', params)
+        self.assertTrue((signals[:60] == 0).all())
+
+        engine = SignalEngine()
+        engine.news_sentiment = NeutralSentiment()
+        frame = records_to_frame(bars)
+        sides = {'buy': 1, 'sell': -1}
+        regimes = set()
+        for i in range(60, len(bars), 7):
+            window = frame.iloc[max(0, i + 1 - self.sweep.TIMEFRAME_BARS):i + 1]
+            regime = detect_market_regime(window, threshold=params['regime_threshold'])
+            regimes.add(regime)
+            live = engine.generate_signal(window, 'EURUSD', regime=regime)
+            self.assertEqual(signals[i], sides[live[0]] if live else 0, f'bar {i} ({regime})')
+        self.assertEqual(regimes, {'trend', 'range'})
+
+    def test_model_signals_take_precedence_and_use_candidate_periods(self):
+        bars = make_bars(700, 5)
+        bars['tick_volume'] = 100.0   # FeatureEngineer normalises volume
+        base = self.sweep.baseline_params('EURUSD')
+        rule = self.sweep.candidate_signals(bars, 'EURUSD', base)
+        mixed = self.sweep.candidate_signals(bars, 'EURUSD', base, EmaModel())
+
+        confident = self.sweep.model_signals(bars, 'EURUSD', base, EmaModel()) != 0
+        confident[:60] = False
+        self.assertTrue(confident.any() and (~confident[60:]).any())
+        self.assertTrue((mixed[confident] == 1).all())
+        np.testing.assert_array_equal(mixed[~confident], rule[~confident])
+
+        slower = dict(base, ema_fast=40, ema_slow=100)
+        self.assertFalse(np.array_equal(
+            self.sweep.model_signals(bars, 'EURUSD', slower, EmaModel()),
+            self.sweep.model_signals(bars, 'EURUSD', base, EmaModel()),
+        ))
+        # Without a model the EMA/RSI periods change nothing, so they are not swept
+        self.assertEqual(
+            {p['ema_fast'] for p in self.sweep.candidates('EURUSD', {'ema_fast': (12, 21)}, with_model=False)},
+            {base['ema_fast']},
+        )
+
+    def test_sweep_is_ranked_and_memoised(self):
+        bars = {'EURUSD': make_bars(3000, 1), 'GBPUSD': make_bars(3000, 2)}
+        grid = {'atr_sl_multiplier': (1.0, 2.0), 'regime_threshold': (0.05, 0.2)}
+        cache = self.sweep.SweepCache(self.tmp)
+
+        tables = self.sweep.run_sweep(bars, grid, max_workers=2, cache=cache, min_trades=1)
+        self.assertEqual(set(tables), {'EURUSD', 'GBPUSD'})
+        table = tables['EURUSD']
+        self.assertEqual(len(table), 5)
+        self.assertEqual(list(table.index), [1, 2, 3, 4, 5])
+        ranked = table[table['enough_trades']]['score']
+        self.assertTrue(ranked.is_monotonic_decreasing)
+        self.assertGreater(table['trades'].sum(), 0)
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp, 'EURUSD'))), 5)
+
+        serial = self.sweep.run_sweep(bars, grid, max_workers=1, cache=self.sweep.SweepCache(os.path.join(self.tmp, 'serial')), min_trades=1)
+        pd.testing.assert_frame_equal(serial['EURUSD'], table)
+
+        with patch.object(self.sweep, 'evaluate', side_effect=AssertionError('re-evaluated')):
+            memoised = self.sweep.run_sweep(bars, grid, max_workers=2, cache=cache, min_trades=1)
+        pd.testing.assert_frame_equal(memoised['EURUSD'], table)
+
+    def test_cache_key_covers_rules_and_regime_settings(self):
+        params = self.sweep.baseline_params('EURUSD')
+        key = self.sweep.SweepCache.key('EURUSD', 'abc', params, self.sweep.CostModel())
+        self.assertEqual(key, self.sweep.SweepCache.key('EURUSD', 'abc', dict(params), self.sweep.CostModel()))
+        model_hash = self.sweep.SweepCache.model_hash(EmaModel())
+        self.assertNotEqual(self.sweep.SweepCache.key('EURUSD', 'abc', params, self.sweep.CostModel(), model_hash), key)
+
+        rules = dict(self.sweep.CURRENT_RULES, MAX_RISK_PER_TRADE=1.0)
+        for name, value in [('CURRENT_RULES', rules), ('ACCOUNT_PHASE', 'FUNDED'),
+                            ('REGIME_MA_PERIOD', 20), ('TIMEFRAME_BARS', 900)]:
+            with patch.object(self.sweep, name, value):
+                self.assertNotEqual(self.sweep.SweepCache.key('EURUSD', 'abc', params, self.sweep.CostModel()), key, name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from fundednext_trading_system.execution.replay_data_feed import ReplayDataFeed
+from fundednext_trading_system.tests import HAS_MT5, make_frame
+
+class TestReplayDataFeed(unittest.TestCase):
+
+    def test_timeline_never_exposes_future_bars(self):
+        feed = ReplayDataFeed.from_frames({
+            'EURUSD': make_frame(100, 1),
+            'GBPUSD': make_frame(50, 2, start=1704067200 + 300 * 60),
+        })
+
+        steps = 0
+        for bar_time, due in feed.timeline():
+            steps += 1
+            for symbol in due:
+                candles = feed.get_candles_compact(symbol, None, 20)
+                self.assertEqual(candles.last_time, bar_time)
+                self.assertLessEqual(len(candles), 20)
+
+        self.assertEqual(steps, 110)
+        self.assertIsNone(ReplayDataFeed.from_frames({'EURUSD': make_frame(5, 1, start=0)}).get_candles_compact('EURUSD', None, 5))
+
+    def test_paper_fills_are_tracked_and_stopped_out(self):
+        frame = make_frame(10, 1)
+        frame.loc[5:, ['open', 'high', 'low', 'close']] -= 0.01   # gap through any buy stop
+        feed = ReplayDataFeed.from_frames({'EURUSD': frame})
+        timeline = feed.timeline()
+        next(timeline)
+
+        fill = feed.record_fill({'symbol': 'EURUSD', 'order_type': 'buy', 'volume': 0.257, 'stop_loss': 20})
+        self.assertIsNotNone(fill)
+        positions = feed.get_positions('EURUSD')
+        self.assertEqual(len(positions), 1)
+        self.assertAlmostEqual(positions[0].volume, 0.25)
+        self.assertAlmostEqual(positions[0].price_open - positions[0].sl, 0.002)
+
+        snapshot = feed.capture_snapshot(['EURUSD'])
+        self.assertEqual(snapshot.positions_for('EURUSD'), tuple(positions))
+        self.assertGreater(snapshot.tick('EURUSD').ask, snapshot.tick('EURUSD').bid)
+        self.assertIsNotNone(snapshot.equity)
+
+        for _ in range(5):
+            next(timeline)
+        self.assertEqual(feed.get_positions('EURUSD'), [])
+        self.assertEqual(feed.capture_snapshot(['EURUSD']).positions, ())
+        self.assertEqual([deal.reason for deal in feed.broker.deals], ['signal', 'sl'])
+        self.assertLess(feed.broker.deals[1].profit, 0)
+
+@unittest.skipUnless(HAS_MT5, 'MetaTrader5 (or the bundled mock) not on the import path')
+class TestReplayEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.models_dir = tempfile.mkdtemp()
+        X = np.random.default_rng(0).normal(size=(200, 11))
+        y = (X[:, 0] > 0).astype(int)
+        for symbol in ('EURUSD', 'GBPUSD'):
+            with open(os.path.join(self.models_dir, f'model_{symbol}.pkl'), 'wb') as f:
+                pickle.dump(LogisticRegression().fit(X, y), f)
+
+    def tearDown(self):
+        shutil.rmtree(self.models_dir)
+
+    def test_replay_counts_every_decision(self):
+        from fundednext_trading_system.replay import run_replay
+
+        feed = ReplayDataFeed.from_frames({
+            'EURUSD': make_frame(300, 1),
+            'GBPUSD': make_frame(200, 2),
+        })
+        with patch('fundednext_trading_system.ml.model_loader.MODELS_DIR', self.models_dir):
+            report = run_replay(feed)
+
+        self.assertEqual(report['bars'], 500)
+        self.assertEqual(sum(report['decisions'].values()), 500)
+        self.assertEqual(report['per_symbol']['GBPUSD'].get('no_data'), 59)
+        self.assertGreater(report['bars_per_second'], 0)
+
+    def test_replay_positions_and_losses_reach_risk_stages(self):
+        from fundednext_trading_system.replay import run_replay
+
+        feed = ReplayDataFeed.from_frames({'EURUSD': make_frame(1000, 1)})
+        with patch('fundednext_trading_system.ml.model_loader.MODELS_DIR', self.models_dir):
+            report = run_replay(feed)
+
+        decisions = report['decisions']
+        traded = report['bars'] - decisions.get('no_data', 0)
+        # An open position blocks stacking (self-correlation) and realised
+        # losses eat into the risk budget, so most bars cannot open a trade
+        self.assertGreater(decisions.get('simulated', 0), 0)
+        self.assertLess(decisions.get('simulated', 0), traded // 10)
+        self.assertGreater(decisions.get('risk_rejected', 0), 0)
+        self.assertGreater(report['paper']['closed_deals'], 0)
+        self.assertEqual(report['trades']['EURUSD'], decisions['simulated'])
+        self.assertEqual(report['paper']['open_positions'], len(feed.get_positions('EURUSD')))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingClassifier
+from fundednext_trading_system.offline_training.train_model import run_backtest, _run_backtest_per_row
+
+def make_data(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 1.1 * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    df = pd.DataFrame({'close': close})
+    features = pd.DataFrame({
+        'ret': np.concatenate(([0.0], np.diff(np.log(close)))),
+        'noise': rng.normal(size=n),
+    })
+    target = (np.roll(close, -1) > close).astype(int)
+    model = GradientBoostingClassifier(n_estimators=20, random_state=0).fit(features.values, target)
+    return model, features, df
+
+class TestRunBacktest(unittest.TestCase):
+
+    def test_matches_per_row_loop_exactly(self):
+        model, features, df = make_data()
+        expected = _run_backtest_per_row(model, features, df)
+        actual = run_backtest(model, features, df)
+
+        self.assertEqual(len(actual), len(df) - 2)
+        self.assertEqual(actual, expected)
+
+    def test_unscorable_rows_fall_back_to_per_row_loop(self):
+        model, features, df = make_data(n=50)
+        features.iloc[10, 0] = np.nan
+
+        actual = run_backtest(model, features, df)
+        self.assertEqual(actual, _run_backtest_per_row(model, features, df))
+        self.assertEqual(len(actual), len(df) - 3)
+
+    def test_short_frames_produce_no_trades(self):
+        model, features, df = make_data(n=50)
+        self.assertEqual(run_backtest(model, features.iloc[:2], df.iloc[:2]), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import json
+import unittest
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.execution.candles import Candles
+from fundednext_trading_system.ml.streaming_indicators import (
+    StreamingSMA,
+    StreamingMomentum,
+    StreamingRollingStd,
+    StreamingSignalFeatures,
+)
+from fundednext_trading_system.trading_core.signal_engine import SignalEngine
+
+RATES_DTYPE = np.dtype([
+    ('time', 'i8'), ('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'), ('tick_volume', 'u8'),
+])
+
+def make_candles(n=1000, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.0005, n))
+    spread = np.abs(rng.normal(0, 0.0003, n))
+    return pd.DataFrame({
+        'time': np.arange(n) * 60,
+        'open': close + rng.normal(0, 0.0001, n),
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'tick_volume': rng.integers(100, 1000, n),
+    })
+
+def to_rates(df):
+    rates = np.zeros(len(df), dtype=RATES_DTYPE)
+    for name in RATES_DTYPE.names:
+        rates[name] = df[name].to_numpy()
+    return rates
+
+class TestStreamingIndicators(unittest.TestCase):
+
+    def setUp(self):
+        self.df = make_candles()
+
+    def test_basic_indicators_match_pandas(self):
+        close = self.df['close']
+        sma, std, momentum = StreamingSMA(20), StreamingRollingStd(20), StreamingMomentum(5)
+
+        sma_out = [sma.update(x) for x in close]
+        std_out = [std.update(x) for x in close]
+        momentum_out = [momentum.update(x) for x in close]
+
+        np.testing.assert_allclose(sma_out, close.rolling(20).mean(), rtol=1e-10, equal_nan=True)
+        np.testing.assert_allclose(std_out, close.rolling(20).std(), rtol=1e-7, equal_nan=True)
+        np.testing.assert_allclose(momentum_out, close - close.shift(5), rtol=1e-12, equal_nan=True)
+
+    def test_missing_values_restart_the_window(self):
+        close = self.df['close'].iloc[:80].copy()
+        close.iloc[[30, 55]] = np.nan
+        sma, std, momentum = StreamingSMA(20), StreamingRollingStd(20), StreamingMomentum(5)
+
+        np.testing.assert_allclose([sma.update(x) for x in close], close.rolling(20).mean(), rtol=1e-10, equal_nan=True)
+        np.testing.assert_allclose([std.update(x) for x in close], close.rolling(20).std(), rtol=1e-7, equal_nan=True)
+        np.testing.assert_allclose([momentum.update(x) for x in close], close - close.shift(5), equal_nan=True)
+        self.assertTrue(np.isnan(std.peek(np.nan)))
+
+    def test_signal_features_match_prepare_features(self):
+        expected = SignalEngine().prepare_features(self.df)
+
+        stream = StreamingSignalFeatures()
+        rows = [stream.update(bar) for bar in self.df.to_dict('records')]
+        actual = pd.DataFrame(rows, index=self.df.index)[list(expected.columns)].fillna(0)
+
+        np.testing.assert_allclose(actual.values, expected.values.astype(float), rtol=1e-7, atol=1e-12)
+        self.assertEqual(stream.last_time, int(self.df['time'].iloc[-1]))
+
+    def test_peek_does_not_commit(self):
+        stream = StreamingSignalFeatures()
+        records = self.df.to_dict('records')
+        for bar in records[:-1]:
+            stream.update(bar)
+
+        peeked = stream.peek(records[-1], regime='trend')
+        peeked_again = stream.peek(records[-1], regime='trend')
+        committed = stream.update(records[-1], regime='trend')
+
+        self.assertEqual(peeked, peeked_again)
+        np.testing.assert_allclose(list(peeked.values()), list(committed.values()), rtol=1e-12)
+
+    def test_checkpoint_restore_continues_without_warmup(self):
+        records = self.df.to_dict('records')
+        reference = StreamingSignalFeatures()
+        for bar in records[:600]:
+            reference.update(bar)
+
+        state = json.loads(json.dumps(reference.state()))
+        restored = StreamingSignalFeatures.from_state(state)
+
+        for bar in records[600:]:
+            self.assertEqual(reference.update(bar), restored.update(bar))
+
+    def test_live_rows_match_the_window_computation(self):
+        engine, reference = SignalEngine(), SignalEngine()
+        rates = to_rates(self.df)
+        forming = rates.copy()
+
+        # Sliding 300-bar window; the newest bar is still forming (its close moves)
+        for end in list(range(300, 420)) + list(range(700, 720)):   # the jump forces a rebuild
+            window = forming[end - 300:end].copy()
+            window['close'][-1] += 0.0002
+            candles = Candles(window)
+
+            live = engine.prepare_latest_features(candles, regime='trend', symbol='EURUSD')
+            expected = reference.prepare_latest_features(candles, regime='trend')
+            np.testing.assert_allclose(live.values, expected.values, rtol=1e-9, atol=1e-12)
+
+        # Everything but the forming bar of the last window (index 718) is committed
+        self.assertEqual(engine._streams['EURUSD'].last_time, int(rates['time'][717]))
+
+if __name__ == '__main__':
+    unittest.main()
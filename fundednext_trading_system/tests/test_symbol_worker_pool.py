@@ -0,0 +1,64 @@
+import threading
+import unittest
+from fundednext_trading_system.trading_core.symbol_worker_pool import SymbolWorkerPool
+
+class TestSymbolWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = SymbolWorkerPool(['EURUSD', 'GBPUSD', 'USDJPY'])
+        self.pool.start()
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_run_cycle_uses_persistent_threads(self):
+        seen = {}
+        lock = threading.Lock()
+
+        def work(symbol, multiplier):
+            with lock:
+                seen.setdefault(symbol, []).append((threading.current_thread().name, multiplier))
+
+        for i in range(3):
+            cycle_times = self.pool.run_cycle(work, i)
+            self.assertEqual(set(cycle_times), {'EURUSD', 'GBPUSD', 'USDJPY'})
+
+        # Each symbol ran once per cycle on its own long-lived worker thread
+        for symbol, calls in seen.items():
+            self.assertEqual([m for _, m in calls], [0, 1, 2])
+            self.assertEqual({name for name, _ in calls}, {f"worker-{symbol}"})
+
+    def test_failing_worker_does_not_break_cycle(self):
+        def work(symbol):
+            if symbol == 'GBPUSD':
+                raise ValueError("boom")
+
+        self.pool.run_cycle(work)
+        cycle_times = self.pool.run_cycle(work, symbols=['EURUSD'])
+
+        self.assertEqual(list(cycle_times), ['EURUSD'])
+        self.assertIn('GBPUSD', self.pool.cycle_times())
+
+    def test_timed_out_cycle_omits_unfinished_symbols(self):
+        pool = SymbolWorkerPool(['EURUSD', 'GBPUSD'], cycle_timeout=0.2)
+        pool.start()
+        release = threading.Event()
+
+        def work(symbol):
+            if symbol == 'GBPUSD':
+                release.wait(5)
+
+        try:
+            release.set()
+            self.assertEqual(set(pool.run_cycle(work)), {'EURUSD', 'GBPUSD'})
+
+            # GBPUSD is still running: its previous time must not be reported
+            release.clear()
+            cycle_times = pool.run_cycle(work)
+            self.assertEqual(list(cycle_times), ['EURUSD'])
+        finally:
+            release.set()
+            pool.shutdown()
+
+if __name__ == '__main__':
+    unittest.main()
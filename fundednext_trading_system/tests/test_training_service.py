@@ -0,0 +1,132 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from fundednext_trading_system.ml import training_service
+from fundednext_trading_system.ml.training_service import BackgroundTrainingService
+from fundednext_trading_system.trading_core.ml_router import MLRouter
+
+def make_bars(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 0.001, n))
+    features = pd.DataFrame({'ret': np.r_[0.0, np.diff(close)], 'level': close})
+    return features, pd.DataFrame({'close': close})
+
+def wait_for(condition, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+class GatedFit:
+    """
+    Stand-in for fit_direction_model: records batch sizes and blocks
+    until released; raises while fail is set.
+    """
+    def __init__(self):
+        self.release = threading.Event()
+        self.sizes = []
+        self.fail = False
+
+    def __call__(self, X, y, random_state=None):
+        self.sizes.append(len(X))
+        self.release.wait(10)
+        if self.fail:
+            raise ValueError('fit exploded')
+        return ('model', len(X))
+
+class TestBackgroundTrainingService(unittest.TestCase):
+
+    def setUp(self):
+        self.router = MLRouter(execution_flags=None)
+
+    def start_threaded(self):
+        fit = GatedFit()
+        patcher = patch.object(training_service, 'fit_direction_model', fit)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        service = BackgroundTrainingService(self.router, executor=ThreadPoolExecutor(max_workers=2))
+        self.addCleanup(fit.release.set)
+        self.addCleanup(service.shutdown)
+        return service, fit
+
+    def test_submit_fits_in_worker_process_and_publishes(self):
+        service = BackgroundTrainingService(self.router, max_workers=1)
+        self.addCleanup(service.shutdown)
+
+        with patch.object(self.router, 'set_model', wraps=self.router.set_model) as set_model:
+            self.assertTrue(service.submit('EURUSD', *make_bars(200)))
+            self.assertTrue(wait_for(lambda: self.router.get_model('EURUSD') is not None, timeout=60))
+
+        set_model.assert_called_once()
+        self.assertEqual(set_model.call_args[0][0], 'EURUSD')
+        proba = self.router.get_model('EURUSD').predict_proba(make_bars(5)[0].values)
+        self.assertEqual(proba.shape, (5, 2))
+        self.assertTrue(wait_for(lambda: service.status()['in_flight'] == []))
+        self.assertEqual(service.status()['completed'], 1)
+
+    def test_submit_rejects_single_class_labels(self):
+        service, fit = self.start_threaded()
+        flat = pd.DataFrame({'close': np.ones(50)})
+
+        self.assertFalse(service.submit('EURUSD', pd.DataFrame({'x': np.arange(50)}), flat))
+        self.assertEqual(service.status()['submitted'], 0)
+
+    def test_repeat_submits_coalesce_while_fit_in_flight(self):
+        service, fit = self.start_threaded()
+
+        service.submit('EURUSD', *make_bars(100))
+        self.assertTrue(wait_for(lambda: fit.sizes == [99]))
+        service.submit('EURUSD', *make_bars(150))
+        service.submit('EURUSD', *make_bars(200))
+        self.assertTrue(wait_for(lambda: len(service._pending.get('EURUSD', ((),))[0]) == 199))
+        self.assertEqual(service.status()['pending'], ['EURUSD'])
+
+        fit.release.set()
+        self.assertTrue(wait_for(lambda: service.status()['completed'] == 2))
+
+        # The middle batch was superseded; only the newest data was fitted
+        self.assertEqual(fit.sizes, [99, 199])
+        self.assertEqual(self.router.get_model('EURUSD'), ('model', 199))
+        self.assertEqual(service.status()['in_flight'], [])
+        self.assertEqual(service.status()['pending'], [])
+
+    def test_failed_fit_does_not_wedge_symbol(self):
+        service, fit = self.start_threaded()
+        fit.fail = True
+        fit.release.set()
+
+        service.submit('EURUSD', *make_bars(100))
+        self.assertTrue(wait_for(lambda: service.status()['failed'] == 1))
+        self.assertTrue(wait_for(lambda: service.status()['in_flight'] == []))
+        self.assertIsNone(self.router.get_model('EURUSD'))
+
+        fit.fail = False
+        service.submit('EURUSD', *make_bars(120))
+        self.assertTrue(wait_for(lambda: service.status()['completed'] == 1))
+        self.assertEqual(self.router.get_model('EURUSD'), ('model', 119))
+
+    def test_shutdown_stops_dispatcher_and_drops_pending_work(self):
+        service, fit = self.start_threaded()
+
+        service.submit('EURUSD', *make_bars(100))
+        self.assertTrue(wait_for(lambda: fit.sizes == [99]))
+        service.submit('EURUSD', *make_bars(150))
+        self.assertTrue(wait_for(lambda: service.status()['pending'] == ['EURUSD']))
+
+        service.shutdown()
+        self.assertFalse(service._thread.is_alive())
+
+        # The running fit still publishes; the pending batch cannot start
+        fit.release.set()
+        self.assertTrue(wait_for(lambda: service.status()['in_flight'] == []))
+        self.assertEqual(fit.sizes, [99])
+        self.assertEqual(self.router.get_model('EURUSD'), ('model', 99))
+
+if __name__ == '__main__':
+    unittest.main()
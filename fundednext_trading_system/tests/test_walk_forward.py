@@ -0,0 +1,75 @@
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from fundednext_trading_system.offline_training import walk_forward
+from fundednext_trading_system.offline_training.walk_forward import FeatureCache, make_folds, walk_forward_validate
+from fundednext_trading_system.ml.auto_promotion_gate import AutoPromotionGate
+from fundednext_trading_system.tests import make_frame
+
+class TestMakeFolds(unittest.TestCase):
+
+    def test_anchored_folds_are_purged_and_embargoed(self):
+        folds = make_folds(1200, n_folds=4, scheme='anchored', purge=2, embargo=3)
+        self.assertEqual(len(folds), 4)
+        for prev, fold in zip(folds, folds[1:]):
+            self.assertEqual(fold.train_start, 0)
+            self.assertGreater(fold.train_end, prev.train_end)
+            self.assertGreaterEqual(fold.test_start, prev.test_end)
+        for fold in folds:
+            window_start = fold.test_start - 3
+            self.assertEqual(window_start - fold.train_end, 2)
+        self.assertLessEqual(folds[-1].test_end, 1200)
+
+    def test_rolling_folds_keep_a_fixed_training_length(self):
+        folds = make_folds(1200, n_folds=3, scheme='rolling', train_size=300, purge=1)
+        self.assertEqual({f.train_end - f.train_start for f in folds}, {300})
+        self.assertGreater(folds[1].train_start, 0)
+
+    def test_rejects_windows_that_do_not_fit(self):
+        with self.assertRaises(ValueError):
+            make_folds(150, n_folds=5)
+        with self.assertRaises(ValueError):
+            make_folds(1200, scheme='expanding')
+
+class TestWalkForward(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.cache = FeatureCache(self.tmp)
+
+    def test_cache_is_keyed_by_data(self):
+        df = make_frame(400, 1)
+        path = self.cache.get_or_build('EURUSD', df)
+        with patch.object(walk_forward.SignalEngine, 'prepare_features', side_effect=AssertionError('rebuilt')):
+            self.assertEqual(self.cache.get_or_build('EURUSD', df.copy()), path)
+        self.assertNotEqual(self.cache.path_for('EURUSD', make_frame(400, 2)), path)
+
+        X, y, close = FeatureCache.load(path)
+        self.assertEqual(len(X), len(y))
+        self.assertEqual(len(close), len(X) + 1)
+
+    def test_parallel_report_matches_serial(self):
+        df = make_frame(900, 3)
+        parallel = walk_forward_validate('EURUSD', df, n_folds=3, max_workers=3, cache=self.cache)
+        serial = walk_forward_validate('EURUSD', df, n_folds=3, max_workers=1, cache=self.cache)
+
+        self.assertEqual(len(parallel['folds']), 3)
+        self.assertEqual(parallel['folds'], serial['folds'])
+        for metric in walk_forward.FOLD_METRICS:
+            self.assertEqual(set(parallel['aggregate'][metric]), {'mean', 'std', 'min', 'max'})
+        self.assertEqual(parallel['stability']['scored_folds'], 3)
+        self.assertIsInstance(parallel['passed'], bool)
+
+    def test_promotion_gate_respects_failed_report(self):
+        tracker = MagicMock()
+        tracker.clean_sessions.return_value = 10
+        report = {'passed': False, 'stability': {'positive_folds': 0.2, 'scored_folds': 5, 'folds': 5}}
+        with patch('fundednext_trading_system.ml.auto_promotion_gate.promote_model_version') as promote:
+            self.assertFalse(AutoPromotionGate('EURUSD', tracker, 'shadow.pkl', report).evaluate())
+            self.assertTrue(AutoPromotionGate('EURUSD', tracker, 'shadow.pkl', {**report, 'passed': True}).evaluate())
+        promote.assert_called_once_with('EURUSD', 'shadow.pkl')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+bar_scheduler.py
+
+Bar-close driven scheduling for the master orchestrator.
+
+Watches the newest bar open time of every symbol through the data feed.
+A symbol becomes due as soon as a new bar appears (i.e. the previous bar
+has closed); symbols whose bar has not changed are skipped entirely.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from fundednext_trading_system.monitoring.logger import logger
+
+
+class BarCloseScheduler:
+    def __init__(
+        self,
+        feed,
+        symbols: Iterable[str],
+        timeframe,
+        poll_seconds: float = 1.0,
+    ):
+        self.feed = feed
+        self.symbols = list(symbols)
+        self.timeframe = timeframe
+        self.poll_seconds = poll_seconds
+        self._last_bar_time: Dict[str, Optional[int]] = {s: None for s in self.symbols}
+
+    # =========================
+    # POLLING
+    # =========================
+    def poll(self) -> List[str]:
+        """
+        Returns the symbols that have a new bar since the last dispatch.
+        The first observation of every symbol counts as new.
+        """
+        due = []
+        for symbol in self.symbols:
+            try:
+                bar_time = self.feed.latest_bar_time(symbol, self.timeframe)
+            except Exception as e:
+                logger.error(f"{symbol}: bar time poll failed | {e}")
+                continue
+
+            if bar_time is None or bar_time == self._last_bar_time[symbol]:
+                continue
+
+            self._last_bar_time[symbol] = bar_time
+            due.append(symbol)
+
+        return due
+
+    def wait_for_new_bars(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        max_wait: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Blocks until at least one symbol has a new bar and returns them.
+        Returns an empty list if stop_event is set or max_wait elapses.
+        """
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+
+        while True:
+            due = self.poll()
+            if due:
+                return due
+
+            if stop_event is not None and stop_event.is_set():
+                return []
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+
+            if stop_event is not None:
+                stop_event.wait(self.poll_seconds)
+            else:
+                time.sleep(self.poll_seconds)
+
+    # =========================
+    # MONITORING
+    # =========================
+    def last_bar_times(self) -> Dict[str, Optional[int]]:
+        return dict(self._last_bar_time)
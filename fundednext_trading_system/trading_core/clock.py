@@ -0,0 +1,139 @@
+"""
+clock.py
+
+Process-wide, injectable time source.
+
+Every time-dependent rule (daily loss resets, sessions, news pauses,
+trade expiry, cooldowns) reads the time through this module instead of
+calling datetime.utcnow() / date.today() directly. Live trading uses the
+RealClock; replays, backtests and tests install a FixedClock (stepped
+explicitly) or a FastForwardClock (real time scaled by a factor).
+
+All datetimes are naive UTC, matching the rest of the code base.
+"""
+
+import threading
+import time as _time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+
+
+class Clock:
+    def now(self) -> datetime:
+        raise NotImplementedError
+
+    def timestamp(self) -> float:
+        return self.now().replace(tzinfo=timezone.utc).timestamp()
+
+    def today(self) -> date:
+        return self.now().date()
+
+    def sleep(self, seconds: float):
+        raise NotImplementedError
+
+
+class RealClock(Clock):
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def timestamp(self) -> float:
+        return _time.time()
+
+    def sleep(self, seconds: float):
+        _time.sleep(seconds)
+
+
+class FixedClock(Clock):
+    """
+    Time only moves when set() / advance() / sleep() is called.
+    """
+
+    def __init__(self, start: datetime):
+        self._now = _naive_utc(start)
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        return self._now
+
+    def set(self, moment):
+        """moment: datetime or epoch seconds."""
+        with self._lock:
+            self._now = _naive_utc(moment)
+
+    def advance(self, seconds: float = 0, **delta):
+        with self._lock:
+            self._now += timedelta(seconds=seconds, **delta)
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+
+
+class FastForwardClock(Clock):
+    """
+    Simulated time runs `speed` times faster than wall time from `start`.
+    sleep() waits the correspondingly shorter real duration.
+    """
+
+    def __init__(self, start: datetime, speed: float = 60.0):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self._start = _naive_utc(start)
+        self._real_start = _time.monotonic()
+
+    def now(self) -> datetime:
+        elapsed = (_time.monotonic() - self._real_start) * self.speed
+        return self._start + timedelta(seconds=elapsed)
+
+    def sleep(self, seconds: float):
+        _time.sleep(max(0.0, seconds) / self.speed)
+
+
+def _naive_utc(moment) -> datetime:
+    if isinstance(moment, (int, float)):
+        return datetime.fromtimestamp(moment, tz=timezone.utc).replace(tzinfo=None)
+    if moment.tzinfo is not None:
+        return moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+# =========================
+# PROCESS-WIDE CLOCK
+# =========================
+_clock: Clock = RealClock()
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Installs `clock` and returns the previous one."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+@contextmanager
+def use_clock(clock: Clock):
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
+
+
+def utcnow() -> datetime:
+    return _clock.now()
+
+
+def today() -> date:
+    return _clock.today()
+
+
+def timestamp() -> float:
+    return _clock.timestamp()
+
+
+def sleep(seconds: float):
+    _clock.sleep(seconds)
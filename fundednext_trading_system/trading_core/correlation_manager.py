@@ -1,12 +1,13 @@
 import pandas as pd
 import threading
 from fundednext_trading_system.execution.dukascopy_data_feed import DukascopyDataFeed
+from fundednext_trading_system.execution.candle_store import CandleStore
 from fundednext_trading_system.config.settings import ALLOWED_SYMBOLS, TIMEFRAME_BARS
 from fundednext_trading_system.monitoring.logger import logger
 
 class CorrelationManager:
     def __init__(self, days_back=30):
-        self.data_feed = DukascopyDataFeed()
+        self.data_feed = DukascopyDataFeed(store=CandleStore())
         self.correlation_matrix = None
         self.matrix_ready = False
 
@@ -25,8 +26,11 @@ class CorrelationManager:
         candles_per_day = (24 * 3600) / TIMEFRAME_BARS
         count = int(candles_per_day * days_back)
 
+        # All symbols download in parallel date chunks
+        candles = self.data_feed.get_candles_bulk(ALLOWED_SYMBOLS, TIMEFRAME_BARS, count=count)
+
         for symbol in ALLOWED_SYMBOLS:
-            df = self.data_feed.get_candles(symbol, TIMEFRAME_BARS, count=count)
+            df = candles.get(symbol)
             if df is not None and not df.empty:
                 # Assuming the 'time' column contains Unix timestamps
                 df['time'] = pd.to_datetime(df['time'], unit='s')
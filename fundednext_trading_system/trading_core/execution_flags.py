@@ -7,6 +7,7 @@ class AccountPhase(Enum):
 
 class ExecutionMode(Enum):
     SHADOW = "shadow"
+    PAPER = "paper"
     LIVE = "live"
 
 class MLMode(Enum):
@@ -27,6 +28,9 @@ class ExecutionFlags:
         if self.execution_mode == ExecutionMode.LIVE and self.account_phase == AccountPhase.FUNDED:
             logger.debug(f"Execution allowed: LIVE mode with FUNDED account.")
             return True
+        elif self.execution_mode == ExecutionMode.PAPER:
+            logger.debug("Execution allowed: PAPER mode (simulated fills).")
+            return True
         elif self.execution_mode == ExecutionMode.SHADOW:
             logger.debug(f"Execution denied: SHADOW mode.")
             return False
@@ -44,6 +48,12 @@ class ExecutionFlags:
         logger.debug("Live trading not allowed.")
         return False
 
+    def allow_shadow_trading(self):
+        """
+        Checks if orders should be simulated instead of sent to MT5 (PAPER mode).
+        """
+        return self.execution_mode == ExecutionMode.PAPER
+
     def disable_execution(self, reason: str):
         """
         Disable execution entirely, typically triggered in case of errors or risk limits.
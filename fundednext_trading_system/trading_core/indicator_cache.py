@@ -0,0 +1,213 @@
+"""
+indicator_cache.py
+
+Shared per-bar indicator cache.
+
+Every indicator is stored under (symbol, bar timestamp, indicator, params)
+so the managers, the signal engine and regime detection compute ATR,
+moving averages and rolling std once per bar instead of once per caller.
+Only the newest bar is kept per symbol; a new bar evicts the old entries.
+
+The *_value helpers return only the latest value and accept either a
+DataFrame or a Candles container; the live path uses them so no full
+indicator series is built per cycle.
+"""
+
+import threading
+import numpy as np
+import pandas as pd
+
+from fundednext_trading_system.execution.candles import Candles
+
+from fundednext_trading_system.monitoring.logger import logger
+
+
+# =========================
+# INDICATOR FUNCTIONS
+# =========================
+def true_range(df: pd.DataFrame) -> pd.Series:
+    high_low = df["high"] - df["low"]
+    high_close = (df["high"] - df["close"].shift()).abs()
+    low_close = (df["low"] - df["close"].shift()).abs()
+    return pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+
+
+def atr_series(df: pd.DataFrame, period: int) -> pd.Series:
+    return true_range(df).rolling(period).mean()
+
+
+def sma_series(df: pd.DataFrame, period: int, column: str = "close") -> pd.Series:
+    return df[column].rolling(period).mean()
+
+
+def rolling_std_series(df: pd.DataFrame, period: int, column: str = "close") -> pd.Series:
+    return df[column].rolling(period).std()
+
+
+def _values(data, column: str) -> np.ndarray:
+    """
+    Column as a float NumPy array; zero-copy for Candles and float frames.
+    """
+    return np.asarray(data[column], dtype=np.float64)
+
+
+def window_mean(values: np.ndarray, period: int, offset: int = 0) -> float:
+    """
+    Mean of the `period` values ending `offset` bars before the last one
+    (the latest value of a rolling mean when offset is 0).
+    """
+    end = len(values) - offset
+    if period <= 0 or end < period:
+        return np.nan
+    return float(values[end - period:end].mean())
+
+
+def window_std(values: np.ndarray, period: int) -> float:
+    if len(values) < period or period < 2:
+        return np.nan
+    return float(values[-period:].std(ddof=1))
+
+
+def latest_atr(data, period: int) -> float:
+    """
+    Latest value of atr_series() computed over the last `period` bars only.
+    """
+    n = len(data)
+    if n < period:
+        return np.nan
+
+    start = max(0, n - period - 1)
+    high = _values(data, "high")[start:]
+    low = _values(data, "low")[start:]
+    close = _values(data, "close")[start:]
+
+    tr = high - low
+    prev_close = close[:-1]
+    tr[1:] = np.maximum(tr[1:], np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)))
+    return float(tr[-period:].mean())
+
+
+def _bar_key(df):
+    """
+    Identifies the newest bar of a frame: its timestamp plus a fingerprint
+    of its high, low and close, so a forming bar that was re-fetched (any
+    of those moved) is not served stale.
+    """
+    if isinstance(df, Candles):
+        bar_time = int(df["time"][-1])
+    elif "time" in df.columns:
+        bar_time = df["time"].iloc[-1]
+    else:
+        bar_time = df.index[-1]
+    return (
+        bar_time,
+        len(df),
+        float(_values(df, "high")[-1]),
+        float(_values(df, "low")[-1]),
+        float(_values(df, "close")[-1]),
+    )
+
+
+# =========================
+# CACHE
+# =========================
+class IndicatorCache:
+    def __init__(self):
+        self._bars = {}  # symbol -> (bar_key, {(indicator, params): value})
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, symbol, df: pd.DataFrame, indicator: str, params: tuple, compute):
+        """
+        Returns the cached value for the symbol's current bar, computing it
+        with compute() on a miss. Without a symbol nothing is cached.
+        """
+        if symbol is None or df is None or len(df) == 0:
+            return compute()
+
+        bar_key = _bar_key(df)
+        entry = self._bars.get(symbol)
+        if entry is None or entry[0] != bar_key:
+            entry = (bar_key, {})
+            self._bars[symbol] = entry
+
+        values = entry[1]
+        key = (indicator, params)
+        if key in values:
+            self._count(hit=True)
+            return values[key]
+
+        value = compute()
+        values[key] = value
+        self._count(hit=False)
+        return value
+
+    # =========================
+    # INDICATORS
+    # =========================
+    def atr(self, df: pd.DataFrame, period: int, symbol: str = None) -> pd.Series:
+        return self.get_or_compute(symbol, df, "atr", (period,), lambda: atr_series(df, period))
+
+    def atr_value(self, df, period: int, symbol: str = None) -> float:
+        atr = self.get_or_compute(symbol, df, "atr_last", (period,), lambda: latest_atr(df, period))
+        return atr if pd.notna(atr) else 0
+
+    def sma(self, df: pd.DataFrame, period: int, symbol: str = None, column: str = "close") -> pd.Series:
+        return self.get_or_compute(
+            symbol, df, "sma", (column, period), lambda: sma_series(df, period, column)
+        )
+
+    def rolling_std(self, df: pd.DataFrame, period: int, symbol: str = None, column: str = "close") -> pd.Series:
+        return self.get_or_compute(
+            symbol, df, "rolling_std", (column, period), lambda: rolling_std_series(df, period, column)
+        )
+
+    def std(self, df, symbol: str = None, column: str = "close") -> float:
+        """
+        Standard deviation over the whole frame.
+        """
+        return self.get_or_compute(
+            symbol, df, "std", (column,), lambda: float(np.nanstd(_values(df, column), ddof=1))
+        )
+
+    def sma_value(self, df, period: int, symbol: str = None, column: str = "close", offset: int = 0) -> float:
+        """
+        Latest SMA value (or the one `offset` bars back).
+        """
+        return self.get_or_compute(
+            symbol, df, "sma_last", (column, period, offset),
+            lambda: window_mean(_values(df, column), period, offset),
+        )
+
+    def rolling_std_value(self, df, period: int, symbol: str = None, column: str = "close") -> float:
+        return self.get_or_compute(
+            symbol, df, "rolling_std_last", (column, period),
+            lambda: window_std(_values(df, column), period),
+        )
+
+    # =========================
+    # MONITORING
+    # =========================
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def clear(self):
+        self._bars = {}
+        logger.debug("Indicator cache cleared")
+
+    def _count(self, hit: bool):
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+# Process-wide instance shared by all modules
+indicator_cache = IndicatorCache()
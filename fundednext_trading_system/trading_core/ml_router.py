@@ -6,37 +6,103 @@ Supports:
 - GradientBoostingClassifier fallback
 - Regime-aware features
 - Safe model updates
+- Per-symbol model slots (lock-free reads from symbol workers)
+- Latest-row and batched inference with latency tracking
 """
 
+import threading
+import time
+from collections import defaultdict, deque
 import pandas as pd
 import numpy as np
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.exceptions import NotFittedError
 from fundednext_trading_system.monitoring.logger import logger
 
+LATENCY_WINDOW = 500  # inference latency samples kept per symbol
+
+
+def build_training_set(features: pd.DataFrame, df: pd.DataFrame):
+    """
+    Labels each bar 1 if the next close is higher, else 0.
+    The last bar has no next close and is excluded.
+    """
+    target = np.where(df['close'].shift(-1) > df['close'], 1, 0)
+    return features[:-1].values, target[:-1]
+
+
+def fit_direction_model(X, y, random_state=None) -> GradientBoostingClassifier:
+    """
+    Fits a fresh direction classifier. Module-level so it can run in a
+    worker process. Pass random_state for reproducible fits.
+    """
+    model = GradientBoostingClassifier(random_state=random_state)
+    model.fit(X, y)
+    return model
+
 class MLRouter:
     def __init__(self, execution_flags):
-        self.model = None  # Model will be loaded
+        self.model = None  # Unkeyed model (offline training / single-symbol use)
         self.execution_flags = execution_flags
         self.is_trained = False
 
-    def infer(self, features: pd.DataFrame) -> tuple | None:
+        # symbol -> model. Never mutated in place: writers publish a new
+        # dict, so readers need no lock and always see a consistent table.
+        self._models = {}
+        self._last_signals = {}
+        self._write_lock = threading.Lock()
+        self._latency_ms = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+
+    # =========================
+    # PER-SYMBOL MODEL TABLE
+    # =========================
+    def set_model(self, symbol: str, model):
+        """
+        Publishes the model for a symbol (copy-on-write swap).
+        """
+        if self._models.get(symbol) is model:
+            return
+
+        with self._write_lock:
+            models = dict(self._models)
+            models[symbol] = model
+            self._models = models
+
+    def get_model(self, symbol: str = None):
+        if symbol is None:
+            return self.model
+        return self._models.get(symbol)
+
+    def last_signal(self, symbol: str) -> tuple | None:
+        """
+        Last ML signal produced for a symbol (heartbeat monitoring).
+        """
+        return self._last_signals.get(symbol)
+
+    # =========================
+    # INFERENCE
+    # =========================
+    def infer(self, features: pd.DataFrame, symbol: str = None) -> tuple | None:
         """
-        Returns (side, confidence) or None
+        Returns (side, confidence) or None.
+        Only the latest feature row is scored; pass the single row from
+        SignalEngine.prepare_latest_features to avoid building the rest.
+        Uses the symbol's model slot when a symbol is given.
         """
         try:
-            if self.model is None:
+            model = self.get_model(symbol)
+            if model is None:
                 raise NotFittedError("ML model not loaded yet")
 
-            X = features.values
-            pred_proba = self.model.predict_proba(X)[-1]  # last row
-            if pred_proba.shape[0] < 2:
-                # fallback if only one class
-                return None
+            started = time.perf_counter()
+            X = features.values[-1:]  # last row only
+            pred_proba = model.predict_proba(X)[0]
+            self._latency_ms[symbol].append((time.perf_counter() - started) * 1000)
 
-            side = "buy" if pred_proba[1] > pred_proba[0] else "sell"
-            confidence = float(np.max(pred_proba))
-            return (side, confidence)
+            signal = self._to_signal(pred_proba)
+            if signal is not None and symbol is not None:
+                self._last_signals[symbol] = signal
+            return signal
 
         except NotFittedError:
             logger.error("❌ ML inference failed: model not fitted")
@@ -45,17 +111,82 @@ class MLRouter:
             logger.error(f"❌ ML inference failed: {e}")
             return None
 
-    def update_model(self, features: pd.DataFrame, df: pd.DataFrame):
+    def infer_batch(self, latest_rows: dict) -> dict:
+        """
+        Scores the latest feature row of every symbol in one call.
+        Symbols sharing a model are stacked into a single predict_proba.
+
+        latest_rows: {symbol: features DataFrame (last row is used)}
+        Returns:
+            {symbol: (side, confidence) or None}
+        """
+        results = {symbol: None for symbol in latest_rows}
+        groups = {}
+        for symbol, features in latest_rows.items():
+            model = self.get_model(symbol)
+            if model is None:
+                logger.warning(f"{symbol}: batch inference skipped — model not loaded")
+                continue
+            groups.setdefault(id(model), (model, []))[1].append((symbol, features.values[-1]))
+
+        for model, rows in groups.values():
+            symbols = [symbol for symbol, _ in rows]
+            try:
+                started = time.perf_counter()
+                probas = model.predict_proba(np.vstack([row for _, row in rows]))
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            except Exception as e:
+                logger.error(f"❌ Batch ML inference failed for {symbols}: {e}")
+                continue
+
+            for symbol, pred_proba in zip(symbols, probas):
+                self._latency_ms[symbol].append(elapsed_ms / len(symbols))
+                signal = self._to_signal(pred_proba)
+                results[symbol] = signal
+                if signal is not None:
+                    self._last_signals[symbol] = signal
+
+        return results
+
+    @staticmethod
+    def _to_signal(pred_proba) -> tuple | None:
+        if pred_proba.shape[0] < 2:
+            # fallback if only one class
+            return None
+
+        side = "buy" if pred_proba[1] > pred_proba[0] else "sell"
+        confidence = float(np.max(pred_proba))
+        return (side, confidence)
+
+    def latency_stats(self) -> dict:
+        """
+        Inference latency per symbol (ms) over the last LATENCY_WINDOW calls.
+        """
+        stats = {}
+        for symbol, samples in list(self._latency_ms.items()):
+            if not samples:
+                continue
+            values = np.fromiter(samples, dtype=float)
+            stats[symbol] = {
+                "calls": len(values),
+                "p50_ms": round(float(np.percentile(values, 50)), 3),
+                "p95_ms": round(float(np.percentile(values, 95)), 3),
+                "max_ms": round(float(values.max()), 3),
+            }
+        return stats
+
+    # =========================
+    # TRAINING
+    # =========================
+    def update_model(self, features: pd.DataFrame, df: pd.DataFrame, symbol: str = None):
         """
         Safe model update. Avoid training if insufficient classes.
         Generates binary target: 1 if next close > current close, else 0.
+        The fitted model is published to the symbol's slot when a symbol
+        is given, otherwise to self.model.
         """
         try:
-            self.model = GradientBoostingClassifier()  # Initialize a new model
-            df = df.copy()
-            df['target'] = np.where(df['close'].shift(-1) > df['close'], 1, 0)
-            y = df['target'][:-1]  # exclude last row
-            X = features[:-1].values
+            X, y = build_training_set(features, df)
 
             # Ensure at least 2 classes
             unique_classes = np.unique(y)
@@ -63,7 +194,11 @@ class MLRouter:
                 logger.warning("ML model update skipped: not enough classes to train")
                 return
 
-            self.model.fit(X, y)
+            model = fit_direction_model(X, y)
+            if symbol is None:
+                self.model = model
+            else:
+                self.set_model(symbol, model)
             self.is_trained = True
             logger.info("✅ ML model updated successfully")
 
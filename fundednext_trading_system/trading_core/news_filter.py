@@ -5,6 +5,7 @@ from fundednext_trading_system.config.news_config import (
     NEWS_PAUSE_AFTER,
     HIGH_IMPACT_THRESHOLD
 )
+from fundednext_trading_system.trading_core import clock
 
 # Stub: replace with cached calendar feed later
 _HIGH_IMPACT_EVENTS = []
@@ -15,7 +16,7 @@ def update_news_cache(events):
 
 
 def is_news_pause_active() -> bool:
-    now = datetime.utcnow()
+    now = clock.utcnow()
 
     for event in _HIGH_IMPACT_EVENTS:
         impact = event.get("impact", 0)
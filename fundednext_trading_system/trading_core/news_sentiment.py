@@ -1,9 +1,143 @@
+import threading
+import time
 import yfinance as yf
 from textblob import TextBlob
 from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.config.news_config import (
+    NEWS_SENTIMENT_TTL_SECONDS,
+    NEWS_SENTIMENT_REFRESH_SECONDS,
+)
 
 class NewsSentiment:
+    """
+    News sentiment with a per-symbol TTL cache.
+
+    Once start_background_refresh() is running, get_sentiment() only reads
+    the cache: a stale score is served while it is refreshed off the hot
+    path, and an unknown symbol reads as neutral (0.0) until its first
+    fetch lands. Without the background task, a cold symbol is fetched
+    synchronously once.
+    """
+
+    def __init__(self, ttl_seconds: float = NEWS_SENTIMENT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._cache = {}  # symbol -> (score, fetched_at)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresh_thread = None
+        self.hits = 0
+        self.misses = 0
+
+    # =========================
+    # HOT PATH
+    # =========================
     def get_sentiment(self, symbol):
+        """
+        Returns the aggregate sentiment score for a symbol.
+        """
+        entry = self._cache.get(symbol)
+        if entry is not None:
+            score, fetched_at = entry
+            self._count(hit=True)
+            if time.time() - fetched_at > self.ttl_seconds:
+                self._refresh_async(symbol)
+            return score
+
+        self._count(hit=False)
+        if self.background_refresh_active():
+            self._refresh_async(symbol)
+            return 0.0
+
+        return self.refresh(symbol)
+
+    # =========================
+    # REFRESH
+    # =========================
+    def refresh(self, symbol):
+        """
+        Fetches and caches the sentiment for a symbol (blocking).
+        """
+        score = self._fetch_sentiment(symbol)
+        self._cache[symbol] = (score, time.time())
+        return score
+
+    def _refresh_async(self, symbol):
+        with self._lock:
+            if symbol in self._refreshing:
+                return
+            self._refreshing.add(symbol)
+
+        def run():
+            try:
+                self.refresh(symbol)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(symbol)
+
+        threading.Thread(target=run, name=f"sentiment-{symbol}", daemon=True).start()
+
+    def start_background_refresh(self, symbols, interval_seconds: float = NEWS_SENTIMENT_REFRESH_SECONDS):
+        """
+        Keeps the cache warm for the given symbols from a daemon thread.
+        """
+        if self.background_refresh_active():
+            return
+
+        symbols = list(symbols)
+        self._stop.clear()
+
+        def run():
+            while not self._stop.is_set():
+                for symbol in symbols:
+                    if self._stop.is_set():
+                        return
+                    self.refresh(symbol)
+                self._stop.wait(interval_seconds)
+
+        self._refresh_thread = threading.Thread(target=run, name="sentiment-refresh", daemon=True)
+        self._refresh_thread.start()
+        logger.info(f"News sentiment background refresh started | every {interval_seconds}s")
+
+    def stop_background_refresh(self):
+        self._stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+            self._refresh_thread = None
+
+    def background_refresh_active(self) -> bool:
+        return self._refresh_thread is not None and self._refresh_thread.is_alive()
+
+    # =========================
+    # MONITORING
+    # =========================
+    def cache_stats(self) -> dict:
+        """
+        Hit rate and per-symbol staleness (seconds since last fetch).
+        """
+        now = time.time()
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "staleness_seconds": {
+                symbol: round(now - fetched_at, 1)
+                for symbol, (_, fetched_at) in list(self._cache.items())
+            },
+        }
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    # =========================
+    # FETCH
+    # =========================
+    def _fetch_sentiment(self, symbol):
         """
         Fetches news for a given symbol and returns an aggregate sentiment score.
         """
@@ -1,7 +1,7 @@
-import datetime
 from loguru import logger
 from fundednext_trading_system.config.symbols_config import SYMBOLS_CONFIG
 from fundednext_trading_system.trading_core.session_filter import is_friday_close_window
+from fundednext_trading_system.trading_core import clock
 
 
 class PositionManager:
@@ -59,7 +59,7 @@ class PositionManager:
         # 4️⃣ Max Duration Kill
         open_time = trade.get("open_time")
         if open_time:
-            age = (datetime.datetime.utcnow() - open_time).total_seconds() / 60
+            age = (clock.utcnow() - open_time).total_seconds() / 60
             if age > self.max_trade_minutes:
                 logger.warning(f"Trade expired → closing {symbol}")
                 executor.close_trade(trade)
@@ -1,5 +1,5 @@
-from datetime import date
 from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core import clock
 from fundednext_trading_system.config.settings import CURRENT_RULES, CORRELATION_THRESHOLD
 from fundednext_trading_system.trading_core.capital_scaler import CapitalScaler
 from fundednext_trading_system.trading_core.correlation_manager import CorrelationManager
@@ -13,14 +13,15 @@ class RiskManager:
     Fully compatible with FundedNext rules.
     """
 
-    def __init__(self):
-        self.correlation_manager = CorrelationManager()
+    def __init__(self, correlation_manager=None):
+        # Backtests inject a precomputed matrix instead of the live downloader
+        self.correlation_manager = correlation_manager if correlation_manager is not None else CorrelationManager()
         self.start_balance = CURRENT_RULES["ACCOUNT_BALANCE"]
         self.current_equity = self.start_balance
 
         self.daily_loss = 0.0
         self.total_loss = 0.0
-        self.last_day = date.today()
+        self.last_day = clock.today()
 
         self.scaler = CapitalScaler(self.start_balance)
 
@@ -53,7 +54,7 @@ class RiskManager:
     # DAILY RESET
     # =========================
     def _reset_daily_if_new_day(self):
-        today = date.today()
+        today = clock.today()
         if today != self.last_day:
             logger.info(
                 f"New trading day — resetting daily loss "
@@ -95,6 +96,13 @@ class RiskManager:
 
         return True
 
+    def validate_trade_risk(self, risk_amount: float) -> bool:
+        """
+        Per-trade risk check used by TradeGatekeeper.
+        """
+        self._reset_daily_if_new_day()
+        return self._validate_trade_risk(risk_amount)
+
     def _validate_trade_risk(self, risk_amount: float) -> bool:
         if risk_amount <= 0:
             logger.warning("Trade blocked — zero or negative risk")
@@ -1,5 +1,5 @@
-from datetime import datetime
 from fundednext_trading_system.monitoring.logger import logger
+from fundednext_trading_system.trading_core import clock
 from fundednext_trading_system.trading_core.risk_manager import RiskManager
 from fundednext_trading_system.trading_core.execution_flags import ExecutionFlags, AccountPhase, ExecutionMode, MLMode
 
@@ -14,13 +14,13 @@ class SessionController:
         self.execution_flags = execution_flags
         self.risk_manager = risk_manager
         self.auto_promote = auto_promote
-        self.last_reset_date = datetime.utcnow().date()
+        self.last_reset_date = clock.today()
 
     # =========================
     # DAILY RESET
     # =========================
     def reset_daily_session(self):
-        today = datetime.utcnow().date()
+        today = clock.today()
         if today != self.last_reset_date:
             logger.info(f"🔄 Daily session reset | {today}")
             self.risk_manager._reset_daily_if_new_day()
@@ -70,7 +70,7 @@ class SessionController:
     # =========================
     def log_snapshot(self):
         snapshot = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": clock.utcnow().isoformat(),
             "account_phase": self.execution_flags.account_phase.value,
             "execution_mode": self.execution_flags.execution_mode.value,
             "ml_mode": self.execution_flags.ml_mode.value,
@@ -1,8 +1,8 @@
-from datetime import datetime
 from fundednext_trading_system.config.sessions import LONDON_SESSION, NEW_YORK_SESSION, FRIDAY_CLOSE_HOUR
+from fundednext_trading_system.trading_core import clock
 
 def _utc_now():
-    return datetime.utcnow()
+    return clock.utcnow()
 
 def is_weekend() -> bool:
     return _utc_now().weekday() >= 5
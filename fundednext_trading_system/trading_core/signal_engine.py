@@ -9,16 +9,21 @@ import pandas as pd
 import numpy as np
 from fundednext_trading_system.monitoring.logger import logger
 from fundednext_trading_system.trading_core.news_sentiment import NewsSentiment
+from fundednext_trading_system.trading_core.indicator_cache import indicator_cache
+from fundednext_trading_system.execution.candles import Candles
+from fundednext_trading_system.ml.streaming_indicators import StreamingSignalFeatures
 
 class SignalEngine:
     def __init__(self, confidence_threshold: float = 0.7):
         self.confidence_threshold = confidence_threshold
         self.news_sentiment = NewsSentiment()
+        self._streams = {}  # symbol -> StreamingSignalFeatures (live feature state)
 
-    def prepare_features(self, df: pd.DataFrame, regime: str = "range") -> pd.DataFrame:
+    def prepare_features(self, df: pd.DataFrame, regime: str = "range", symbol: str = None) -> pd.DataFrame:
         """
         Extract features for ML inference.
         Includes regime info and basic price/momentum features.
+        Indicators are shared through the per-bar cache when a symbol is given.
         """
         features = pd.DataFrame()
         features['close'] = df['close']
@@ -27,9 +32,9 @@ class SignalEngine:
         features['open'] = df['open']
 
         # Moving averages
-        features['ma5'] = df['close'].rolling(5).mean()
-        features['ma20'] = df['close'].rolling(20).mean()
-        features['ma50'] = df['close'].rolling(50).mean()
+        features['ma5'] = indicator_cache.sma(df, 5, symbol)
+        features['ma20'] = indicator_cache.sma(df, 20, symbol)
+        features['ma50'] = indicator_cache.sma(df, 50, symbol)
 
         # Momentum indicators
         features['momentum5'] = df['close'] - df['close'].shift(5)
@@ -39,22 +44,88 @@ class SignalEngine:
         features['regime'] = 1 if regime == "trend" else 0
 
         # Volatility
-        features['volatility'] = df['close'].rolling(20).std()
+        features['volatility'] = indicator_cache.rolling_std(df, 20, symbol)
 
         features = features.fillna(0)
         return features
 
-    def generate_signal(self, df: pd.DataFrame, symbol: str, regime: str = "range") -> tuple | None:
+    def prepare_latest_features(self, df, regime: str = "range", symbol: str = None) -> pd.DataFrame:
         """
-        Rule-based fallback signal.
+        Single-row equivalent of prepare_features(df).iloc[[-1]] for live
+        inference. Accepts a DataFrame or a Candles container.
+
+        With a symbol and a time column the row comes from the symbol's
+        streaming indicators: bars that closed since the last call are
+        committed (O(1) each) and the newest, forming bar is peeked.
+        Otherwise only the latest indicator values of the window are computed.
+        """
+        n = len(df)
+        if symbol is not None and 'time' in df.columns:
+            row = self._streaming_row(df, regime, symbol)
+        else:
+            row = self._window_row(df, regime, symbol)
+
+        index = [n - 1] if isinstance(df, Candles) else df.index[-1:]
+        features = pd.DataFrame([row], index=index)
+        features = features.fillna(0)
+        return features
+
+    def _window_row(self, df, regime: str, symbol: str = None) -> dict:
+        close = np.asarray(df['close'])
+        n = len(df)
+
+        return {
+            'close': close[-1],
+            'high': np.asarray(df['high'])[-1],
+            'low': np.asarray(df['low'])[-1],
+            'open': np.asarray(df['open'])[-1],
+            'ma5': indicator_cache.sma_value(df, 5, symbol),
+            'ma20': indicator_cache.sma_value(df, 20, symbol),
+            'ma50': indicator_cache.sma_value(df, 50, symbol),
+            'momentum5': close[-1] - close[-6] if n > 5 else np.nan,
+            'momentum20': close[-1] - close[-21] if n > 20 else np.nan,
+            'regime': 1 if regime == "trend" else 0,
+            'volatility': indicator_cache.rolling_std_value(df, 20, symbol),
+        }
+
+    def _streaming_row(self, df, regime: str, symbol: str) -> dict:
+        """
+        Advances the symbol's stream to the bar before the newest one and
+        peeks the newest. The stream is rebuilt from the window when its
+        last committed bar is no longer in it (first call, gap, reset).
+        """
+        columns = {name: np.asarray(df[name]) for name in ('time', 'open', 'high', 'low', 'close')}
+        times = columns['time']
+        closed = len(times) - 1
+
+        stream = self._streams.get(symbol)
+        start = 0
+        if stream is not None and stream.last_time is not None:
+            pos = int(np.searchsorted(times[:closed], stream.last_time))
+            if pos < closed and times[pos] == stream.last_time:
+                start = pos + 1
+            else:
+                stream = None
+        if stream is None or stream.last_time is None:
+            stream = StreamingSignalFeatures()
+            self._streams[symbol] = stream
+            start = 0
+
+        for i in range(start, closed):
+            stream.update({name: values[i] for name, values in columns.items()})
+        return stream.peek({name: values[-1] for name, values in columns.items()}, regime)
+
+    def generate_signal(self, df, symbol: str, regime: str = "range") -> tuple | None:
+        """
+        Rule-based fallback signal (DataFrame or Candles).
         Returns (side, confidence)
         """
         try:
             sentiment_score = self.news_sentiment.get_sentiment(symbol)
-            last_close = df['close'].iloc[-1]
-            ma5 = df['close'].rolling(5).mean().iloc[-1]
-            ma20 = df['close'].rolling(20).mean().iloc[-1]
-            ma50 = df['close'].rolling(50).mean().iloc[-1]
+            last_close = np.asarray(df['close'])[-1]
+            ma5 = indicator_cache.sma_value(df, 5, symbol)
+            ma20 = indicator_cache.sma_value(df, 20, symbol)
+            ma50 = indicator_cache.sma_value(df, 50, symbol)
 
             # Trend regime logic
             if regime == "trend":
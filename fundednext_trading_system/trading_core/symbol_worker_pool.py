@@ -0,0 +1,140 @@
+"""
+symbol_worker_pool.py
+
+Long-lived per-symbol worker threads for the master orchestrator.
+
+Each symbol owns one thread and one work queue for the lifetime of the
+process. The orchestrator submits one job per symbol and waits on a
+cycle barrier, so no threads are created or throttled inside the loop.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from fundednext_trading_system.monitoring.logger import logger
+
+_STOP = object()
+
+
+class SymbolWorkerPool:
+    """
+    One persistent worker thread + work queue per symbol.
+
+    Usage:
+        pool = SymbolWorkerPool(ALLOWED_SYMBOLS)
+        pool.start()
+        pool.run_cycle(symbol_worker, feed, signal_engine, ...)
+        pool.shutdown()
+    """
+
+    def __init__(self, symbols: Iterable[str], cycle_timeout: Optional[float] = None):
+        self.symbols = list(symbols)
+        self.cycle_timeout = cycle_timeout
+        self._queues: Dict[str, queue.Queue] = {s: queue.Queue() for s in self.symbols}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._cycle_times: Dict[str, float] = {}
+        self._running = False
+
+    # =========================
+    # LIFECYCLE
+    # =========================
+    def start(self):
+        if self._running:
+            return
+
+        for symbol in self.symbols:
+            thread = threading.Thread(
+                target=self._run,
+                args=(symbol,),
+                name=f"worker-{symbol}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads[symbol] = thread
+
+        self._running = True
+        logger.info(f"SymbolWorkerPool started | workers={len(self._threads)}")
+
+    def shutdown(self, timeout: float = 5.0):
+        if not self._running:
+            return
+
+        for q in self._queues.values():
+            q.put(_STOP)
+
+        for thread in self._threads.values():
+            thread.join(timeout=timeout)
+
+        self._threads.clear()
+        self._running = False
+        logger.info("SymbolWorkerPool stopped")
+
+    # =========================
+    # DISPATCH
+    # =========================
+    def run_cycle(self, target: Callable, *args, symbols: Optional[Iterable[str]] = None, **kwargs) -> Dict[str, float]:
+        """
+        Runs target(symbol, *args, **kwargs) once for every symbol
+        (or the given subset) and blocks until all of them finish.
+
+        Returns:
+            {symbol: cycle_seconds} for the symbols that finished this
+            cycle. Symbols still running when cycle_timeout expires are
+            left out rather than reported with a previous cycle's time.
+        """
+        if not self._running:
+            raise RuntimeError("SymbolWorkerPool not started")
+
+        batch = [s for s in (symbols if symbols is not None else self.symbols) if s in self._queues]
+        if not batch:
+            return {}
+
+        barrier = threading.Barrier(len(batch) + 1)
+        results: Dict[str, float] = {}
+        for symbol in batch:
+            self._queues[symbol].put((target, args, kwargs, barrier, results))
+
+        try:
+            barrier.wait(timeout=self.cycle_timeout)
+        except threading.BrokenBarrierError:
+            logger.warning("SymbolWorkerPool cycle timed out — slow workers will finish in background")
+
+        return dict(results)
+
+    # =========================
+    # WORKER LOOP
+    # =========================
+    def _run(self, symbol: str):
+        q = self._queues[symbol]
+
+        while True:
+            job = q.get()
+            if job is _STOP:
+                return
+
+            target, args, kwargs, barrier, results = job
+            started = time.perf_counter()
+
+            try:
+                target(symbol, *args, **kwargs)
+            except Exception as e:
+                logger.exception(f"{symbol}: worker failed | {e}")
+            finally:
+                elapsed = time.perf_counter() - started
+                self._cycle_times[symbol] = elapsed
+                results[symbol] = elapsed
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+
+    # =========================
+    # MONITORING
+    # =========================
+    def cycle_times(self) -> Dict[str, float]:
+        """
+        Last measured cycle time (seconds) per symbol.
+        """
+        return dict(self._cycle_times)
@@ -47,7 +47,10 @@ class TradeGatekeeper:
         # -------------------------
         # LIVE VS SHADOW CHECK
         # -------------------------
-        if is_new_trade and not self.execution_flags.allow_live_trading():
+        if is_new_trade and not (
+            self.execution_flags.allow_live_trading()
+            or self.execution_flags.allow_shadow_trading()
+        ):
             reason = "Live execution not permitted (shadow or disabled mode)"
             logger.info(f"{symbol}: {reason}")
             return False, reason